@@ -1,9 +1,8 @@
 import streamlit as st
 import base64
-import os
-from PIL import Image
-from io import BytesIO
+from utils import gallery
 from utils.common_css import add_logo
+from utils.perf import begin_run, end_run, payload, stage
 
 # -------------- PAGE CONFIG -------------------
 st.set_page_config(
@@ -11,9 +10,11 @@ st.set_page_config(
     page_icon="🌏",
     layout="wide"
 )
+begin_run("Home")
 add_logo("data/BGs/logo_app.png")
 
 # Helper to encode local image (optimized version)
+@stage("background")
 @st.cache_data(show_spinner=False)
 def local_image_to_base64(path):
     with open(path, "rb") as f:
@@ -23,7 +24,7 @@ def local_image_to_base64(path):
 bg_path = "data/BGs/bg.png"
 bg_base64 = local_image_to_base64(bg_path)
 
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     .stApp {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -41,35 +42,21 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # -------------- LOAD IMAGES (Optimized) -------------------
 
+@stage("load images")
 @st.cache_data(show_spinner=False)
 def load_and_optimize_images(folder, target_size=(320, 200)):
-    images_base64 = []
-    for file in sorted(os.listdir(folder)):
-        if file.lower().endswith(('.jpg', '.jpeg', '.png')):
-            path = os.path.join(folder, file)
-            img = Image.open(path).convert("RGB")
-            img.thumbnail(target_size, Image.LANCZOS)  # Resize to reduce memory
-            buffered = BytesIO()
-            img.save(buffered, format="JPEG", quality=60)  # Compress
-            encoded = base64.b64encode(buffered.getvalue()).decode()
-            images_base64.append(encoded)
-    return images_base64
+    return gallery.load_and_optimize_images(folder, target_size)
 
 image_folder = "./data/indian_tourist_images"
 images_base64 = load_and_optimize_images(image_folder)
 
 # -------------- BUILD MARQUEE HTML -------------------
 
-def build_images_html(images):
-    return "".join([
-        f'<img src="data:image/jpeg;base64,{img}" loading="eager" />' for img in images
-    ])
-
-top_row_html = build_images_html(images_base64)
+top_row_html = gallery.build_images_html(images_base64)
 
 common_css = """
 <style>
@@ -101,13 +88,13 @@ common_css = """
 st.markdown(common_css, unsafe_allow_html=True)
 
 # Single repetition instead of double
-st.markdown(f"""
+st.markdown(payload(f"""
 <div class="marquee-container">
     <div class="marquee" style="animation-name: scrollLeft; animation-duration: 30s;">
         {top_row_html}{top_row_html}
     </div>
 </div>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # -------------- CSS for Advanced Text Styling -------------------
 st.markdown("""
@@ -213,3 +200,5 @@ with col3:
             </ul>
         </div>
     """, unsafe_allow_html=True)
+
+end_run()
@@ -0,0 +1,350 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from benchmarks import synthetic
+from utils import gallery
+from utils.catalog import Catalog
+from utils.forecasting import BatchForecast
+from utils.geo_index import PlaceGeoIndex
+from utils.incremental_search import IncrementalSearch
+from utils.place_search import SearchEngine
+from utils.stats_cube import StatsCube
+
+DEFAULT_SCALES = [1, 10, 100]
+REPEAT = 5
+BUDGET_SECONDS = 10.0       # per case and scale; slow cases stop repeating once past it (always one timed run)
+REGRESSION_RATIO = 1.25     # --compare flags a median this much slower than the baseline
+TYPED_QUERY = "temple"      # typed one letter at a time, like the search box reruns
+NEAR_CITY = "Jaipur, Rajasthan"
+NEAR_KM = 300
+
+
+class Skip(Exception):
+    """Raised by a case's setup when it cannot run here, e.g. an optional dependency is missing."""
+
+
+class Fixtures:
+    """Synthetic data for one scale, built on first use and shared by every case at that scale."""
+
+    def __init__(self, scale, workdir):
+        self.scale = scale
+        self.workdir = workdir
+
+    @cached_property
+    def places(self):
+        return synthetic.catalog_places(self.scale)
+
+    @cached_property
+    def catalog(self):
+        return Catalog(self.places, 0)
+
+    @cached_property
+    def geo(self):
+        return PlaceGeoIndex(self.places)
+
+    @cached_property
+    def engine(self):
+        return SearchEngine(self.catalog, self.geo)
+
+    @cached_property
+    def stats(self):
+        return synthetic.stats_frame(self.scale)
+
+    @cached_property
+    def cube(self):
+        return StatsCube(self.stats)
+
+    @cached_property
+    def forecast(self):
+        return BatchForecast(self.cube)
+
+    @cached_property
+    def images(self):
+        return synthetic.image_library(os.path.join(self.workdir, f"x{self.scale}"), self.scale)
+
+
+# ---------- CASES ----------
+# Each setup takes the Fixtures and returns (callable to time, items it processes).
+CASES = {}
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+@case("catalog.build")
+def _catalog_build(fx):
+    return lambda: Catalog(fx.places, 0), len(fx.places)
+
+
+@case("geo.build")
+def _geo_build(fx):
+    return lambda: PlaceGeoIndex(fx.places), len(fx.places)
+
+
+@case("search.text")
+def _search_text(fx):
+    engine = fx.engine
+    return lambda: engine.search(TYPED_QUERY, "All States"), len(engine.df)
+
+
+@case("search.typing")
+def _search_typing(fx):
+    engine = fx.engine
+
+    def typing():
+        searcher = IncrementalSearch(engine.haystack)
+        for end in range(1, len(TYPED_QUERY) + 1):
+            engine.search(TYPED_QUERY[:end], "All States", searcher)
+    return typing, len(engine.df)
+
+
+@case("search.state")
+def _search_state(fx):
+    engine = fx.engine
+    return lambda: engine.search("", engine.states[0]), len(engine.df)
+
+
+@case("search.dynamic_filter")
+def _dynamic_filter(fx):
+    engine = fx.engine
+    filters = {
+        "Type": engine.facet_options["Type"][:3],
+        "Significance": engine.facet_options["Significance"][:2],
+        "Google_Review_Rating": (4.0, 5.0),
+        "Entrance_Fee_In_Inr": (0.0, 100.0),
+    }
+    return lambda: engine.dynamic_filter(engine.df, filters), len(engine.df)
+
+
+@case("search.near")
+def _search_near(fx):
+    engine = fx.engine
+    return lambda: engine.near(engine.df, NEAR_CITY, NEAR_KM), len(engine.df)
+
+
+@case("images.thumbnails")
+def _thumbnails(fx):
+    folder = fx.images["marquee"]
+    return lambda: gallery.load_and_optimize_images(folder), len(os.listdir(folder))
+
+
+@case("gallery.list_state")
+def _list_state(fx):
+    images = fx.images
+    state = images["states"][0]
+    n = len(gallery.list_images(state, base=images["places"]))
+    return lambda: gallery.list_images(state, base=images["places"]), n
+
+
+@case("gallery.list_place")
+def _list_place(fx):
+    images = fx.images
+    state, place = images["states"][0], images["place"]
+    return lambda: gallery.list_images(state, place, base=images["places"]), synthetic.IMAGES_PER_PLACE
+
+
+@case("gallery.encode")
+def _encode(fx):
+    images = fx.images
+    paths = gallery.list_images(images["states"][0], base=images["places"])
+    return lambda: [gallery.encode_image(p) for p in paths], len(paths)
+
+
+@case("stats.cube")
+def _stats_cube(fx):
+    return lambda: StatsCube(fx.stats), len(fx.stats)
+
+
+@case("forecast.build")
+def _forecast_build(fx):
+    cube = fx.cube
+    return lambda: BatchForecast(cube), len(cube.types) * len(cube.states)
+
+
+@case("forecast.tables")
+def _forecast_tables(fx):
+    forecast = fx.forecast
+    types = forecast.cube.types
+
+    def tables():
+        for visitor_type in types:
+            forecast.table(visitor_type)
+            forecast.score_table(visitor_type)
+    return tables, len(types) * len(forecast.cube.states)
+
+
+@case("dance.predict")
+def _predict(fx):
+    try:
+        import tensorflow as tf
+        from utils import dance_model
+    except ImportError as e:
+        raise Skip(f"{e.name or 'tensorflow'} not installed")
+    images = fx.images
+    forms = images["forms"]
+    folder = os.path.join(images["dance"], forms[0])
+    paths = [os.path.join(folder, f) for f in gallery.list_valid_images(folder)][:fx.scale]
+    # A tiny untrained network: this times image decoding, preprocessing and predict() overhead,
+    # which dominate a single-image prediction, not the trained model's convolutions.
+    model = tf.keras.Sequential([
+        tf.keras.layers.Rescaling(1. / 255, input_shape=(*dance_model.IMG_SIZE, 3)),
+        tf.keras.layers.Conv2D(4, (3, 3), strides=4, activation='relu'),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(len(forms), activation='softmax')
+    ])
+    return lambda: [dance_model.predict_dance(model, forms, p) for p in paths], len(paths)
+
+
+# ---------- HARNESS ----------
+def measure(fn, repeat=REPEAT, budget=BUDGET_SECONDS):
+    """(warm-up ms, timed run ms) for fn; repeats up to repeat times while within budget seconds."""
+    start = time.perf_counter()
+    fn()        # first call pays imports and allocator growth, which a page rerun doesn't
+    warmup_ms = (time.perf_counter() - start) * 1000
+    runs = []
+    start = time.perf_counter()
+    while len(runs) < repeat and (not runs or time.perf_counter() - start < budget):
+        t0 = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - t0) * 1000)
+    return warmup_ms, runs
+
+
+def run_case(name, fx, repeat, budget):
+    result = {"case": name, "scale": fx.scale}
+    try:
+        fn, items = CASES[name](fx)
+    except Skip as e:
+        return {**result, "skipped": str(e)}
+    warmup_ms, runs = measure(fn, repeat, budget)
+    runs = np.array(runs)
+    median = float(np.median(runs))
+    return {
+        **result,
+        "items": int(items),
+        "runs": len(runs),
+        "min_ms": round(float(runs.min()), 3),
+        "median_ms": round(median, 3),
+        "p90_ms": round(float(np.percentile(runs, 90)), 3),
+        "mean_ms": round(float(runs.mean()), 3),
+        "warmup_ms": round(warmup_ms, 3),
+        "us_per_item": round(median * 1000 / items, 3) if items else None,
+    }
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def run(scales, names, repeat=REPEAT, budget=BUDGET_SECONDS, log=print):
+    """Run the named cases at every scale; returns the JSON-ready report."""
+    report = {"environment": environment(), "settings": {"scales": scales, "repeat": repeat, "budget_s": budget},
+              "results": []}
+    with tempfile.TemporaryDirectory(prefix="heritage-bench-") as workdir:
+        for scale in scales:
+            fx = Fixtures(scale, workdir)
+            for name in names:
+                result = run_case(name, fx, repeat, budget)
+                report["results"].append(result)
+                if "skipped" in result:
+                    log(f"{name:<24} x{scale:<5} skipped: {result['skipped']}")
+                else:
+                    log(f"{name:<24} x{scale:<5} median {result['median_ms']:>11.3f} ms  "
+                        f"p90 {result['p90_ms']:>11.3f} ms  ({result['runs']} runs, {result['items']:,} items)")
+    return report
+
+
+def compare(report, baseline, ratio=REGRESSION_RATIO):
+    """Median time against the baseline report for every (case, scale) present in both."""
+    before = {(r["case"], r["scale"]): r for r in baseline["results"] if "median_ms" in r}
+    rows = []
+    for r in report["results"]:
+        old = before.get((r["case"], r["scale"]))
+        if old is None or "median_ms" not in r:
+            continue
+        change = r["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+        rows.append({
+            "Case": r["case"],
+            "Scale": r["scale"],
+            "Baseline ms": old["median_ms"],
+            "Median ms": r["median_ms"],
+            "Ratio": round(change, 2),
+            "Regressed": change > ratio,
+        })
+    return pd.DataFrame(rows, columns=["Case", "Scale", "Baseline ms", "Median ms", "Ratio", "Regressed"])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Headless benchmarks of the search, gallery, forecasting and prediction hot paths "
+                    "on synthetic data. Run from the Cultural_Heritage folder.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="data size multipliers over the shipped datasets (1000 works but takes a while)")
+    parser.add_argument("--cases", nargs="+", metavar="PREFIX",
+                        help="only cases whose name starts with one of these, e.g. search forecast")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed runs per case and scale")
+    parser.add_argument("--budget", type=float, default=BUDGET_SECONDS,
+                        help="seconds after which a case stops repeating")
+    parser.add_argument("--out", help="write the JSON report here")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON report to compare medians against")
+    parser.add_argument("--ratio", type=float, default=REGRESSION_RATIO,
+                        help="median / baseline ratio counted as a regression")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+    names = [n for n in CASES if not args.cases or any(n.startswith(p) for p in args.cases)]
+    if not names:
+        parser.error(f"no cases match {args.cases}")
+
+    report = run(args.scales, names, args.repeat, args.budget)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            changes = compare(report, json.load(f), args.ratio)
+        print(changes.to_string(index=False) if not changes.empty else "Nothing in common with the baseline.")
+        regressed = changes[changes["Regressed"]]
+        if not regressed.empty:
+            print(f"{len(regressed)} case(s) slower than {args.ratio}x the baseline.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
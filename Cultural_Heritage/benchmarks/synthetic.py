@@ -0,0 +1,154 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from utils import gazetteer
+from utils.catalog import compact_places, typed_places
+
+SEED = 7
+
+# Scale 1 is roughly the shipped datasets; every generator multiplies its row or file count by scale.
+BASE_PLACES = 325
+BASE_STATS_STATES = len(gazetteer.STATE_CENTROIDS)
+STATS_YEARS = list(range(2001, 2021))
+STATS_TYPES = ["DTV", "FTV"]
+BASE_MARQUEE_IMAGES = 8
+GALLERY_STATES = 3
+BASE_PLACES_PER_STATE = 5
+IMAGES_PER_PLACE = 4
+SOURCE_IMAGES = 6
+UNLOCATED_SHARE = 0.05      # places in towns the gazetteer doesn't know
+
+ZONES = ["North", "South", "East", "West", "Central", "Northern", "Southern", "Eastern", "Western"]
+PLACE_TYPES = ["Fort", "Temple", "Palace", "Museum", "Beach", "Lake", "Park", "Monument", "Cave", "Waterfall",
+               "Zoo", "Garden", "Market", "Mosque", "Church"]
+WORDS = ["Amber", "Golden", "Royal", "Lotus", "Sun", "Moon", "Old", "Grand", "Hill", "River", "Sacred", "Victory",
+         "Pearl", "Tiger", "Peacock", "Ancient"]
+SIGNIFICANCE = ["Historical", "Religious", "Nature", "Recreational", "Architectural", "Cultural", "Wildlife"]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+BEST_TIMES = ["Morning", "Afternoon", "Evening", "All", "Night"]
+
+
+# ---------- PLACES ----------
+def places_frame(scale, seed=SEED):
+    """Raw places rows with the CSV's columns: BASE_PLACES * scale places in gazetteer cities."""
+    rng = np.random.default_rng(seed)
+    n = BASE_PLACES * scale
+    cities = rng.integers(0, len(gazetteer.CITIES), n)
+    city = np.array([c[0] for c in gazetteer.CITIES], dtype=object)[cities]
+    state = np.array([c[1] for c in gazetteer.CITIES], dtype=object)[cities]
+    unlocated = rng.random(n) < UNLOCATED_SHARE
+    city[unlocated] = [f"Village {i}" for i in rng.integers(0, 10_000, unlocated.sum())]
+    kind = np.array(PLACE_TYPES, dtype=object)[rng.integers(0, len(PLACE_TYPES), n)]
+    words = np.array(WORDS, dtype=object)[rng.integers(0, len(WORDS), n)]
+    return pd.DataFrame({
+        "Zone": np.array(ZONES, dtype=object)[rng.integers(0, len(ZONES), n)],
+        "State": state,
+        "City": city,
+        "Name": [f"{w} {k} {i}" for i, (w, k) in enumerate(zip(words, kind))],
+        "Type": kind,
+        "Establishment_Year": rng.integers(200, 2000, n).astype(str),
+        "Time_Needed_To_Visit_In_Hrs": rng.choice([0.5, 1.0, 1.5, 2.0, 3.0, 5.0], n),
+        "Google_Review_Rating": np.round(rng.uniform(3.0, 5.0, n), 1),
+        "Entrance_Fee_In_Inr": rng.choice([0, 20, 30, 50, 100, 250, 500], n),
+        "Airport_With_50Km_Radius": rng.choice(["Yes", "No"], n),
+        "Weekly_Off": rng.choice(DAYS + ["None"], n),
+        "Significance": np.array(SIGNIFICANCE, dtype=object)[rng.integers(0, len(SIGNIFICANCE), n)],
+        "Dslr_Allowed": rng.choice(["Yes", "No"], n),
+        "Number_Of_Google_Review_In_Lakhs": np.round(rng.uniform(0.01, 3.0, n), 2),
+        "Best_Time_To_Visit": rng.choice(BEST_TIMES, n),
+        "Image": [f"img_{i}.jpg" for i in range(n)],
+    })
+
+
+def catalog_places(scale, seed=SEED):
+    """Synthetic places typed and compacted exactly like the catalog loads them."""
+    return compact_places(typed_places(places_frame(scale, seed)))
+
+
+# ---------- TOURIST STATS ----------
+def stats_frame(scale, seed=SEED):
+    """
+    Long-format Year/Type/State/Tourist_Count over STATS_YEARS and STATS_TYPES for
+    BASE_STATS_STATES * scale states, with per-state growth and a few missing years.
+    """
+    rng = np.random.default_rng(seed)
+    states = list(gazetteer.STATE_CENTROIDS)
+    states += [f"Synthetic State {i}" for i in range(BASE_STATS_STATES * scale - len(states))]
+    n_series = len(STATS_TYPES) * len(states)
+    base = rng.lognormal(13, 1.5, n_series)
+    growth = rng.normal(0.05, 0.08, n_series)
+    t = np.arange(len(STATS_YEARS))[:, None]
+    counts = base * np.exp(growth * t) * rng.lognormal(0, 0.1, (len(STATS_YEARS), n_series))
+    present = rng.random(counts.shape) > 0.03
+    years, series = np.nonzero(present)
+    return pd.DataFrame({
+        "Year": np.asarray(STATS_YEARS)[years],
+        "Type": np.asarray(STATS_TYPES, dtype=object)[series // len(states)],
+        "State": np.asarray(states, dtype=object)[series % len(states)],
+        "Tourist_Count": counts[years, series].astype(np.int64),
+    })
+
+
+# ---------- IMAGES ----------
+def source_images(folder, count=SOURCE_IMAGES, size=(960, 640), seed=SEED):
+    """count distinct photo-sized JPEGs (noisy gradients, so they compress like photos)."""
+    os.makedirs(folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    w, h = size
+    gradient = np.linspace(0, 255, w)[None, :, None] * np.ones((h, 1, 3))
+    paths = []
+    for i in range(count):
+        tint = rng.uniform(0.3, 1.0, 3)
+        pixels = gradient * tint + rng.normal(0, 24, (h, w, 3))
+        path = os.path.join(folder, f"source_{i}.jpg")
+        Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8)).save(path, quality=85)
+        paths.append(path)
+    return paths
+
+
+def _place_copy(src, dst):
+    # Hard links keep a 1000x library cheap on disk; fall back to copying across devices.
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def image_library(root, scale):
+    """
+    Image folders under root for scale, reusing a handful of source JPEGs:
+      marquee/                      BASE_MARQUEE_IMAGES * scale images (home page strip)
+      Places/<state>/<place>/       GALLERY_STATES states of BASE_PLACES_PER_STATE * scale
+                                    places with IMAGES_PER_PLACE images each (heritage gallery)
+      Dance/<form>/                 one folder per dance form (classifier gallery and predictions)
+    Returns a dict of those paths plus the gallery state and place names.
+    """
+    sources = source_images(os.path.join(root, "sources"))
+    marquee = os.path.join(root, "marquee")
+    os.makedirs(marquee, exist_ok=True)
+    for i in range(BASE_MARQUEE_IMAGES * scale):
+        _place_copy(sources[i % len(sources)], os.path.join(marquee, f"tourist_{i:06d}.jpg"))
+
+    places = os.path.join(root, "Places")
+    states = [f"State {s}" for s in range(GALLERY_STATES)]
+    for state in states:
+        for p in range(BASE_PLACES_PER_STATE * scale):
+            folder = os.path.join(places, state, f"Place {p:05d}")
+            os.makedirs(folder, exist_ok=True)
+            for i in range(IMAGES_PER_PLACE):
+                _place_copy(sources[(p + i) % len(sources)], os.path.join(folder, f"photo_{i}.jpg"))
+
+    dance = os.path.join(root, "Dance")
+    forms = ["Bharatanatyam", "Kathak", "Odissi"]
+    for f, form in enumerate(forms):
+        folder = os.path.join(dance, form)
+        os.makedirs(folder, exist_ok=True)
+        for i in range(IMAGES_PER_PLACE * scale):
+            _place_copy(sources[(f + i) % len(sources)], os.path.join(folder, f"{form.lower()}_{i:05d}.jpg"))
+
+    return {"marquee": marquee, "places": places, "states": states, "place": "Place 00000",
+            "dance": dance, "forms": forms}
@@ -1,105 +1,20 @@
 import streamlit as st
 import tensorflow as tf
-import numpy as np
 import pandas as pd
 import os
-import shutil
 import random
-from PIL import Image
 import base64
 import streamlit.components.v1 as components
 from utils.common_css import add_logo
-
-# --- Constants ---
-BASE_DIR = "data/Dance_Forms"
-TRAIN_DIR = os.path.join(BASE_DIR, "Train")
-UPLOAD_DIR = os.path.join(BASE_DIR, "New_Uploads")
-MODEL_PATH = os.path.join(BASE_DIR, "dance_model.h5")
-IMG_SIZE = (224, 224)
-
-
-# --- Utility functions ---
-def list_valid_dirs(path):
-    return sorted([d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d)) and not d.startswith('.')])
-
-
-def list_valid_images(path):
-    return sorted([f for f in os.listdir(path) if not f.startswith('.')])
-
-
-def load_model():
-    if os.path.exists(MODEL_PATH):
-        return tf.keras.models.load_model(MODEL_PATH)
-    return None
-
-
-def train_model():
-    train_ds = tf.keras.preprocessing.image_dataset_from_directory(
-        TRAIN_DIR,
-        validation_split=0.2,
-        subset="training",
-        seed=42,
-        image_size=IMG_SIZE,
-        batch_size=32
-    )
-    val_ds = tf.keras.preprocessing.image_dataset_from_directory(
-        TRAIN_DIR,
-        validation_split=0.2,
-        subset="validation",
-        seed=42,
-        image_size=IMG_SIZE,
-        batch_size=32
-    )
-    class_names = train_ds.class_names
-    AUTOTUNE = tf.data.AUTOTUNE
-    train_ds = train_ds.prefetch(buffer_size=AUTOTUNE)
-    val_ds = val_ds.prefetch(buffer_size=AUTOTUNE)
-
-    model = tf.keras.Sequential([
-        tf.keras.layers.Rescaling(1. / 255, input_shape=(224, 224, 3)),
-        tf.keras.layers.Conv2D(32, (3, 3), activation='relu'),
-        tf.keras.layers.MaxPooling2D(),
-        tf.keras.layers.Conv2D(64, (3, 3), activation='relu'),
-        tf.keras.layers.MaxPooling2D(),
-        tf.keras.layers.Conv2D(128, (3, 3), activation='relu'),
-        tf.keras.layers.MaxPooling2D(),
-        tf.keras.layers.Flatten(),
-        tf.keras.layers.Dense(128, activation='relu'),
-        tf.keras.layers.Dense(len(class_names), activation='softmax')
-    ])
-    model.compile(optimizer='adam',
-                  loss='sparse_categorical_crossentropy',
-                  metrics=['accuracy'])
-    model.fit(train_ds, validation_data=val_ds, epochs=10)
-    model.save(MODEL_PATH)
-    return class_names
-
-
-def predict_dance(model, class_names, image_path):
-    img = tf.keras.preprocessing.image.load_img(image_path, target_size=IMG_SIZE)
-    img_array = tf.keras.preprocessing.image.img_to_array(img)
-    img_array = np.expand_dims(img_array, axis=0) / 255.0
-    predictions = model.predict(img_array)
-    predicted_class = class_names[np.argmax(predictions)]
-    return predicted_class
-
-
-def move_new_uploads_to_train():
-    updated = False
-    for cls in list_valid_dirs(UPLOAD_DIR):
-        class_dir = os.path.join(UPLOAD_DIR, cls)
-        target_dir = os.path.join(TRAIN_DIR, cls)
-        if not os.path.exists(target_dir):
-            os.makedirs(target_dir)
-        for img in list_valid_images(class_dir):
-            shutil.move(os.path.join(class_dir, img), target_dir)
-            updated = True
-    return updated
-
+from utils.dance_model import IMG_SIZE, MODEL_PATH, TRAIN_DIR, UPLOAD_DIR, load_model, move_new_uploads_to_train, predict_dance, train_model
+from utils.gallery import encode_image, list_valid_dirs, list_valid_images
+from utils.perf import begin_run, end_run, payload, stage
 
 # --- Streamlit UI ---
 st.set_page_config(page_title="Dance Form Classifier", layout="wide")
+begin_run("Dance Classifier")
 add_logo("data/BGs/logo_app.png")
+@stage("background")
 def local_image_to_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
@@ -108,7 +23,7 @@ bg_path = "data/BGs/dance.jpeg"
 bg_base64 = local_image_to_base64(bg_path)
 
 # Main app background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     .stApp {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -119,10 +34,10 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # Sidebar background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     section[data-testid="stSidebar"] {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.85), rgba(0,0,0,0.85)), 
@@ -132,7 +47,7 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 
 st.markdown("<h1 style='text-align:center;color:#FFD700;'> 💃 Indian Dance Forms</h1>", unsafe_allow_html=True)
@@ -141,21 +56,6 @@ menu = st.selectbox("Choose Mode", ["💃 Dance Forms", "🖼 Know the Dance For
 
 # ✅ NOTE: No set_page_config() here since you're calling inside a multi-page Streamlit app
 
-# --- Constants ---
-TRAIN_DIR = "data/Dance_Forms/Train"
-
-# --- Utility functions ---
-def list_valid_dirs(path):
-    return sorted([d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d)) and not d.startswith('.')])
-
-def list_valid_images(path):
-    return sorted([f for f in os.listdir(path) if not f.startswith('.') and f.lower().endswith(('.jpg', '.jpeg', '.png'))])
-
-def encode_image(img_path):
-    with open(img_path, "rb") as img_file:
-        encoded = base64.b64encode(img_file.read()).decode()
-    return f"data:image/jpeg;base64,{encoded}"
-
 # --- Main Gallery Code ---
 
 if menu == "💃 Dance Forms":
@@ -175,10 +75,11 @@ if menu == "💃 Dance Forms":
 
         if gallery_type == "3D Carousel":
             slides = ""
-            for img_file in sample_imgs:
-                full_path = os.path.join(sample_path, img_file)
-                img_data = encode_image(full_path)
-                slides += f'<div class="item"><img src="{img_data}" alt="Dance Image"></div>'
+            with stage("gallery"):
+                for img_file in sample_imgs:
+                    full_path = os.path.join(sample_path, img_file)
+                    img_data = encode_image(full_path)
+                    slides += f'<div class="item"><img src="{img_data}" alt="Dance Image"></div>'
 
             html_code = f"""
             <style>
@@ -226,14 +127,15 @@ if menu == "💃 Dance Forms":
                 }});
             </script>
             """
-            components.html(html_code, height=650)
+            components.html(payload(html_code), height=650)
 
         else:  # Flip Gallery
             slides = ""
-            for img_file in sample_imgs:
-                full_path = os.path.join(sample_path, img_file)
-                img_data = encode_image(full_path)
-                slides += f'<div class="swiper-slide"><img src="{img_data}" class="slide-img"></div>'
+            with stage("gallery"):
+                for img_file in sample_imgs:
+                    full_path = os.path.join(sample_path, img_file)
+                    img_data = encode_image(full_path)
+                    slides += f'<div class="swiper-slide"><img src="{img_data}" class="slide-img"></div>'
 
             html_code = f"""
             <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/swiper@9/swiper-bundle.min.css" />
@@ -274,7 +176,7 @@ if menu == "💃 Dance Forms":
             }});
             </script>
             """
-            components.html(html_code, height=650)
+            components.html(payload(html_code), height=650)
 
 
 # Predict Dance Form
@@ -333,4 +235,4 @@ elif menu == "🚀 Contribute Dance Data":
             else:
                 st.warning("⚠️ No new data found for training.")
 
-
+end_run()
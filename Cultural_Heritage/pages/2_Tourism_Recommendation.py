@@ -1,12 +1,20 @@
 import streamlit as st
-import pandas as pd
-import re
+import numpy as np
+import plotly.graph_objects as go
 import streamlit.components.v1 as components
 import base64
-from utils import data_loaders
+from utils import data_loaders, gazetteer
 from utils.common_css import add_logo
+from utils.catalog import get_catalog
+from utils.geo_index import get_geo_index
+from utils.incremental_search import session_search
+from utils.place_search import SearchEngine
+from utils.perf import begin_run, end_run, payload, stage
+from utils.map_view import INDIA_BBOX, MAP_GEO, MAX_ZOOM, get_cluster_cache, view_bbox
+from utils.user_store import UserStore
 
 st.set_page_config(page_title="🇮🇳 India Tourism Recommender", layout="wide")
+begin_run("Tourism Recommendation")
 
 
 add_logo("data/BGs/logo_app.png")
@@ -21,47 +29,18 @@ def local_image_to_base64(path):
 # ---------- DATA HANDLER ----------
 class DataHandler:
     def __init__(self):
-        self.places_df = data_loaders.load_places()
-        self.login_df = data_loaders.load_login_data()
+        self.user_store = UserStore()
+        if not self.user_store.legacy_imported():
+            self.user_store.import_legacy(data_loaders.load_login_data())
+
+    def user_exists(self, email):
+        return self.user_store.exists(email)
 
     def save_user(self, email, pwd):
-        new_user = pd.DataFrame({"Email": [email], "Password": [pwd]})
-        self.login_df = pd.concat([self.login_df, new_user], ignore_index=True)
-        data_loaders.save_login_data(self.login_df)
+        return self.user_store.add_user(email, pwd)
 
     def validate_user(self, email, pwd):
-        user = self.login_df[self.login_df["Email"] == email]
-        return not user.empty and user.iloc[0]['Password'] == pwd
-
-
-# ---------- SEARCH ----------
-class SearchEngine:
-    def __init__(self, df):
-        self.df = df
-
-    def search(self, query, state):
-        filtered_df = self.df.copy()
-
-        if not query.strip() and state != "All States":
-            filtered_df = filtered_df[filtered_df['State'] == state]
-
-        if query.strip():
-            pattern = re.compile(re.escape(query.strip()), re.IGNORECASE)
-            filtered_df = filtered_df[
-                filtered_df['Name'].str.contains(pattern) |
-                filtered_df['City'].str.contains(pattern) |
-                filtered_df['State'].str.contains(pattern)
-            ]
-
-        return filtered_df
-
-    def dynamic_filter(self, df, filters):
-        for col, value in filters.items():
-            if isinstance(value, list) and value:
-                df = df[df[col].isin(value)]
-            elif isinstance(value, tuple) and len(value) == 2:
-                df = df[df[col].between(value[0], value[1])]
-        return df
+        return self.user_store.verify(email, pwd)
 
 
 # ---------- AUTH ----------
@@ -86,7 +65,6 @@ class Auth:
         with center_btn:
             if st.button(btn_label, use_container_width=True):
                 if menu == "Login":
-                    st.session_state.logged_in = True
                     if self.data_handler.validate_user(email, pwd):
                         st.session_state.logged_in = True
                         st.session_state.user_email = email
@@ -95,18 +73,18 @@ class Auth:
                     else:
                         st.error("❌ Incorrect credentials.")
                 else:
-                    if email in self.data_handler.login_df["Email"].values:
+                    if self.data_handler.user_exists(email) or not self.data_handler.save_user(email, pwd):
                         st.warning("⚠️ Email already exists!")
                     else:
-                        self.data_handler.save_user(email, pwd)
                         st.success("✅ Registration successful! You can now login.")
 
+    @stage("background")
     def _add_login_background(self):
         image_path = "data/BGs/login_bg.jpg"
         with open(image_path, "rb") as f:
             encoded = base64.b64encode(f.read()).decode()
 
-        st.markdown(f"""
+        st.markdown(payload(f"""
             <style>
             .stApp {{
                 background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -117,10 +95,10 @@ class Auth:
                 background-size: cover;
             }}
             </style>
-        """, unsafe_allow_html=True)
+        """), unsafe_allow_html=True)
 
         # Sidebar background
-        st.markdown(f"""
+        st.markdown(payload(f"""
             <style>
             section[data-testid="stSidebar"] {{
                 background: linear-gradient(to bottom, rgba(0,0,0,0.85), rgba(0,0,0,0.85)), 
@@ -130,23 +108,52 @@ class Auth:
                 background-size: cover;
             }}
             </style>
-        """, unsafe_allow_html=True)
+        """), unsafe_allow_html=True)
 
 
 # ---------- UI ----------
 class UI:
+    def __init__(self, catalog):
+        self.catalog = catalog
+
     def render(self, df, columns_to_display):
         if df.empty:
             st.warning("⚠️ No results found!")
             return
 
-        view_mode = st.radio("View Mode", ["🃏 Card View", "📊 Table View"], horizontal=True)
+        view_mode = st.radio("View Mode", ["🃏 Card View", "📊 Table View", "🗺️ Map View"], horizontal=True)
 
         if view_mode == "📊 Table View":
             self._render_table(df, columns_to_display)
+        elif view_mode == "🗺️ Map View":
+            self._render_map(df)
         else:
             self._render_cards(df, columns_to_display)
 
+    @stage("map")
+    def _render_map(self, df):
+        # Clusters are computed and cached server-side; only the cluster markers reach the browser.
+        centers = {state: gazetteer.STATE_CENTROIDS[gazetteer.canonical_state(state)]
+                   for state in df["State"].dropna().unique() if gazetteer.canonical_state(state)}
+        col_region, col_zoom = st.columns([2, 3])
+        region = col_region.selectbox("Centre on", ["All India"] + sorted(centers))
+        zoom = col_zoom.slider("Zoom", 0, MAX_ZOOM, 0 if region == "All India" else 3, key=f"map_zoom_{region}")
+        center = centers.get(region, ((INDIA_BBOX[0] + INDIA_BBOX[2]) / 2, (INDIA_BBOX[1] + INDIA_BBOX[3]) / 2))
+        south, west, north, east = view_bbox(center, zoom)
+        clusters = get_cluster_cache(self.catalog).clusters(zoom, (south, west, north, east), df.index)
+
+        fig = go.Figure(go.Scattergeo(
+            lat=clusters["Lat"], lon=clusters["Lon"], text=clusters["Label"], mode="markers",
+            marker=dict(size=10 + 30 * np.sqrt(clusters["Count"] / max(clusters["Count"].max(), 1)),
+                        color=clusters["Count"], colorscale="YlOrRd", line=dict(width=1, color="white")),
+            hovertemplate="%{text}<extra></extra>"
+        ))
+        fig.update_geos(lataxis_range=[south, north], lonaxis_range=[west, east], **MAP_GEO)
+        fig.update_layout(height=650, margin=dict(l=0, r=0, t=0, b=0), paper_bgcolor="rgba(0,0,0,0)")
+        st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"{len(clusters):,} markers for {int(clusters['Count'].sum()):,} places in view")
+
+    @stage("render cards")
     def _render_cards(self, df, columns_to_display):
         card_html = """
         <style>
@@ -171,8 +178,9 @@ class UI:
                     card_html += f"<p><b>{col.replace('_',' ')}:</b> {row[col]}</p>"
             card_html += "</div>"
         card_html += "</div>"
-        components.html(card_html, height=900, scrolling=True)
+        components.html(payload(card_html), height=900, scrolling=True)
 
+    @stage("render table")
     def _render_table(self, df, columns_to_display):
         table_html = """
         <style>
@@ -197,15 +205,23 @@ class UI:
             table_html += "</div>"
         table_html += "</div>"
 
-        components.html(table_html, height=900, scrolling=True)
+        components.html(payload(table_html), height=900, scrolling=True)
+
+
+# ---------- SHARED RESOURCES ----------
+@st.cache_resource(show_spinner=False)
+def get_data_handler():
+    return DataHandler()
 
 
 # ---------- MAIN APP ----------
 class TourismApp:
     def __init__(self):
-        self.data_handler = DataHandler()
-        self.search_engine = SearchEngine(self.data_handler.places_df)
-        self.ui = UI()
+        with stage("load data"):
+            self.data_handler = get_data_handler()
+            catalog = get_catalog()
+            self.search_engine = SearchEngine(catalog, get_geo_index(catalog))
+        self.ui = UI(catalog)
 
         if "logged_in" not in st.session_state:
             st.session_state.logged_in = False
@@ -221,11 +237,12 @@ class TourismApp:
             self._add_dashboard_background()
             self.dashboard()
 
+    @stage("background")
     def _add_dashboard_background(self):
         image_path = "data/BGs/logo.png"
         with open(image_path, "rb") as f:
             encoded = base64.b64encode(f.read()).decode()
-        st.markdown(f"""
+        st.markdown(payload(f"""
             <style>
             .stApp {{
                 background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -234,10 +251,10 @@ class TourismApp:
                 background-position: center;
             }}
             </style>
-        """, unsafe_allow_html=True)
+        """), unsafe_allow_html=True)
 
         # Sidebar background
-        st.markdown(f"""
+        st.markdown(payload(f"""
             <style>
             section[data-testid="stSidebar"] {{
                 background: linear-gradient(to bottom, rgba(0,0,0,0.85), rgba(0,0,0,0.85)), 
@@ -247,7 +264,7 @@ class TourismApp:
                 background-size: cover;
             }}
             </style>
-        """, unsafe_allow_html=True)
+        """), unsafe_allow_html=True)
 
     def dashboard(self):
         st.markdown("<h1 style='text-align:center;font-family:Orbitron;color:#FFD700;'>🌏 India Cultural & Tourism Explorer</h1>", unsafe_allow_html=True)
@@ -256,30 +273,41 @@ class TourismApp:
         st.session_state.search_query = query
 
         if not query.strip():
-            state_list = ["All States"] + sorted(self.data_handler.places_df["State"].unique())
+            state_list = ["All States"] + self.search_engine.states
             selected_state = st.selectbox("Select State", state_list, index=state_list.index(st.session_state.selected_state))
             st.session_state.selected_state = selected_state
 
-        filtered_df = self.search_engine.search(st.session_state.search_query, st.session_state.selected_state)
+        with stage("search"):
+            searcher = session_search("places_searcher", self.search_engine.haystack)
+            filtered_df = self.search_engine.search(st.session_state.search_query, st.session_state.selected_state, searcher)
 
-        columns_available = [col for col in self.data_handler.places_df.columns if col not in ["Name", "City", "State"]]
+        columns_available = [col for col in self.search_engine.df.columns if col not in ["Name", "City", "State"]]
         selected_cols = st.multiselect("Select additional fields to view:", columns_available, default=[])
         fields_to_display = ["Name", "City", "State"] + selected_cols
 
         with st.sidebar:
+            st.header("📍 Near Me")
+            if st.toggle("Only places near a city", key="near_me"):
+                city = st.selectbox("City", gazetteer.city_options(), key="near_city")
+                radius = st.slider("Within (km)", 10, 500, 100, step=10, key="near_km")
+                filtered_df = self.search_engine.near(filtered_df, city, radius)
+                fields_to_display += ["Distance_Km", "Nearest_Airport", "Airport_Km"]
+                if self.search_engine.geo.unlocated:
+                    st.caption(f"{self.search_engine.geo.unlocated} places have no known location and are not shown.")
+
             filters = {}
             if selected_cols:
                 st.header("⚙️ Advanced Filters")
             for field in selected_cols:
-                if self.data_handler.places_df[field].dtype == "object":
-                    options = sorted(self.data_handler.places_df[field].dropna().unique().tolist())
+                if field in self.search_engine.facet_options:
+                    options = self.search_engine.facet_options[field]
                     filters[field] = st.multiselect(f"{field}", options, default=[])
-                elif self.data_handler.places_df[field].dtype in ['int64', 'float64']:
-                    min_val = float(self.data_handler.places_df[field].min())
-                    max_val = float(self.data_handler.places_df[field].max())
+                elif field in self.search_engine.facet_ranges:
+                    min_val, max_val = self.search_engine.facet_ranges[field]
                     filters[field] = st.slider(f"{field}", min_val, max_val, (min_val, max_val))
 
-            filtered_df = self.search_engine.dynamic_filter(filtered_df, filters)
+            with stage("filter"):
+                filtered_df = self.search_engine.dynamic_filter(filtered_df, filters)
 
             st.divider()
             if st.button("🚪 Logout"):
@@ -291,3 +319,4 @@ class TourismApp:
 
 # --------- RUN ------------
 TourismApp().run()
+end_run()
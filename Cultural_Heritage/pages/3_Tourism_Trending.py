@@ -3,24 +3,27 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from utils import data_loaders
-from sklearn.linear_model import LinearRegression
-import numpy as np
 import base64
 from utils.common_css import add_logo
+from utils.figure_cache import cached_figure
+from utils.forecasting import get_batch_forecast
+from utils.map_view import CLASS_COLORS, INDIA_BBOX, MAP_GEO, build_state_map
+from utils.stats_cube import build_stats_cube
+from utils.table_view import TableView, render_table_view
+from utils.perf import begin_run, end_run, payload, stage
 
 # Global Color Constants
 BACKGROUND = "#000000"  # Fully black background
 LEGEND_BG = "#6e8bc4"  # Light blue legend background
 FONT_COLOR = "white"
-TABLE_HEADER = "#222831"
-TABLE_ROW_ODD = "#393E46"
-TABLE_ROW_EVEN = "#222831"
 
 # Streamlit Config
 st.set_page_config(page_title="Tourism Trends Dashboard", layout="wide")
+begin_run("Tourism Trending")
 
 add_logo("data/BGs/logo_app.png")
 
+@stage("background")
 def local_image_to_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
@@ -29,7 +32,7 @@ bg_path = "data/BGs/trend.jpg"
 bg_base64 = local_image_to_base64(bg_path)
 
 # Main app background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     .stApp {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -40,10 +43,10 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # Sidebar background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     section[data-testid="stSidebar"] {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.85), rgba(0,0,0,0.85)), 
@@ -53,45 +56,79 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 st.markdown("<h1 style='color:#FF9933; text-align:center;'>🇮🇳 Indian Tourism Trends</h1>", unsafe_allow_html=True)
 st.markdown("<p style='color:#FF9933; text-align:center;'>provided DTV - Domestic Tourist Visitor & FTV - Foreign Tourist Visitor</p>", unsafe_allow_html=True)
 
 # Load Data
-df_melted = data_loaders.load_tourist_stats()
+with stage("load stats"):
+    stats_version = data_loaders.dataset_version("tourist_stats")
+    cube = build_stats_cube(stats_version)
 
 # Sidebar Navigation
 view_mode = st.sidebar.radio("View Mode", ["Indian Tourism Glory", "Tourism Trends", "Tourism Race", "India Tour stat"])
 
-# Clean Table Function
-def show_clean_table(df):
-    fig = go.Figure(data=[go.Table(
-        header=dict(values=list(df.columns),
-                    fill_color=TABLE_HEADER,
-                    font=dict(color=FONT_COLOR, size=16, family="Arial"),
-                    align='center', line_color="#393E46"),
-        cells=dict(values=[df[col].tolist() for col in df.columns],
-                   fill_color=[[TABLE_ROW_ODD if i % 2 == 0 else TABLE_ROW_EVEN for i in range(len(df))]],
-                   font=dict(color=FONT_COLOR, size=14, family="Arial"),
-                   align='center', height=35, line_color="#393E46"))
-    ])
-    fig.update_layout(margin=dict(l=0, r=0, t=10, b=10), height=min(60 + 35 * len(df), 750), paper_bgcolor=BACKGROUND)
-    st.plotly_chart(fig, use_container_width=True)
+# Stats Table: shared, paginated view over the long-format stats
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_stats_table(version):
+    return TableView(data_loaders.load_tourist_stats())
+
+# Race Figure: every year is a pre-sorted frame; playback and the year slider run in the browser
+@stage("race chart")
+@st.cache_resource(show_spinner=False, max_entries=8)
+def build_race_figure(version, visitor_type):
+    race_cube = build_stats_cube(version)
+    palette = px.colors.qualitative.Alphabet
+    state_colors = {state: palette[i % len(palette)] for i, state in enumerate(race_cube.states)}
+    y_max = max(int(race_cube.values[:, race_cube.type_index[visitor_type]].max()), 1) * 1.1
+
+    frames = []
+    for year in race_cube.years:
+        year_df = race_cube.year_frame(year, visitor_type)
+        frames.append(go.Frame(
+            name=str(year),
+            data=[go.Bar(x=year_df["State"], y=year_df["Tourist_Count"],
+                         marker_color=[state_colors[state] for state in year_df["State"]],
+                         text=[f"#{rank}" for rank in year_df["Rank"]], textposition="outside",
+                         hovertemplate="%{x}<br>%{y:,}<extra></extra>")],
+            layout=go.Layout(title_text=f"Tourism Data for {year}")
+        ))
+
+    frame_args = dict(frame=dict(duration=900, redraw=True), transition=dict(duration=500), mode="immediate")
+    fig = go.Figure(data=frames[0].data, frames=frames)
+    fig.update_layout(
+        height=700,
+        plot_bgcolor=BACKGROUND,
+        paper_bgcolor=BACKGROUND,
+        font=dict(color=FONT_COLOR, size=16),
+        margin=dict(l=50, r=50, t=50, b=200),
+        xaxis=dict(tickangle=-45, tickfont=dict(size=14), categoryorder="total descending"),
+        yaxis=dict(tickfont=dict(size=14), range=[0, y_max]),
+        title=frames[0].layout.title.text,
+        updatemenus=[dict(type="buttons", direction="left", x=0, y=1.12, showactive=False, buttons=[
+            dict(label="▶ Play", method="animate", args=[None, dict(frame_args, fromcurrent=True)]),
+            dict(label="⏸ Pause", method="animate", args=[[None], dict(frame_args, frame=dict(duration=0, redraw=False))]),
+        ])],
+        sliders=[dict(active=0, y=0, yanchor="top", pad=dict(t=160), currentvalue=dict(prefix="Year: "), steps=[
+            dict(label=frame.name, method="animate", args=[[frame.name], frame_args]) for frame in frames
+        ])]
+    )
+    return fig
 
 # =================== SUMMARY DASHBOARD ===================
 if view_mode == "Indian Tourism Glory":
     st.sidebar.subheader("Indian Tourism Data")
-    selected_year = st.sidebar.selectbox("📅 Select Year", sorted(df_melted["Year"].unique()))
-    selected_type = st.sidebar.selectbox("🌐 Select Type", sorted(df_melted["Type"].unique()))
+    selected_year = st.sidebar.selectbox("📅 Select Year", cube.years)
+    selected_type = st.sidebar.selectbox("🌐 Select Type", cube.types)
     top_n_states = st.sidebar.slider("📊 Top N States", 5, 36, 10, step=1)
 
-    filtered = df_melted[(df_melted['Year'] == selected_year) & (df_melted['Type'] == selected_type)]
+    ranked = cube.year_frame(selected_year, selected_type)
     st.subheader("📊 National Summary")
 
-    total_tourists = filtered["Tourist_Count"].sum()
-    top_state = filtered.loc[filtered["Tourist_Count"].idxmax()]
-    low_state = filtered.loc[filtered["Tourist_Count"].idxmin()]
+    total_tourists = cube.national_total(selected_year, selected_type)
+    top_state = ranked.iloc[0]
+    low_state = ranked.iloc[-1]
 
     col1, col2, col3 = st.columns(3)
     col1.metric("Total Tourists", f"{total_tourists:,}")
@@ -100,171 +137,157 @@ if view_mode == "Indian Tourism Glory":
 
     col_chart, col_graph = st.columns([1, 4])
     with col_chart:
-        display_mode = st.selectbox("🔄 Select Visualization Mode:", ["Pie Chart", "Bar Chart", "Table View"])
+        display_mode = st.selectbox("🔄 Select Visualization Mode:", ["Pie Chart", "Bar Chart", "State Map", "Table View"])
 
-    top_states = filtered.sort_values(by='Tourist_Count', ascending=False).head(top_n_states)
+    top_states = ranked.head(top_n_states)
+    selections = (selected_year, selected_type, top_n_states)
 
     with col_graph:
         if display_mode == "Pie Chart":
-            pie_fig = px.pie(top_states, names="State", values="Tourist_Count", hole=0.4,
-                             color_discrete_sequence=px.colors.qualitative.Bold)
-            pie_fig.update_traces(textposition='inside', textinfo='percent+label', textfont_size=16, pull=[0.05]*len(top_states))
-            pie_fig.update_layout(height=700,
-                                   paper_bgcolor=BACKGROUND, plot_bgcolor=BACKGROUND,
-                                   legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)))
-            st.plotly_chart(pie_fig, use_container_width=True)
+            def build_pie():
+                pie_fig = px.pie(top_states, names="State", values="Tourist_Count", hole=0.4,
+                                 color_discrete_sequence=px.colors.qualitative.Bold)
+                pie_fig.update_traces(textposition='inside', textinfo='percent+label', textfont_size=16, pull=[0.05]*len(top_states))
+                pie_fig.update_layout(height=700,
+                                       paper_bgcolor=BACKGROUND, plot_bgcolor=BACKGROUND,
+                                       legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)))
+                return pie_fig
+            st.plotly_chart(cached_figure("glory_pie", selections, stats_version, build_pie), use_container_width=True)
 
         elif display_mode == "Bar Chart":
-            bar_fig = px.bar(top_states, x="State", y="Tourist_Count", color="Tourist_Count",
-                             color_continuous_scale=px.colors.sequential.Viridis_r)
-            bar_fig.update_layout(height=600, xaxis_tickangle=-45,
-                                   paper_bgcolor=BACKGROUND, plot_bgcolor=BACKGROUND,
-                                   font=dict(color=FONT_COLOR),
-                                   legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)))
-            st.plotly_chart(bar_fig, use_container_width=True)
+            def build_bar():
+                bar_fig = px.bar(top_states, x="State", y="Tourist_Count", color="Tourist_Count",
+                                 color_continuous_scale=px.colors.sequential.Viridis_r)
+                bar_fig.update_layout(height=600, xaxis_tickangle=-45,
+                                       paper_bgcolor=BACKGROUND, plot_bgcolor=BACKGROUND,
+                                       font=dict(color=FONT_COLOR),
+                                       legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)))
+                return bar_fig
+            st.plotly_chart(cached_figure("glory_bar", selections, stats_version, build_bar), use_container_width=True)
+
+        elif display_mode == "State Map":
+            def build_map():
+                # Values, shares and colour classes are precomputed per stats version; one marker per state.
+                state_df = build_state_map(stats_version).frame(selected_year, selected_type)
+                peak = max(int(state_df["Tourist_Count"].max()), 1) if len(state_df) else 1
+                map_fig = go.Figure(go.Scattergeo(
+                    lat=state_df["Lat"], lon=state_df["Lon"], text=state_df["State"], mode="markers",
+                    customdata=state_df[["Tourist_Count", "Share"]],
+                    marker=dict(size=12 + 38 * (state_df["Tourist_Count"] / peak) ** 0.5,
+                                color=[CLASS_COLORS[c] for c in state_df["Class"]],
+                                line=dict(width=1, color="white"), opacity=0.9),
+                    hovertemplate="%{text}<br>%{customdata[0]:,} tourists (%{customdata[1]}%)<extra></extra>"
+                ))
+                map_fig.update_geos(lataxis_range=[INDIA_BBOX[0], INDIA_BBOX[2]],
+                                    lonaxis_range=[INDIA_BBOX[1], INDIA_BBOX[3]], **MAP_GEO)
+                map_fig.update_layout(height=700, margin=dict(l=0, r=0, t=10, b=10),
+                                      paper_bgcolor=BACKGROUND, font=dict(color=FONT_COLOR))
+                return map_fig
+            st.plotly_chart(cached_figure("glory_map", (selected_year, selected_type), stats_version, build_map),
+                            use_container_width=True)
+            unlocated = build_state_map(stats_version).unlocated
+            if unlocated:
+                st.caption(f"Not on the map (unknown location): {', '.join(unlocated)}")
 
         elif display_mode == "Table View":
-            df_display = df_melted.reset_index(drop=True)
-            df_display.index = df_display.index + 1
-            st.dataframe(df_display, use_container_width=True)
+            render_table_view(build_stats_table(stats_version), "glory_table", filter_columns=["Year", "Type", "State"])
 
 # =================== TRENDS OVER YEARS ===================
 elif view_mode == "Tourism Trends":
     st.subheader("📈 Tourism Trends")
 
-    selected_type = st.sidebar.selectbox("Select Type (DTV/FTV)", sorted(df_melted["Type"].unique()))
-    state_selection = st.multiselect("Select States", options=df_melted["State"].unique(), default=["Tamil Nadu", "Uttar Pradesh"])
+    selected_type = st.sidebar.selectbox("Select Type (DTV/FTV)", cube.types)
+    state_selection = st.multiselect("Select States", options=cube.states, default=["Tamil Nadu", "Uttar Pradesh"])
     forecast_enable = st.checkbox("Enable Forecast", value=False)
+    forecast_model = st.sidebar.selectbox("Forecast Model", ["Auto (best backtest)"] + get_batch_forecast().model_names) if forecast_enable else None
+    forecast_model = None if forecast_model == "Auto (best backtest)" else forecast_model
 
-    trend_df = df_melted[(df_melted["State"].isin(state_selection)) & (df_melted["Type"] == selected_type)]
-    trend_df["Year_int"] = trend_df["Year"].astype(int)
-    trend_df["Year_str"] = trend_df["Year"].astype(str)
-    bright_colors = px.colors.qualitative.Vivid
-
-    fig = go.Figure()
-    for idx, state in enumerate(state_selection):
-        state_df = trend_df[trend_df["State"] == state].sort_values("Year_int")
-        fig.add_trace(go.Scatter(
-            x=state_df["Year_str"], y=state_df["Tourist_Count"],
-            mode="lines+markers", name=f"{state} Actual",
-            marker=dict(size=8, color=bright_colors[idx % len(bright_colors)]),
-            line=dict(width=3, color=bright_colors[idx % len(bright_colors)])
-        ))
-
-        if forecast_enable and len(state_df) >= 2:
-            X = state_df["Year_int"].values.reshape(-1, 1)
-            y = state_df["Tourist_Count"].values
-            model = LinearRegression().fit(X, y)
-            future_years = np.array([state_df["Year_int"].max() + i for i in range(1, 4)]).reshape(-1, 1)
-            future_preds = model.predict(future_years)
-            min_floor = max(0.5 * min(y), 0)
-            forecast_values = [max(min_floor, int(val)) for val in future_preds]
-            forecast_years = [str(int(y)) for y in future_years.flatten()]
+    def build_trends():
+        bright_colors = px.colors.qualitative.Vivid
 
+        fig = go.Figure()
+        for idx, state in enumerate(state_selection):
+            years, counts = cube.state_series(state, selected_type)
             fig.add_trace(go.Scatter(
-                x=forecast_years, y=forecast_values,
-                mode="lines+markers", name=f"{state} Forecast",
-                marker=dict(size=8, symbol="circle-open", color=bright_colors[idx % len(bright_colors)]),
-                line=dict(width=2, color=bright_colors[idx % len(bright_colors)], dash="dash")
+                x=years.astype(str), y=counts,
+                mode="lines+markers", name=f"{state} Actual",
+                marker=dict(size=8, color=bright_colors[idx % len(bright_colors)]),
+                line=dict(width=3, color=bright_colors[idx % len(bright_colors)])
             ))
 
-    fig.update_layout(
-        title="Yearly Trends with Forecast",
-        xaxis=dict(title="Year", type="category"),
-        yaxis_title="Tourist Count",
-        plot_bgcolor=BACKGROUND, paper_bgcolor=BACKGROUND, font=dict(color=FONT_COLOR, size=16),
-        height=700,
-        legend=dict(bgcolor=LEGEND_BG, bordercolor='white', borderwidth=1, font=dict(color=FONT_COLOR))
-    )
-    st.plotly_chart(fig, use_container_width=True)
+            forecast = get_batch_forecast().forecast(state, selected_type, forecast_model) if forecast_enable else None
+            if forecast:
+                forecast_years, forecast_values, model_name = forecast
+                fig.add_trace(go.Scatter(
+                    x=forecast_years, y=forecast_values,
+                    mode="lines+markers", name=f"{state} Forecast ({model_name})",
+                    marker=dict(size=8, symbol="circle-open", color=bright_colors[idx % len(bright_colors)]),
+                    line=dict(width=2, color=bright_colors[idx % len(bright_colors)], dash="dash")
+                ))
+
+        fig.update_layout(
+            title="Yearly Trends with Forecast",
+            xaxis=dict(title="Year", type="category"),
+            yaxis_title="Tourist Count",
+            plot_bgcolor=BACKGROUND, paper_bgcolor=BACKGROUND, font=dict(color=FONT_COLOR, size=16),
+            height=700,
+            legend=dict(bgcolor=LEGEND_BG, bordercolor='white', borderwidth=1, font=dict(color=FONT_COLOR))
+        )
+        return fig
+
+    selections = (selected_type, tuple(state_selection), forecast_enable, forecast_model)
+    st.plotly_chart(cached_figure("trends", selections, stats_version, build_trends), use_container_width=True)
 
 # =================== BAR RACE ===================
 elif view_mode == "Tourism Race":
     st.subheader("🎯 Interactive Tourism Race Chart (with Year Slider)")
 
-    selected_type = st.sidebar.selectbox("Select Type (DTV/FTV)", sorted(df_melted["Type"].unique()))
-    race_df = df_melted[df_melted["Type"] == selected_type]
-
-    available_years = sorted(race_df["Year"].unique())
-    selected_year = st.slider("Select Year:", min_value=min(available_years), max_value=max(available_years), value=min(available_years), step=1)
-
-    filtered_df = race_df[race_df["Year"] == selected_year].sort_values(by="Tourist_Count", ascending=False)
-
-    dynamic_height = 700
-
-    bar_fig = px.bar(
-        filtered_df,
-        x="State",
-        y="Tourist_Count",
-        color="Tourist_Count",
-        color_continuous_scale=px.colors.sequential.Plasma
-    )
-
-    bar_fig.update_layout(
-        height=dynamic_height,
-        plot_bgcolor=BACKGROUND,
-        paper_bgcolor=BACKGROUND,
-        font=dict(color=FONT_COLOR, size=16),
-        margin=dict(l=50, r=50, t=50, b=200),
-        legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)),
-        xaxis=dict(tickangle=-45, tickfont=dict(size=14)),
-        yaxis=dict(tickfont=dict(size=14)),
-        title=f"Tourism Data for {selected_year}"
-    )
-
-    st.plotly_chart(bar_fig, use_container_width=True)
+    selected_type = st.sidebar.selectbox("Select Type (DTV/FTV)", cube.types)
+    st.plotly_chart(build_race_figure(stats_version, selected_type), use_container_width=True)
 
 
 # =================== FULL DATASET EXPLORER ===================
 elif view_mode == "India Tour stat":
     st.subheader("📑 India Tour stat")
-    explorer_option = st.sidebar.radio("Select Explorer Mode", ["Table View", "Total Bar Chart (DTV/FTV per State)", "State-wise Yearly Drilldown"])
+    explorer_option = st.sidebar.radio("Select Explorer Mode", ["Table View", "Total Bar Chart (DTV/FTV per State)", "State-wise Yearly Drilldown", "Forecast All States"])
 
     if explorer_option == "Table View":
-        df_display = df_melted.reset_index(drop=True)
-        styler = df_display.style.background_gradient(cmap="Blues", subset=["Tourist_Count"]).format({"Tourist_Count": "{:,}"})
-        st.dataframe(styler, use_container_width=True, hide_index=True)
+        render_table_view(build_stats_table(stats_version), "explorer_table", filter_columns=["Year", "Type", "State"],
+                          gradient=["Tourist_Count"], formats={"Tourist_Count": "{:,}"})
 
     elif explorer_option == "Total Bar Chart (DTV/FTV per State)":
-        selected_type = st.sidebar.selectbox("Select Tourist Type:", sorted(df_melted["Type"].unique()))
-        total_agg = df_melted.groupby(["Type", "State"]).sum().reset_index()
-        type_df = total_agg[total_agg["Type"] == selected_type].sort_values(by="Tourist_Count", ascending=False)
-
-        fig = px.bar(type_df, x="State", y="Tourist_Count", color="Tourist_Count", color_continuous_scale=px.colors.sequential.Plasma)
-        fig.update_layout(xaxis_tickangle=-45, height=600,
-                          plot_bgcolor=BACKGROUND, paper_bgcolor=BACKGROUND,
-                          font=dict(color=FONT_COLOR),
-                          legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)))
-        st.plotly_chart(fig, use_container_width=True)
+        selected_type = st.sidebar.selectbox("Select Tourist Type:", cube.types)
+
+        def build_totals():
+            type_df = cube.totals_frame(selected_type)
+            fig = px.bar(type_df, x="State", y="Tourist_Count", color="Tourist_Count", color_continuous_scale=px.colors.sequential.Plasma)
+            fig.update_layout(xaxis_tickangle=-45, height=600,
+                              plot_bgcolor=BACKGROUND, paper_bgcolor=BACKGROUND,
+                              font=dict(color=FONT_COLOR),
+                              legend=dict(bgcolor=LEGEND_BG, font=dict(color=FONT_COLOR)))
+            return fig
+        st.plotly_chart(cached_figure("state_totals", (selected_type,), stats_version, build_totals), use_container_width=True)
 
     elif explorer_option == "State-wise Yearly Drilldown":
-        drilldown_state = st.sidebar.selectbox("Select State", sorted(df_melted["State"].unique()))
-        drilldown_type = st.sidebar.selectbox("Select Type (DTV/FTV)", sorted(df_melted["Type"].unique()))
-        drill_df = df_melted[(df_melted["State"] == drilldown_state) & (df_melted["Type"] == drilldown_type)].sort_values("Year")
-        drill_df["Year_int"] = drill_df["Year"].astype(int)
-        drill_df["Year"] = drill_df["Year_int"].astype(str)
+        drilldown_state = st.sidebar.selectbox("Select State", cube.states)
+        drilldown_type = st.sidebar.selectbox("Select Type (DTV/FTV)", cube.types)
 
         col1, col2 = st.columns([3, 1])
         forecast_enable = col2.checkbox("Enable Forecast", value=False)
+        forecast = get_batch_forecast().forecast(drilldown_state, drilldown_type) if forecast_enable else None
+        if forecast:
+            forecast_years, forecast_values, model_name = forecast
 
-        with col1:
+        def build_drilldown():
+            drill_years, drill_counts = cube.state_series(drilldown_state, drilldown_type)
             fig = go.Figure()
-            fig.add_trace(go.Scatter(x=drill_df["Year"], y=drill_df["Tourist_Count"], mode="lines+markers", name="Actual",
+            fig.add_trace(go.Scatter(x=drill_years.astype(str), y=drill_counts, mode="lines+markers", name="Actual",
                                       line=dict(color="#FF7F0E", width=3), marker=dict(size=8)))
 
-            if forecast_enable and len(drill_df) >= 2:
-                X = drill_df["Year_int"].values.reshape(-1, 1)
-                y = drill_df["Tourist_Count"].values
-                model = LinearRegression().fit(X, y)
-                future_years = np.array([drill_df["Year_int"].max() + i for i in range(1, 4)]).reshape(-1, 1)
-                future_preds = model.predict(future_years)
-                min_floor = max(0, min(y) * 0.5)
-                forecast_values = [max(min_floor, int(val)) for val in future_preds]
-                forecast_years = [str(int(y)) for y in future_years.flatten()]
-
+            if forecast:
                 fig.add_trace(go.Scatter(
                     x=forecast_years, y=forecast_values,
-                    mode="lines+markers", name="Forecast",
+                    mode="lines+markers", name=f"Forecast ({model_name})",
                     line=dict(color="cyan", dash="dash"), marker=dict(size=8)))
 
             fig.update_layout(
@@ -273,12 +296,27 @@ elif view_mode == "India Tour stat":
                 plot_bgcolor=BACKGROUND, paper_bgcolor=BACKGROUND, font=dict(color=FONT_COLOR),
                 height=600, legend=dict(bgcolor=LEGEND_BG, bordercolor='white', borderwidth=1, font=dict(color=FONT_COLOR))
             )
-            st.plotly_chart(fig, use_container_width=True)
+            return fig
+
+        with col1:
+            selections = (drilldown_state, drilldown_type, forecast_enable)
+            st.plotly_chart(cached_figure("drilldown", selections, stats_version, build_drilldown), use_container_width=True)
 
         with col2:
-            if forecast_enable and forecast_years:
+            if forecast:
                 forecast_df = pd.DataFrame({"Forecast Year": forecast_years, "Forecast Count": [f"{val:,}" for val in forecast_values]})
                 st.subheader("📈 Forecasted Values")
+                st.caption(f"Model: {model_name}")
                 st.table(forecast_df)
             elif forecast_enable:
                 st.warning("Not enough data for forecasting!")
+
+    elif explorer_option == "Forecast All States":
+        forecast_type = st.sidebar.selectbox("Select Type (DTV/FTV)", cube.types)
+        with stage("forecast"):
+            batch_forecast = get_batch_forecast()
+        st.dataframe(batch_forecast.table(forecast_type), use_container_width=True, hide_index=True)
+        with st.expander("Backtest scores per model (rolling-origin sMAPE %)"):
+            st.dataframe(batch_forecast.score_table(forecast_type), use_container_width=True, hide_index=True)
+
+end_run()
@@ -4,11 +4,14 @@ import random
 import base64
 import streamlit.components.v1 as components
 from utils.common_css import add_logo
+from utils.gallery import encode_image, ensure_state_and_place, list_images, list_places, list_states
+from utils.perf import begin_run, end_run, payload, stage
 
 # ------------------ CONFIGURATION ------------------
-BASE_PATH = "data/Places"
 st.set_page_config(page_title="Indian Cultural Heritage", layout="wide")
+begin_run("Indian Heritage")
 add_logo("data/BGs/logo_app.png")
+@stage("background")
 def local_image_to_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
@@ -16,7 +19,7 @@ def local_image_to_base64(path):
 bg_path = "data/BGs/heritage.jpeg"
 bg_base64 = local_image_to_base64(bg_path)
 # Main app background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     .stApp {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -27,10 +30,10 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # Sidebar background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     section[data-testid="stSidebar"] {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.85), rgba(0,0,0,0.85)), 
@@ -40,49 +43,8 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
-
-# ------------------ UTILITY FUNCTIONS ------------------
-def ensure_folder(path):
-    if not os.path.exists(path):
-        os.makedirs(path)
-    return path
-
-def list_states():
-    if not os.path.exists(BASE_PATH):
-        return []
-    return sorted([d for d in os.listdir(BASE_PATH) if os.path.isdir(os.path.join(BASE_PATH, d))])
-
-def list_places(state):
-    state_path = os.path.join(BASE_PATH, state)
-    if not os.path.exists(state_path):
-        return []
-    return sorted([d for d in os.listdir(state_path) if os.path.isdir(os.path.join(state_path, d))])
-
-def list_images(state, place=None):
-    images = []
-    if place:
-        folder_path = os.path.join(BASE_PATH, state, place)
-        if os.path.exists(folder_path):
-            images = [os.path.join(folder_path, img) for img in os.listdir(folder_path) if img.lower().endswith(('.jpg', '.jpeg', '.png'))]
-    else:
-        state_path = os.path.join(BASE_PATH, state)
-        for place_folder in os.listdir(state_path):
-            place_path = os.path.join(state_path, place_folder)
-            if os.path.isdir(place_path):
-                imgs = [os.path.join(place_path, img) for img in os.listdir(place_path) if img.lower().endswith(('.jpg', '.jpeg', '.png'))]
-                images.extend(imgs)
-    return images
-
-def ensure_state_and_place(state, place):
-    state_path = ensure_folder(os.path.join(BASE_PATH, state))
-    place_path = ensure_folder(os.path.join(state_path, place))
-    return place_path
-
-def encode_image(img_path):
-    with open(img_path, "rb") as img_file:
-        encoded = base64.b64encode(img_file.read()).decode()
-    return f"data:image/jpeg;base64,{encoded}"
+"""), unsafe_allow_html=True)
+
 st.markdown("<h1 style='text-align:center;color:#FFD700;'>🇮🇳 Indian Cultural Heritage</h1>", unsafe_allow_html=True)
 
 
@@ -101,7 +63,8 @@ if mode == "📊 View Heritage Gallery":
         places = list_places(selected_state)
         place_selected = st.selectbox("Select Place (optional)", ["All Places"] + places)
 
-        images = list_images(selected_state) if place_selected == "All Places" else list_images(selected_state, place_selected)
+        with stage("list images"):
+            images = list_images(selected_state) if place_selected == "All Places" else list_images(selected_state, place_selected)
 
         if not images:
             st.warning("⚠️ No images found for this selection.")
@@ -112,9 +75,10 @@ if mode == "📊 View Heritage Gallery":
             # -------- SMOOTH SLIDER GALLERY --------
             if gallery_type == "Smooth Horizontal Slider":
                 slides = ""
-                for img_path in sample_imgs:
-                    img_data = encode_image(img_path)
-                    slides += f"<div class='swiper-slide'><img src='{img_data}'></div>"
+                with stage("gallery"):
+                    for img_path in sample_imgs:
+                        img_data = encode_image(img_path)
+                        slides += f"<div class='swiper-slide'><img src='{img_data}'></div>"
 
                 html_code = f"""
                 <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/swiper@9/swiper-bundle.min.css" />
@@ -158,7 +122,7 @@ if mode == "📊 View Heritage Gallery":
                 </script>
                 """
 
-                components.html(html_code, height=600)
+                components.html(payload(html_code), height=600)
 
             # -------- INTERACTIVE FULLSCREEN ZOOM GALLERY --------
             else:
@@ -178,9 +142,10 @@ if mode == "📊 View Heritage Gallery":
                 <div class="gallery">
                 """
 
-                for img_path in sample_imgs:
-                    img_data = encode_image(img_path)
-                    html_code += f"<img src='{img_data}' onclick='openLightbox(\"{img_data}\")'>"
+                with stage("gallery"):
+                    for img_path in sample_imgs:
+                        img_data = encode_image(img_path)
+                        html_code += f"<img src='{img_data}' onclick='openLightbox(\"{img_data}\")'>"
 
                 html_code += """
                 </div>
@@ -212,7 +177,7 @@ if mode == "📊 View Heritage Gallery":
                 </script>
                 """
 
-                components.html(html_code, height=800)
+                components.html(payload(html_code), height=800)
 
 # ------------------ UPLOAD SECTION ------------------
 elif mode == "🚀 Upload New Images":
@@ -242,3 +207,5 @@ elif mode == "🚀 Upload New Images":
                 with open(file_path, "wb") as f:
                     f.write(file.read())
             st.success(f"{len(uploaded_files)} images uploaded to {selected_state}/{selected_place} successfully!")
+
+end_run()
@@ -1,28 +1,45 @@
 import streamlit as st
-import pandas as pd
-import os
 import re
-import time
+import html
 import base64
+import numpy as np
+from utils import data_loaders
 from utils.common_css import add_logo
-
-# ========== PATH SETUP ==========
-feedback_path = "data/user_feedback.csv"
-places_path = "data/Top_Indian_Places_to_Visit.csv"
-
-# Initialize feedback file if not present
-if not os.path.exists(feedback_path):
-    pd.DataFrame(columns=["Rating", "Location", "Title", "Reviews"]).to_csv(feedback_path, index=False)
-
-# Load datasets
-places_df = pd.read_csv(places_path)
-feedback_df = pd.read_csv(feedback_path)
+from utils.catalog import get_catalog
+from utils.incremental_search import session_search
+from utils.table_view import page_caption, page_control
+from utils.review_index import RATING_BIN_WIDTH, get_review_index
+from utils.pattern_search import PATTERN_TIMEOUT, PatternTimeout, get_pattern_searcher
+from utils.perf import begin_run, end_run, payload, stage
+
+# ========== CONSTANTS ==========
+SEARCH_COLUMNS = ["Name", "State", "City", "Type", "Significance"]
+RESULTS_PAGE_SIZE = 10
+SORT_OPTIONS = {
+    "Rating": "Google_Review_Rating",
+    "Review Count": "Number_Of_Google_Review_In_Lakhs",
+    "Entrance Fee": "Entrance_Fee_In_Inr",
+    "Name": "Name",
+}
+TICKER_BATCH = 20       # feedback entries sent to the browser per cycle
+TICKER_SECONDS = 3      # seconds each entry stays on screen
+
+begin_run("Tourist Reviews")
 
 # ========== PAGE CONFIG ==========
 st.set_page_config(page_title="CultureFlow - Tourist Reviews", layout="wide")
 add_logo("data/BGs/logo_app.png")
 
+# Load datasets (shared, read-only catalog)
+with stage("load data"):
+    catalog = get_catalog()
+    places_df = catalog.places
+    places_haystack = catalog.haystack(SEARCH_COLUMNS)
+    places_view = catalog.view
+    feedback_df = data_loaders.load_feedback()
+
 # Load background
+@stage("background")
 def local_image_to_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
@@ -31,7 +48,7 @@ bg_path = "data/BGs/reviewes.jpg"
 bg_base64 = local_image_to_base64(bg_path)
 
 # Global background & sidebar
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     .stApp {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.7), rgba(0,0,0,0.9)), url("data:image/jpg;base64,{bg_base64}");
@@ -44,7 +61,7 @@ st.markdown(f"""
         background: rgba(0,0,0,0.92);
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # ======= CUSTOM STYLING =========
 st.markdown("""
@@ -64,18 +81,25 @@ with st.container():
                                   key="search_input", label_visibility="collapsed",
                                   placeholder="🔍 Type anything to search...",
                                   help="Search across all fields").strip()
-
-# Filter data based on query
-filtered_df = places_df.copy()
-if search_query:
-    pattern = re.compile(search_query, re.IGNORECASE)
-    filtered_df = filtered_df[
-        filtered_df["Name"].str.contains(pattern) |
-        filtered_df["State"].str.contains(pattern) |
-        filtered_df["City"].str.contains(pattern) |
-        filtered_df["Type"].str.contains(pattern) |
-        filtered_df["Significance"].str.contains(pattern)
-    ]
+    pattern_mode = st.toggle("Pattern mode (regular expressions)", key="search_pattern_mode",
+                             help=f"Match a regular expression instead of plain text; stopped after {PATTERN_TIMEOUT}s")
+
+# Filter data: plain text is matched literally; patterns run time-bounded in a worker process
+filtered_df = places_df
+with stage("search"):
+    if search_query and pattern_mode:
+        try:
+            matches = get_pattern_searcher().matches(places_haystack, search_query, key=("reviews", catalog.generation))
+            filtered_df = places_df.loc[matches.index]
+        except re.error as e:
+            st.error(f"❌ Invalid pattern: {e}")
+            filtered_df = places_df.iloc[:0]
+        except PatternTimeout as e:
+            st.warning(f"⏱️ {e}. Try a simpler pattern.")
+            filtered_df = places_df.iloc[:0]
+    elif search_query:
+        matches = session_search("reviews_searcher", places_haystack).matches(search_query)
+        filtered_df = places_df.loc[matches.index]
 
 # ========== SIDEBAR FILTERS ===========
 with st.sidebar:
@@ -92,47 +116,119 @@ with st.sidebar:
         filtered_df = filtered_df[filtered_df['Significance'] == significance_filter]
 
     min_rating = st.slider("Minimum Google Review Rating", 0.0, 5.0, 4.0, 0.1)
-    filtered_df = filtered_df[filtered_df["Google review rating"] >= min_rating]
+    filtered_df = filtered_df[filtered_df["Google_Review_Rating"] >= min_rating]
+
+# ========== REVIEW SUMMARIES ===========
+def review_summary_html(reviews):
+    """Visitor feedback summary for one place from the shared review index."""
+    mean = f"{reviews.mean_rating:.0f}/100" if reviews.mean_rating is not None else "—"
+    mood = "😊 Positive" if reviews.mean_sentiment > 0.2 else "😞 Negative" if reviews.mean_sentiment < -0.2 else "😐 Mixed"
+    bars = " ".join(f"{lo + 1}-{lo + RATING_BIN_WIDTH}: {n}" for lo, n in zip(range(0, 100, RATING_BIN_WIDTH), reviews.histogram))
+    keywords = ", ".join(html.escape(k) for k in reviews.top_keywords())
+    recent = "".join(f"<li><b>{html.escape(r['title'])}</b> ({r['rating'] if r['rating'] is not None else '—'}/100): "
+                     f"{html.escape(r['review'])}</li>" for r in reversed(reviews.recent))
+    return f"""
+    <div style='font-size:18px; border-top:1px solid #FFD70055; padding-top:8px'>
+        <b>💬 Visitor Feedback:</b> {reviews.count} review(s)  |  <b>Avg:</b> {mean}  |  <b>Mood:</b> {mood}<br>
+        <small><b>Ratings:</b> {bars}</small><br>
+        {f"<small><b>Keywords:</b> {keywords}</small>" if keywords else ""}
+        <ul style='font-size:16px'>{recent}</ul>
+    </div>
+    """
 
 # ========== MAIN RESULTS ===========
 st.markdown("## 🎯 Search Results")
 
 if not filtered_df.empty:
-    for _, row in filtered_df.iterrows():
+    sort_col, order_col = st.columns([3, 1])
+    sort_by = sort_col.selectbox("Sort results by", list(SORT_OPTIONS), key="results_sort")
+    ascending = order_col.radio("Order", ["High → Low", "Low → High"], horizontal=True, key="results_order") == "Low → High"
+
+    # Cached per-column sort order restricted to the matches; only the current page is rendered.
+    positions = places_view.restrict(places_view.order(SORT_OPTIONS[sort_by], ascending), filtered_df.index)
+    page = page_control(len(positions), RESULTS_PAGE_SIZE, "results")
+    st.caption(page_caption(len(positions), page, RESULTS_PAGE_SIZE, "places"))
+
+    with stage("review index"):
+        review_index = get_review_index()
+    for row in places_view.page(positions, page, RESULTS_PAGE_SIZE).to_dict("records"):
         with st.expander(f"📍 {row['Name']} — {row['City']}, {row['State']}", expanded=False):
             st.markdown(f"<span style='font-size:20px'><b>Type:</b> {row['Type']}  |  <b>Significance:</b> {row['Significance']}</span>", unsafe_allow_html=True)
-            st.markdown(f"<span style='font-size:20px'><b>Rating:</b> ⭐ {row['Google review rating']}  |  <b>Fee:</b> ₹ {row['Entrance Fee in INR']}</span>", unsafe_allow_html=True)
-            st.markdown(f"<span style='font-size:20px'><b>DSLR Allowed:</b> {row['DSLR Allowed']}  |  <b>Best Time:</b> {row['Best Time to visit']}</span>", unsafe_allow_html=True)
+            st.markdown(f"<span style='font-size:20px'><b>Rating:</b> ⭐ {row['Google_Review_Rating']}  |  <b>Fee:</b> ₹ {row['Entrance_Fee_In_Inr']}</span>", unsafe_allow_html=True)
+            st.markdown(f"<span style='font-size:20px'><b>DSLR Allowed:</b> {row['Dslr_Allowed']}  |  <b>Best Time:</b> {row['Best_Time_To_Visit']}</span>", unsafe_allow_html=True)
+            reviews = review_index.summary(row["Name"], row["State"])
+            if reviews is not None:
+                st.markdown(payload(review_summary_html(reviews)), unsafe_allow_html=True)
 else:
     st.warning("❌ No matching results found. Try modifying your search or filters.")
 
 # ========== FLOATING FEEDBACK BANNER ===========
+@stage("feedback ticker")
+def ticker_html(batch):
+    """Fixed-position banner that cycles through batch with CSS animations, entirely in the browser."""
+    cycle = len(batch) * TICKER_SECONDS
+    show = 100 / len(batch)
+    fade = min(show / 4, 100 * 0.4 / cycle)
+    items = "".join(f"""
+        <div class="feedback-ticker-item" style="animation-delay:{i * TICKER_SECONDS}s">
+            <h5>📍 {html.escape(str(row.Location))} — <small>{html.escape(str(row.Title))}</small></h5>
+            ⭐ Rating: {html.escape(str(row.Rating))}/100
+            <p>{html.escape(str(row.Reviews))}</p>
+        </div>""" for i, row in enumerate(batch.itertuples(index=False)))
+    return f"""
+    <style>
+    .feedback-ticker {{
+        position: fixed;
+        bottom: 20px;
+        right: 20px;
+        width: 450px;
+        z-index: 9999;
+    }}
+    .feedback-ticker-item {{
+        position: absolute;
+        bottom: 0;
+        right: 0;
+        width: 100%;
+        background-color: rgba(0,0,0,0.92);
+        color: #FFD700;
+        padding: 20px;
+        border-radius: 12px;
+        box-shadow: 2px 2px 12px rgba(0,0,0,0.8);
+        font-size: 17px;
+        opacity: 0;
+        animation: feedback-ticker {cycle}s linear infinite both;
+    }}
+    @keyframes feedback-ticker {{
+        0% {{ opacity: 0; }}
+        {fade:.3f}% {{ opacity: 1; }}
+        {show - fade:.3f}% {{ opacity: 1; }}
+        {show:.3f}% {{ opacity: 0; }}
+        100% {{ opacity: 0; }}
+    }}
+    </style>
+    <div class="feedback-ticker">{items}</div>
+    """
+
+
+@st.experimental_fragment(run_every=TICKER_BATCH * TICKER_SECONDS)
+def feedback_ticker():
+    """Send the next batch of a per-session shuffle once per cycle; only this fragment reruns."""
+    feedback_df = data_loaders.load_feedback()
+    order = st.session_state.get("ticker_order")
+    if order is None or len(order) != len(feedback_df):
+        order = np.random.default_rng().permutation(len(feedback_df))
+        st.session_state["ticker_order"] = order
+        st.session_state["ticker_offset"] = 0
+    offset = st.session_state["ticker_offset"]
+    batch = feedback_df.iloc[order[offset:offset + TICKER_BATCH]]
+    st.session_state["ticker_offset"] = 0 if offset + TICKER_BATCH >= len(order) else offset + TICKER_BATCH
+    st.markdown(payload(ticker_html(batch)), unsafe_allow_html=True)
+
+
 if not feedback_df.empty:
     st.divider()
-    placeholder = st.empty()
-
-    for _ in range(len(feedback_df)):
-        row = feedback_df.sample(1).iloc[0]
-        feedback_html = f"""
-        <div style="
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            background-color: rgba(0,0,0,0.92);
-            color: #FFD700;
-            padding: 20px;
-            border-radius: 12px;
-            box-shadow: 2px 2px 12px rgba(0,0,0,0.8);
-            max-width: 450px;
-            z-index: 9999;
-            font-size: 17px;">
-            <h5>📍 {row['Location']} — <small>{row['Title']}</small></h5>
-            ⭐ Rating: {row['Rating']}/100
-            <p>{row['Reviews']}</p>
-        </div>
-        """
-        placeholder.markdown(feedback_html, unsafe_allow_html=True)
-        time.sleep(3)
-        placeholder.empty()
+    feedback_ticker()
 else:
     st.warning("No user feedback available yet.")
+
+end_run()
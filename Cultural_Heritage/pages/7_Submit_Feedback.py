@@ -1,12 +1,18 @@
 import streamlit as st
 import pandas as pd
-import os
 import base64
 from utils import data_loaders
+from utils.catalog import get_catalog
+from utils.stats_cube import get_stats_cube
+from utils.bulk_import import READERS, read_upload, validate
 from utils.common_css import add_logo
+from utils.perf import begin_run, end_run, payload, stage
+
+begin_run("Submit Feedback")
 
 st.markdown("<h1 style='text-align:center;color:#FFD700;'>📝 Submit New Cultural Data</h1>", unsafe_allow_html=True)
 add_logo("data/BGs/logo_app.png")
+@stage("background")
 def local_image_to_base64(path):
     with open(path, "rb") as f:
         return base64.b64encode(f.read()).decode()
@@ -15,7 +21,7 @@ bg_path = "data/BGs/feedback.jpg"
 bg_base64 = local_image_to_base64(bg_path)
 
 # Main app background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     .stApp {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.6), rgba(0,0,0,0.7)), 
@@ -26,10 +32,10 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 # Sidebar background
-st.markdown(f"""
+st.markdown(payload(f"""
     <style>
     section[data-testid="stSidebar"] {{
         background: linear-gradient(to bottom, rgba(0,0,0,0.85), rgba(0,0,0,0.85)), 
@@ -39,11 +45,11 @@ st.markdown(f"""
         background-size: cover;
     }}
     </style>
-""", unsafe_allow_html=True)
+"""), unsafe_allow_html=True)
 
 
 category = st.selectbox("Select Dataset to Add To",
-    ["Monument/Place Information", "Tourist Stats", "Unified Feedback"])
+    ["Monument/Place Information", "Tourist Stats", "Unified Feedback", "Bulk Import"])
 
 # ----- Helpers -----
 def load_dropdown_options(series):
@@ -62,7 +68,7 @@ def smart_input(label, options):
 if category == "Monument/Place Information":
     st.header("🕌 Add or Update Monument Entry")
 
-    places_df = data_loaders.load_places()
+    places_df = get_catalog().places
 
     monument_list = load_dropdown_options(places_df["Name"])
     state_list = load_dropdown_options(places_df["State"])
@@ -113,36 +119,20 @@ if category == "Monument/Place Information":
             "Image": image_name
         }
 
-        # Duplicate check based on Name + State
-        duplicate_check = places_df[
-            (places_df["Name"].str.lower() == monument.lower()) &
-            (places_df["State"].str.lower() == state.lower())
-        ]
-
-        if not duplicate_check.empty:
-            idx = duplicate_check.index[0]
-            for col, val in new_entry.items():
-                places_df.at[idx, col] = val
+        # Keyed upsert on the normalized (Name, State) index; only this row is written.
+        existing = data_loaders.find_place(monument, state)
+        data_loaders.upsert_places(pd.DataFrame([new_entry]))
+        if existing is not None:
             st.success("✅ Existing monument updated successfully!")
         else:
-            places_df = pd.concat([places_df, pd.DataFrame([new_entry])], ignore_index=True)
             st.success("✅ New monument added successfully!")
-
-        # Save updated data
-        file_path = "data/Top_Indian_Places_to_Visit.csv"
-        places_df.to_csv(file_path, index=False)
         st.balloons()
 
 # ----- Tourist Stats -----
 elif category == "Tourist Stats":
     st.header("➕ Add Tourist Statistics")
 
-    tourist_stats_path = "data/tourist_stats.csv"
-    tourist_df = pd.read_csv(tourist_stats_path)
-
-    state_list = list(tourist_df.columns)
-    state_list.remove("Year")
-    state_list.remove("Type")
+    state_list = get_stats_cube().states
 
     year = st.number_input("Year", min_value=2000, max_value=2100, value=2024, step=1)
     visitor_type = st.selectbox("Visitor Type", ["DTV", "FTV"])
@@ -150,31 +140,16 @@ elif category == "Tourist Stats":
     tourists = st.number_input("Tourist Count", min_value=0, step=1)
 
     if st.button("Submit Tourist Stats"):
-        mask = (tourist_df["Year"] == year) & (tourist_df["Type"] == visitor_type)
-
-        if mask.any():
-            idx = tourist_df[mask].index[0]
-            tourist_df.loc[idx, state] += tourists
-        else:
-            new_row = {"Year": year, "Type": visitor_type}
-            for s in state_list:
-                new_row[s] = tourists if s == state else 0
-            new_row["Total"] = tourists
-            tourist_df = pd.concat([tourist_df, pd.DataFrame([new_row])], ignore_index=True)
-
-        tourist_df["Total"] = tourist_df[state_list].sum(axis=1)
-        tourist_df.to_csv(tourist_stats_path, index=False)
+        # Upserts the one Year/Type/State row and its Year/Type total; nothing else is rewritten.
+        data_loaders.add_tourist_stats(pd.DataFrame([{
+            "Year": int(year), "Type": visitor_type, "State": state, "Tourist_Count": int(tourists)
+        }]))
         st.success("✅ Tourist statistics updated successfully!")
 
 # ----- Unified Feedback -----
 elif category == "Unified Feedback":
     st.header("📋 Submit Unified Feedback")
 
-    feedback_path = "data/user_feedback.csv"
-
-    if not os.path.exists(feedback_path):
-        pd.DataFrame(columns=["Rating", "Location", "Title", "Reviews"]).to_csv(feedback_path, index=False)
-
     rating = st.slider("Rating (1-100)", 1, 100)
     location = st.text_input("Location / Place / Attraction Name")
     title = st.text_input("Describe Place in One Word")
@@ -188,8 +163,56 @@ elif category == "Unified Feedback":
             "Reviews": review.strip()
         }
 
-        feedback_df = pd.read_csv(feedback_path)
-        feedback_df = pd.concat([feedback_df, pd.DataFrame([new_feedback])], ignore_index=True)
-        feedback_df.to_csv(feedback_path, index=False)
+        try:
+            data_loaders.append_feedback(pd.DataFrame([new_feedback]))
+        except TimeoutError:
+            st.error("❌ The server is busy and your feedback was not saved. Please submit it again.")
+        except Exception as e:
+            st.error(f"❌ Your feedback could not be saved ({e}). Please try again in a moment.")
+        else:
+            st.success(f"✅ Feedback for {location} submitted successfully!")
 
-        st.success(f"✅ Feedback for {location} submitted successfully!")
+# ----- Bulk Import -----
+elif category == "Bulk Import":
+    st.header("📦 Bulk Import from File")
+
+    target = st.radio("Dataset", ["Tourist Stats", "Monuments"], horizontal=True)
+    table = "tourist_stats" if target == "Tourist Stats" else "places"
+    if table == "tourist_stats":
+        st.caption("Long format (Year, Type, State, Tourist Count) or the wide layout with one column per state.")
+        add_counts = st.radio("Existing Year/Type/State rows", ["Replace count", "Add to count"], horizontal=True) == "Add to count"
+    else:
+        st.caption("One monument per row with the same columns as the places dataset; Name + State identify a monument. "
+                   "Columns left out of the file keep their stored values.")
+
+    upload = st.file_uploader("Upload CSV, Parquet or Excel", type=[ext.lstrip(".") for ext in READERS])
+
+    if upload is not None:
+        try:
+            with stage("validate import"):
+                accepted, rejected = validate(table, read_upload(upload))
+        except (ValueError, ImportError) as e:
+            st.error(f"❌ Could not read {upload.name}: {e}")
+            st.stop()
+
+        col1, col2 = st.columns(2)
+        col1.metric("Rows ready to import", f"{len(accepted):,}")
+        col2.metric("Rows rejected", f"{len(rejected):,}")
+        st.dataframe(accepted.head(100), use_container_width=True)
+
+        if not rejected.empty:
+            with st.expander(f"⚠️ {len(rejected):,} rejected rows"):
+                st.dataframe(rejected, use_container_width=True)
+                st.download_button("Download rejected rows", rejected.to_csv(index=False),
+                                   file_name=f"rejected_{upload.name.rsplit('.', 1)[0]}.csv", mime="text/csv")
+
+        if st.button("Import", disabled=accepted.empty):
+            if table == "places":
+                data_loaders.upsert_places(accepted, partial=True)
+            elif add_counts:
+                data_loaders.add_tourist_stats(accepted)
+            else:
+                data_loaders.set_tourist_stats(accepted)
+            st.success(f"✅ Imported {len(accepted):,} rows into {target}.")
+
+end_run()
@@ -0,0 +1,80 @@
+import hmac
+import os
+
+import streamlit as st
+from utils.catalog import get_memory_report
+from utils.common_css import add_logo
+from utils.perf import LOG_ENV, RERUN, memory_tracking, perf_store, set_memory_tracking
+
+ADMIN_ENV = "PERF_ADMIN_TOKEN"      # token that unlocks the process-wide controls below
+
+st.set_page_config(page_title="Performance", layout="wide")
+add_logo("data/BGs/logo_app.png")
+
+st.markdown("<h1 style='text-align:center;color:#FFD700;'>⏱️ Page Performance</h1>", unsafe_allow_html=True)
+st.markdown("<p style='text-align:center;color:#FFEEAA;'>Per-stage timings of recent page reruns in this server process</p>", unsafe_allow_html=True)
+
+# ---------- ACCESS ----------
+def admin_token():
+    """Token that unlocks the controls, from st.secrets['perf_admin_token'] or PERF_ADMIN_TOKEN, if set."""
+    try:
+        if "perf_admin_token" in st.secrets:
+            return str(st.secrets["perf_admin_token"])
+    except Exception:
+        pass
+    return os.environ.get(ADMIN_ENV) or None
+
+
+# Memory tracking and clearing affect every session in the process, so they need the token;
+# without one configured the page is read-only for everybody.
+token = admin_token()
+if token and not st.session_state.get("perf_admin"):
+    entered = st.sidebar.text_input("Admin token", type="password")
+    if entered and hmac.compare_digest(entered.encode(), token.encode()):
+        st.session_state["perf_admin"] = True
+is_admin = bool(token) and st.session_state.get("perf_admin", False)
+
+# ---------- CONTROLS ----------
+with st.sidebar:
+    st.header("⚙️ Instrumentation")
+    if is_admin:
+        track_memory = st.toggle("Track peak memory", value=memory_tracking(),
+                                 help="Uses tracemalloc, which slows allocation-heavy code while it is on")
+        set_memory_tracking(track_memory)
+        if st.button("🗑️ Clear samples"):
+            perf_store.clear()
+    else:
+        st.caption(f"Peak memory tracking is {'on' if memory_tracking() else 'off'}. "
+                   + ("Enter the admin token to change it or clear samples." if token else
+                      f"Set {ADMIN_ENV} (or perf_admin_token in secrets) to enable the controls."))
+    st.download_button("⬇️ Export samples (JSON lines)", perf_store.to_jsonl(),
+                       file_name="perf_samples.jsonl", mime="application/x-ndjson")
+    if perf_store.log_path:
+        st.caption(f"Also logging every sample to {perf_store.log_path}")
+    else:
+        st.caption(f"Set {LOG_ENV}=<file> before starting the app to also log every sample there.")
+
+# ---------- SUMMARY ----------
+summary = perf_store.summary()
+if summary.empty:
+    st.info("No samples yet. Open a few pages, then come back here.")
+else:
+    pages = sorted(summary["Page"].unique())
+    selected_pages = st.multiselect("Pages", pages, default=pages)
+    summary = summary[summary["Page"].isin(selected_pages)]
+    reruns = summary[summary["Stage"] == RERUN].drop(columns="Stage")
+    stages = summary[summary["Stage"] != RERUN].sort_values("p90 ms", ascending=False)
+
+    st.subheader("🔁 Whole reruns")
+    st.dataframe(reruns, use_container_width=True, hide_index=True)
+    if not reruns.empty:
+        st.bar_chart(reruns.set_index("Page")[["p50 ms", "p90 ms", "p99 ms"]])
+
+    st.subheader("🧩 Stages (slowest p90 first)")
+    st.dataframe(stages, use_container_width=True, hide_index=True)
+    st.caption("Payload counts HTML, markdown and chart JSON sent to the browser. "
+               "Peak memory is only recorded while tracking is on.")
+
+# ---------- CATALOG MEMORY ----------
+with st.expander("🧠 Places catalog memory"):
+    st.dataframe(get_memory_report(), use_container_width=True)
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Tests import the app's packages the way the pages do, from the Cultural_Heritage folder.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import data_loaders  # noqa: E402
+from utils.data_backend import SQLiteBackend  # noqa: E402
+from utils.feedback_log import FeedbackLog  # noqa: E402
+
+
+@pytest.fixture
+def backend(tmp_path, monkeypatch):
+    """A fresh SQLite backend seeded from small CSVs, used by data_loaders for the test."""
+    places = tmp_path / "places.csv"
+    pd.DataFrame({
+        "Zone": ["Western", "Northern"],
+        "State": ["Goa", "Rajasthan"],
+        "City": ["Panaji", "Jaipur"],
+        "Name": ["Fort Aguada", "Amber Fort"],
+        "Google review rating": [4.5, 4.6],
+    }).to_csv(places, index=False)
+    stats = tmp_path / "tourist_stats.csv"
+    pd.DataFrame({
+        "Year": [2021, 2021],
+        "Type": ["DTV", "FTV"],
+        "Goa": [40, 7],
+        "Kerala": [30, 5],
+    }).to_csv(stats, index=False)
+    backend = SQLiteBackend(str(tmp_path / "test.db"), {"places": str(places), "tourist_stats": str(stats)})
+    monkeypatch.setattr(data_loaders, "get_backend", lambda: backend)
+    feedback_log = FeedbackLog(backend)
+    monkeypatch.setattr(data_loaders, "get_feedback_log", lambda: feedback_log)
+    data_loaders.clear_cache()
+    yield backend
+    data_loaders.clear_cache()
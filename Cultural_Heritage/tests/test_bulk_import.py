@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from utils import data_loaders
+from utils.bulk_import import read_upload, validate
+
+
+def test_out_of_range_numbers_are_rejected_not_raised():
+    df = pd.DataFrame({
+        "Year": ["2021", "inf", "2021", "2022", "2023", "2024"],
+        "Type": ["DTV"] * 6,
+        "State": ["Goa", "Goa", "Kerala", "Goa", "Goa", "Goa"],
+        "Tourist Count": ["10", "10", "1e30", "-inf", "2.5", "12"],
+    })
+    accepted, rejected = validate("tourist_stats", df)
+
+    assert accepted[["Year", "State", "Tourist_Count"]].values.tolist() == [[2021, "Goa", 10], [2024, "Goa", 12]]
+    assert accepted["Tourist_Count"].dtype == "Int64"
+    assert rejected["Row"].tolist() == [3, 4, 5, 6]
+    assert rejected["Reason"].tolist() == [
+        "Year is not a finite number",
+        "Tourist_Count is too large",
+        "Tourist_Count is not a finite number",
+        "Tourist_Count is not a whole number",
+    ]
+
+
+def test_non_finite_real_values_are_rejected():
+    df = pd.DataFrame({"Name": ["A", "B"], "State": ["Goa", "Goa"], "City": ["Panaji", "Panaji"],
+                       "Google review rating": [4.5, float("inf")]})
+    accepted, rejected = validate("places", df)
+    assert accepted["Name"].tolist() == ["A"]
+    assert rejected["Reason"].tolist() == ["Google_Review_Rating is not a finite number"]
+
+
+def test_excel_uploads_are_read(tmp_path):
+    pytest.importorskip("openpyxl")
+    path = tmp_path / "stats.xlsx"
+    pd.DataFrame({"Year": [2021], "Type": ["DTV"], "Goa": [40]}).to_excel(path, index=False)
+    accepted, rejected = validate("tourist_stats", read_upload(str(path)))
+    assert accepted[["Year", "State", "Tourist_Count"]].values.tolist() == [[2021, "Goa", 40]]
+    assert rejected.empty
+
+
+def test_places_import_keeps_columns_missing_from_the_file(backend):
+    df = pd.DataFrame({"Name": ["amber fort", "Basilica"], "State": ["Rajasthan", "Goa"], "City": ["Amer", "Old Goa"]})
+    accepted, rejected = validate("places", df)
+    assert list(accepted.columns) == ["State", "City", "Name"]
+    data_loaders.upsert_places(accepted, partial=True)
+
+    amber = data_loaders.find_place("Amber Fort", "Rajasthan")
+    assert (amber["City"], amber["Zone"], amber["Google_Review_Rating"]) == ("Amer", "Northern", 4.6)
+    basilica = data_loaders.find_place("Basilica", "Goa")
+    assert basilica["City"] == "Old Goa" and basilica["Zone"] is None
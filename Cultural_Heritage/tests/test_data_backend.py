@@ -0,0 +1,44 @@
+import sqlite3
+
+import pandas as pd
+
+from utils.data_backend import SCHEMA, SQLiteBackend, duplicates_table
+
+
+def test_key_index_keeps_older_duplicates_in_a_side_table(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE places ({', '.join(f'{n} {t}' for n, t in SCHEMA['places'])})")
+    conn.executemany("INSERT INTO places (name, state, city) VALUES (?, ?, ?)", [
+        ("Amber Fort", "Rajasthan", "Old"), ("amber fort ", "RAJASTHAN", "New"), ("Hawa Mahal", "Rajasthan", "Jaipur"),
+    ])
+    conn.commit()
+    conn.close()
+
+    backend = SQLiteBackend(path, {})
+
+    assert sorted(backend.query("SELECT city FROM places")["city"]) == ["Jaipur", "New"]
+    dropped = backend.query(f"SELECT name, city, dropped_at FROM {duplicates_table('places')}")
+    assert dropped[["name", "city"]].values.tolist() == [["Amber Fort", "Old"]]
+    assert dropped["dropped_at"].notna().all()
+
+
+def test_no_side_table_without_duplicates(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "new.db"), {})
+    tables = backend.query("SELECT name FROM sqlite_master WHERE type = 'table'")["name"]
+    assert duplicates_table("places") not in set(tables)
+
+
+def test_feedback_stored_before_seq_is_numbered_in_insert_order(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE feedback ({', '.join(f'{n} {t}' for n, t in SCHEMA['feedback'])})")
+    conn.executemany("INSERT INTO feedback (title) VALUES (?)", [("first",), ("second",)])
+    conn.commit()
+    conn.close()
+
+    backend = SQLiteBackend(path, {})
+    backend.insert_rows("feedback", pd.DataFrame({"Title": ["third"]}))
+
+    rows = backend.query("SELECT seq, title FROM feedback ORDER BY seq")
+    assert rows.values.tolist() == [[1, "first"], [2, "second"], [3, "third"]]
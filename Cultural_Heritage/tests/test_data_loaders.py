@@ -0,0 +1,52 @@
+import os
+import time
+
+import pandas as pd
+
+from utils import data_loaders
+
+
+def touch(path):
+    later = time.time() + 60
+    os.utime(path, (later, later))
+
+
+def test_csv_changes_do_not_undo_writes(backend):
+    data_loaders.upsert_places(pd.DataFrame({"Name": ["India Gate"], "State": ["Delhi"], "City": ["New Delhi"]}))
+    data_loaders.add_tourist_stats(pd.DataFrame(
+        {"Year": [2021], "Type": ["DTV"], "State": ["Goa"], "Tourist_Count": [5]}))
+
+    for path in backend.sources.values():
+        touch(path)
+    data_loaders.clear_cache()
+
+    places = data_loaders.load_places()
+    assert ((places["Name"] == "India Gate") & (places["State"] == "Delhi")).sum() == 1
+    assert len(places) == 3
+    goa = data_loaders.load_tourist_stats(year=2021, visitor_type="DTV", states=["Goa"])
+    assert goa["Tourist_Count"].tolist() == [45]
+    totals = data_loaders.load_tourist_totals(group_by=["Year", "Type"], visitor_type="DTV")
+    assert totals["Tourist_Count"].tolist() == [75]
+
+
+def test_first_write_seeds_table(backend):
+    data_loaders.add_tourist_stats(pd.DataFrame(
+        {"Year": [2022], "Type": ["DTV"], "State": ["Goa"], "Tourist_Count": [1]}))
+    stats = data_loaders.load_tourist_stats()
+    assert len(stats) == 5
+    assert stats.loc[stats["Year"] == 2022, "Tourist_Count"].tolist() == [1]
+
+
+def test_many_changed_places_are_fetched_in_chunks(backend):
+    from utils.catalog import CatalogService
+
+    service = CatalogService()
+    n = 2 * data_loaders.KEY_CHUNK + 700
+    data_loaders.upsert_places(pd.DataFrame({
+        "Name": [f"Place {i}" for i in range(n)], "State": ["Goa"] * n, "City": ["Panaji"] * n}))
+
+    seq, changed = data_loaders.place_changes(service.seq)
+    assert len(changed) == n
+    catalog = service.refresh()
+    assert len(catalog.places) == n + 2
+    assert service.seq == seq
@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils.feedback_log import FeedbackLog
+
+
+class GatedBackend:
+    """Backend whose inserts wait for the gate, so tests can queue submissions behind one in flight."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def insert_rows(self, table, df):
+        self.started.set()
+        self.gate.wait(5)
+        self.backend.insert_rows(table, df)
+
+    def compact(self):
+        pass
+
+
+def feedback(*titles):
+    return pd.DataFrame({"Rating": [5] * len(titles), "Location": ["Goa"] * len(titles), "Title": list(titles),
+                         "Reviews": ["Lovely"] * len(titles)})
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def stored_titles(backend):
+    return sorted(backend.query("SELECT title FROM feedback")["title"])
+
+
+def in_background(log, df, errors):
+    def append():
+        try:
+            log.append(df)
+        except Exception as e:
+            errors.append(e)
+    thread = threading.Thread(target=append)
+    thread.start()
+    return thread
+
+
+def test_timed_out_submission_is_withdrawn(backend):
+    gated = GatedBackend(backend)
+    log = FeedbackLog(gated)
+    errors = []
+    first = in_background(log, feedback("first"), errors)
+    assert gated.started.wait(5)
+
+    with pytest.raises(TimeoutError):
+        log.append(feedback("retried"), timeout=0.1)
+    gated.gate.set()
+    first.join(5)
+    log.append(feedback("after"))
+
+    assert errors == []
+    assert stored_titles(backend) == ["after", "first"]
+    assert log.appended == 2
+
+
+def test_bad_submission_does_not_fail_the_batch(backend):
+    gated = GatedBackend(backend)
+    log = FeedbackLog(gated)
+    errors = []
+    threads = [in_background(log, feedback("first"), errors)]
+    assert gated.started.wait(5)
+    bad = feedback("bad")
+    bad["Reviews"] = [{"not": "bindable"}]
+    threads += [in_background(log, feedback("a", "b"), errors), in_background(log, bad, errors),
+                in_background(log, feedback("c"), errors)]
+    assert wait_until(lambda: log.pending() == 3)
+    gated.gate.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 1
+    assert stored_titles(backend) == ["a", "b", "c", "first"]
+    assert log.appended == 4
@@ -0,0 +1,18 @@
+import pandas as pd
+
+from utils import geo_index
+from utils.catalog import Catalog, compact_places, typed_places
+
+
+def catalog(names, generation):
+    places = pd.DataFrame({"Name": names, "State": ["Goa"] * len(names), "City": ["Panaji"] * len(names)})
+    return Catalog(compact_places(typed_places(places)), generation)
+
+
+def test_geo_index_is_built_from_the_catalog_it_is_cached_for(monkeypatch):
+    old, new = catalog(["Fort Aguada"], 101), catalog(["Fort Aguada", "Basilica"], 102)
+    # The service has already moved on to the next generation while the old one is indexed.
+    monkeypatch.setattr(geo_index, "get_catalog", lambda: new)
+
+    assert list(geo_index.get_geo_index(old).coordinates.index) == list(old.places.index)
+    assert list(geo_index.get_geo_index().coordinates.index) == list(new.places.index)
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from utils import geo_index, map_view
+from utils.catalog import Catalog, compact_places, typed_places
+
+
+def catalog(names, generation):
+    places = pd.DataFrame({"Name": names, "State": ["Goa"] * len(names), "City": ["Panaji"] * len(names)})
+    return Catalog(compact_places(typed_places(places)), generation)
+
+
+def test_cluster_cache_pairs_the_geo_index_and_names_of_one_generation(monkeypatch):
+    old, new = catalog(["Fort Aguada"], 201), catalog(["Basilica", "Fort Aguada"], 202)
+    # The service has already moved on to the next generation while the old one is clustered.
+    monkeypatch.setattr(map_view, "get_catalog", lambda: new)
+    monkeypatch.setattr(geo_index, "get_catalog", lambda: new)
+
+    clusters = map_view.get_cluster_cache(old)
+    assert list(clusters.points.index) == list(old.places.index)
+    assert clusters.names.tolist() == ["Fort Aguada"]
+    assert map_view.get_cluster_cache().names.tolist() == ["Basilica", "Fort Aguada"]
@@ -0,0 +1,54 @@
+import pandas as pd
+
+from utils import data_loaders
+from utils.review_index import ReviewIndex
+
+
+def review(location, title, submitted_at=None):
+    return pd.DataFrame({"Rating": [80], "Location": [location], "Title": [title], "Reviews": ["Lovely"],
+                         "Submitted_At": [submitted_at]})
+
+
+def test_feedback_is_numbered_in_append_order(backend):
+    # Back-dated and missing timestamps must not affect the order.
+    backend.insert_rows("feedback", review("Amber Fort", "first", "2026-01-02T00:00:00+00:00"))
+    backend.insert_rows("feedback", review("Amber Fort", "second", None))
+    backend.insert_rows("feedback", review("Amber Fort", "third", "2001-01-01T00:00:00+00:00"))
+    assert data_loaders.load_feedback()["Title"].tolist() == ["first", "second", "third"]
+
+    last, rows = data_loaders.feedback_since(1)
+    assert last == 3
+    assert rows["Title"].tolist() == ["second", "third"]
+    assert data_loaders.feedback_since(3)[1].empty
+
+
+def test_review_index_folds_in_only_new_feedback(backend):
+    places = data_loaders.load_places()
+    index = ReviewIndex(places).update()
+    assert index.seen == 0
+
+    for title in ["grand", "crowded", "grand"]:
+        data_loaders.append_feedback(review("Amber Fort", title, "2001-01-01T00:00:00+00:00"))
+        index.update()
+    index.update()
+    data_loaders.append_feedback(review("Fort Aguada, Goa", "breezy"))
+    index.update()
+
+    assert (index.seen, index.seq) == (4, 4)
+    assert index.summary("Amber Fort", "Rajasthan").count == 3
+    assert [r["title"] for r in index.summary("Amber Fort", "Rajasthan").recent] == ["grand", "crowded", "grand"]
+    assert index.summary("Fort Aguada", "Goa").count == 1
+
+
+def test_review_index_rebuilds_when_the_log_is_replaced(backend):
+    index = ReviewIndex(data_loaders.load_places())
+    for title in ["grand", "crowded"]:
+        data_loaders.append_feedback(review("Amber Fort", title))
+    index.update()
+
+    backend.replace_table("feedback", review("Fort Aguada", "breezy"))
+    index.update()
+
+    assert (index.seen, index.seq) == (1, 1)
+    assert index.summary("Amber Fort", "Rajasthan") is None
+    assert index.summary("Fort Aguada", "Goa").count == 1
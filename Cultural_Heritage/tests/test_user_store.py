@@ -0,0 +1,71 @@
+import sqlite3
+import threading
+
+import pandas as pd
+
+from utils.user_store import UserStore
+
+
+def legacy_logins():
+    return pd.DataFrame({"Email": ["ana@example.com", "ANA@example.com ", "ravi@example.com", None],
+                         "Password": ["first", "second", "secret", "orphan"]})
+
+
+def test_login_checks_the_hashed_password(tmp_path):
+    path = str(tmp_path / "users.db")
+    store = UserStore(path)
+    assert store.add_user("ana@example.com", "s3cret")
+
+    assert store.verify("ana@example.com", "s3cret")
+    assert store.verify(" ANA@Example.com ", "s3cret")
+    assert not store.verify("ana@example.com", "wrong")
+    assert not store.verify("nobody@example.com", "s3cret")
+    stored = sqlite3.connect(path).execute("SELECT pwd_hash FROM users").fetchone()[0]
+    assert b"s3cret" not in stored
+
+
+def test_duplicate_registration_ignores_case(tmp_path):
+    store = UserStore(str(tmp_path / "users.db"))
+    assert store.add_user("ana@example.com", "first")
+    assert not store.add_user("ANA@Example.COM ", "second")
+
+    assert store.exists("Ana@example.com")
+    assert store.verify("ana@example.com", "first")
+    assert not store.verify("ana@example.com", "second")
+
+
+def test_legacy_logins_are_imported_once(tmp_path):
+    store = UserStore(str(tmp_path / "users.db"))
+    assert not store.legacy_imported()
+
+    assert store.import_legacy(legacy_logins()) == 2
+    assert store.legacy_imported()
+    assert store.verify("ana@example.com", "first")
+    assert store.verify("ravi@example.com", "secret")
+    assert store.import_legacy(pd.DataFrame({"Email": ["new@example.com"], "Password": ["pw"]})) == 0
+    assert not store.exists("new@example.com")
+
+
+def test_concurrent_legacy_imports_run_once(tmp_path):
+    path = str(tmp_path / "users.db")
+    UserStore(path)
+    barrier = threading.Barrier(2)
+    results, errors = [], []
+
+    def run():
+        store = UserStore(path)
+        barrier.wait()
+        try:
+            results.append(store.import_legacy(legacy_logins()))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert errors == []
+    assert sorted(results) == [0, 2]
+    assert sqlite3.connect(path).execute("SELECT COUNT(*) FROM users").fetchone()[0] == 2
@@ -0,0 +1,111 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.data_backend import SCHEMA, frame_column
+
+READERS = {
+    ".csv": pd.read_csv,
+    ".parquet": pd.read_parquet,
+    ".xlsx": pd.read_excel,
+    ".xls": pd.read_excel,
+}
+
+# Columns a row must have to be imported, per table (SQL names).
+REQUIRED = {
+    "tourist_stats": ["year", "type", "state", "tourist_count"],
+    "places": ["name", "state", "city"],
+}
+
+# Rows sharing these (case-insensitive) values are the same record; the last one in a file wins.
+IMPORT_KEYS = {
+    "tourist_stats": ["year", "type", "state"],
+    "places": ["name", "state"],
+}
+
+VISITOR_TYPES = {"DTV", "FTV"}
+INT64_LIMIT = 2.0 ** 63     # INTEGER columns are stored as signed 64-bit values
+
+
+def read_upload(file, name=None):
+    """Read an uploaded (or on-disk) CSV, Parquet or Excel file into a frame."""
+    name = name or getattr(file, "name", str(file))
+    ext = os.path.splitext(name)[1].lower()
+    if ext not in READERS:
+        raise ValueError(f"Unsupported file type '{ext}'; use one of {', '.join(READERS)}")
+    return READERS[ext](file)
+
+
+def _wide_to_long(df, labels):
+    """Wide stats (Year, Type, one column per state, optional Total) -> long rows."""
+    df = df.drop(columns=["total"], errors="ignore")
+    states = [c for c in df.columns if c not in ("year", "type")]
+    long_df = df.melt(id_vars=["year", "type"], value_vars=states, var_name="state", value_name="tourist_count")
+    # Column names were normalised for matching; restore the original state labels.
+    long_df["state"] = long_df["state"].map(labels)
+    return long_df
+
+
+def validate(table, df):
+    """
+    Coerce an import frame to the table schema in one vectorized pass. Schema columns the
+    file lacks are left out of the accepted rows, so a partial upsert keeps their stored values.
+    Returns (accepted rows with frame column names, rejected rows with a Reason column).
+    """
+    labels = {frame_column(c).lower(): str(c).strip() for c in df.columns}
+    df = df.rename(columns=lambda c: frame_column(c).lower())
+    if table == "tourist_stats" and "state" not in df.columns and {"year", "type"} <= set(df.columns):
+        df = _wide_to_long(df, labels)
+
+    missing = [c for c in REQUIRED[table] if c not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(frame_column(c) for c in missing)}")
+
+    df = df.reset_index(drop=True)
+    row_numbers = pd.Series(np.arange(2, len(df) + 2), name="Row")     # as numbered in a spreadsheet
+    out = pd.DataFrame(index=df.index)
+    reasons = pd.Series("", index=df.index)
+
+    def reject(mask, reason):
+        nonlocal reasons
+        reasons = reasons.where(~mask, reasons + np.where(reasons == "", "", "; ") + reason)
+
+    for name, sql_type in SCHEMA[table]:
+        if name not in df.columns:
+            continue
+        raw = df[name]
+        if sql_type in ("INTEGER", "REAL"):
+            values = pd.to_numeric(raw, errors="coerce").astype("float64")
+            reject(raw.notna() & values.isna(), f"{frame_column(name)} is not a number")
+            ok = values.notna() & np.isfinite(values)
+            reject(values.notna() & ~ok, f"{frame_column(name)} is not a finite number")
+            if sql_type == "INTEGER":
+                fraction = ok & (values % 1 != 0)
+                reject(fraction, f"{frame_column(name)} is not a whole number")
+                too_large = ok & (values.abs() >= INT64_LIMIT)
+                reject(too_large, f"{frame_column(name)} is too large")
+                ok &= ~fraction & ~too_large
+                # Only values that passed every check are cast; the others can't be held by Int64.
+                values = values.where(ok).round().astype("Int64")
+            out[name] = values.where(ok)
+        else:
+            text = raw.astype("string").str.strip()
+            out[name] = text.mask(text == "")
+        if name in REQUIRED[table]:
+            reject(out[name].isna() & reasons.eq(""), f"{frame_column(name)} is missing")
+
+    if table == "tourist_stats":
+        out["type"] = out["type"].str.upper()
+        reject(out["type"].notna() & ~out["type"].isin(VISITOR_TYPES), "Type must be DTV or FTV")
+        reject(out["tourist_count"].fillna(0) < 0, "Tourist_Count is negative")
+
+    valid = reasons.eq("")
+    keys = pd.DataFrame({k: out.loc[valid, k].astype("string").str.lower() for k in IMPORT_KEYS[table]})
+    superseded = keys.duplicated(keep="last").reindex(df.index, fill_value=False)
+    reject(superseded, "Superseded by a later row with the same key")
+
+    bad = reasons != ""
+    accepted = out[~bad].rename(columns=lambda c: frame_column(c.replace("_", " "))).reset_index(drop=True)
+    rejected = pd.concat([row_numbers[bad], df[bad], reasons[bad].rename("Reason")], axis=1).reset_index(drop=True)
+    return accepted, rejected
@@ -0,0 +1,165 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import data_loaders
+from utils.data_backend import SCHEMA, frame_column, normalize_key
+from utils.incremental_search import build_haystack
+from utils.table_view import TableView
+
+POLL_SECONDS = 5      # how often to look for writes made by other processes
+
+FRAME_TYPES = {"TEXT": "object", "REAL": "float64", "INTEGER": "Int64"}
+
+# Low-cardinality text columns stored as categoricals; other text uses Arrow-backed strings.
+CATEGORY_COLUMNS = [
+    "Zone", "State", "City", "Type", "Significance", "Weekly_Off", "Dslr_Allowed", "Best_Time_To_Visit",
+    "Airport_With_50Km_Radius",
+]
+
+try:
+    import pyarrow  # noqa: F401
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    TEXT_DTYPE = "object"
+
+
+def typed_places(df):
+    """Places with the schema's column types (nullable integers, floats, text)."""
+    types = {frame_column(name.replace("_", " ")): FRAME_TYPES[sql_type] for name, sql_type in SCHEMA["places"]}
+    return df.astype({col: dtype for col, dtype in types.items() if col in df.columns})
+
+
+def compact_places(df):
+    """
+    Compact in-memory places: categoricals for low-cardinality text, Arrow strings for the
+    rest, integers downcast, and floats downcast only where float32 holds the values exactly.
+    """
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if col in CATEGORY_COLUMNS:
+            values = values.astype("category")
+        elif pd.api.types.is_integer_dtype(values):
+            values = pd.to_numeric(values, downcast="integer")
+        elif pd.api.types.is_float_dtype(values):
+            small = values.astype("float32")
+            if np.array_equal(small.astype("float64").to_numpy(), values.to_numpy(), equal_nan=True):
+                values = small
+        elif values.dtype == object:
+            values = values.astype(TEXT_DTYPE)
+        out[col] = values
+    return pd.DataFrame(out, index=df.index)
+
+
+def load_catalog_places():
+    return compact_places(typed_places(data_loaders.load_places()))
+
+
+def memory_report(before, after):
+    """Deep bytes and dtype per column of two frames (e.g. raw vs compact places), plus a total row."""
+    report = pd.DataFrame({
+        "Before dtype": before.dtypes.astype(str),
+        "Before bytes": before.memory_usage(index=False, deep=True),
+        "After dtype": after.dtypes.reindex(before.columns).astype(str),
+        "After bytes": after.memory_usage(index=False, deep=True).reindex(before.columns),
+    })
+    report.loc["Total"] = ["", report["Before bytes"].sum(), "", report["After bytes"].sum()]
+    report["Saved %"] = (100 * (1 - report["After bytes"] / report["Before bytes"])).round(1)
+    return report
+
+
+class Catalog:
+    """
+    One immutable generation of the places dataset plus what the pages derive from it
+    (search haystacks, sorted views, facets). Shared read-only by every session; a write
+    produces a new Catalog rather than changing this one under a running script.
+    """
+
+    def __init__(self, places, generation):
+        self.places = places
+        self.generation = generation
+        self.keys = pd.Series([tuple(normalize_key("places", k)) for k in zip(places["Name"], places["State"])],
+                              index=places.index, dtype=object)
+        self.view = TableView(places)
+        self.states = sorted(places["State"].dropna().unique())
+        self.facet_options = {}
+        self.facet_ranges = {}
+        for col in places.columns:
+            if pd.api.types.is_numeric_dtype(places[col]):
+                values = places[col].astype("float64")
+                self.facet_ranges[col] = (float(values.min()), float(values.max()))
+            else:
+                self.facet_options[col] = sorted(places[col].dropna().unique().tolist())
+        self._haystacks = {}
+        self._lock = threading.Lock()
+
+    def haystack(self, columns):
+        """Shared search haystack over columns, built once per generation."""
+        columns = tuple(columns)
+        with self._lock:
+            if columns not in self._haystacks:
+                self._haystacks[columns] = build_haystack(self.places, list(columns))
+            return self._haystacks[columns]
+
+    def patched(self, changed):
+        """Next generation with rows whose keys changed replaced, and new keys appended."""
+        keys = {tuple(normalize_key("places", k)) for k in zip(changed["Name"], changed["State"])}
+        kept = self.places[~self.keys.isin(keys)]
+        # All-empty changed columns would otherwise decide the merged dtype; re-type before compacting.
+        merged = pd.concat([kept, changed.dropna(axis=1, how="all")], ignore_index=True)
+        return Catalog(compact_places(typed_places(merged)), self.generation + 1)
+
+
+class CatalogService:
+    """
+    Loads places once per process and keeps the current Catalog up to date from the
+    change log: upserted rows are patched in, only a wholesale reload re-reads the table.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked = 0.0
+        self._version = None
+        self.seq, _ = data_loaders.place_changes()
+        self.current = Catalog(load_catalog_places(), 1)
+
+    def refresh(self):
+        """The current Catalog, after applying writes since the last check (cheap when nothing changed)."""
+        version = data_loaders.dataset_version("places")
+        now = time.monotonic()
+        if version == self._version and now - self._checked < POLL_SECONDS:
+            return self.current
+        with self._lock:
+            seq, changed = data_loaders.place_changes(self.seq)
+            if changed is None:
+                self.current = Catalog(load_catalog_places(), self.current.generation + 1)
+            elif len(changed):
+                self.current = self.current.patched(typed_places(changed))
+            self.seq, self._version, self._checked = seq, version, now
+            return self.current
+
+
+@st.cache_resource(show_spinner=False)
+def get_catalog_service():
+    return CatalogService()
+
+
+def get_catalog():
+    """The current places Catalog for this process, up to date with any writes."""
+    return get_catalog_service().refresh()
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_memory_report(generation, _catalog):
+    # Keyed by generation only; _catalog is that generation.
+    return memory_report(data_loaders.load_places(), _catalog.places)
+
+
+def get_memory_report():
+    """Raw loader frame vs the compact shared catalog, bytes per column; computed once per generation."""
+    catalog = get_catalog()
+    return build_memory_report(catalog.generation, catalog)
@@ -0,0 +1,87 @@
+import os
+import shutil
+
+import numpy as np
+import tensorflow as tf
+
+from utils.gallery import list_valid_dirs, list_valid_images
+from utils.perf import stage
+
+BASE_DIR = "data/Dance_Forms"
+TRAIN_DIR = os.path.join(BASE_DIR, "Train")
+UPLOAD_DIR = os.path.join(BASE_DIR, "New_Uploads")
+MODEL_PATH = os.path.join(BASE_DIR, "dance_model.h5")
+IMG_SIZE = (224, 224)
+
+
+@stage("load model")
+def load_model(path=MODEL_PATH):
+    if os.path.exists(path):
+        return tf.keras.models.load_model(path)
+    return None
+
+
+@stage("train model")
+def train_model(train_dir=TRAIN_DIR, model_path=MODEL_PATH, epochs=10):
+    train_ds = tf.keras.preprocessing.image_dataset_from_directory(
+        train_dir,
+        validation_split=0.2,
+        subset="training",
+        seed=42,
+        image_size=IMG_SIZE,
+        batch_size=32
+    )
+    val_ds = tf.keras.preprocessing.image_dataset_from_directory(
+        train_dir,
+        validation_split=0.2,
+        subset="validation",
+        seed=42,
+        image_size=IMG_SIZE,
+        batch_size=32
+    )
+    class_names = train_ds.class_names
+    AUTOTUNE = tf.data.AUTOTUNE
+    train_ds = train_ds.prefetch(buffer_size=AUTOTUNE)
+    val_ds = val_ds.prefetch(buffer_size=AUTOTUNE)
+
+    model = tf.keras.Sequential([
+        tf.keras.layers.Rescaling(1. / 255, input_shape=(224, 224, 3)),
+        tf.keras.layers.Conv2D(32, (3, 3), activation='relu'),
+        tf.keras.layers.MaxPooling2D(),
+        tf.keras.layers.Conv2D(64, (3, 3), activation='relu'),
+        tf.keras.layers.MaxPooling2D(),
+        tf.keras.layers.Conv2D(128, (3, 3), activation='relu'),
+        tf.keras.layers.MaxPooling2D(),
+        tf.keras.layers.Flatten(),
+        tf.keras.layers.Dense(128, activation='relu'),
+        tf.keras.layers.Dense(len(class_names), activation='softmax')
+    ])
+    model.compile(optimizer='adam',
+                  loss='sparse_categorical_crossentropy',
+                  metrics=['accuracy'])
+    model.fit(train_ds, validation_data=val_ds, epochs=epochs)
+    model.save(model_path)
+    return class_names
+
+
+@stage("predict")
+def predict_dance(model, class_names, image_path):
+    img = tf.keras.preprocessing.image.load_img(image_path, target_size=IMG_SIZE)
+    img_array = tf.keras.preprocessing.image.img_to_array(img)
+    img_array = np.expand_dims(img_array, axis=0) / 255.0
+    predictions = model.predict(img_array)
+    predicted_class = class_names[np.argmax(predictions)]
+    return predicted_class
+
+
+def move_new_uploads_to_train(upload_dir=UPLOAD_DIR, train_dir=TRAIN_DIR):
+    updated = False
+    for cls in list_valid_dirs(upload_dir):
+        class_dir = os.path.join(upload_dir, cls)
+        target_dir = os.path.join(train_dir, cls)
+        if not os.path.exists(target_dir):
+            os.makedirs(target_dir)
+        for img in list_valid_images(class_dir):
+            shutil.move(os.path.join(class_dir, img), target_dir)
+            updated = True
+    return updated
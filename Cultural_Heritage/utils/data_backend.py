@@ -0,0 +1,471 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import streamlit as st
+
+LOCAL_DB_PATH = "data/cultural_heritage.db"
+BATCH_SIZE = 5000
+
+# Table schemas shared by every backend. Column names are the frame names
+# produced by data_loaders, lower-cased for SQL.
+SCHEMA = {
+    "places": [
+        ("zone", "TEXT"), ("state", "TEXT"), ("city", "TEXT"), ("name", "TEXT"), ("type", "TEXT"),
+        ("establishment_year", "TEXT"), ("time_needed_to_visit_in_hrs", "REAL"),
+        ("google_review_rating", "REAL"), ("entrance_fee_in_inr", "INTEGER"),
+        ("airport_with_50km_radius", "TEXT"), ("weekly_off", "TEXT"), ("significance", "TEXT"),
+        ("dslr_allowed", "TEXT"), ("number_of_google_review_in_lakhs", "REAL"),
+        ("best_time_to_visit", "TEXT"), ("image", "TEXT"),
+    ],
+    "logins": [("email", "TEXT"), ("password", "TEXT")],
+    "tourist_stats": [("year", "INTEGER"), ("type", "TEXT"), ("state", "TEXT"), ("tourist_count", "INTEGER")],
+    "tourist_totals": [("year", "INTEGER"), ("type", "TEXT"), ("tourist_count", "INTEGER")],
+    "feedback": [
+        ("rating", "INTEGER"), ("location", "TEXT"), ("title", "TEXT"), ("reviews", "TEXT"), ("submitted_at", "TEXT"),
+    ],
+}
+
+# Unique keys for tables written with upserts.
+KEYS = {
+    "tourist_stats": ["year", "type", "state"],
+    "tourist_totals": ["year", "type"],
+    "places": ["name", "state"],
+}
+
+# Tables whose keys match ignoring case and surrounding spaces (indexed on the normalized value).
+NOCASE_KEYS = {"places"}
+
+# Tables whose writes are recorded in _changes for downstream indexes to replay.
+CHANGE_LOG = {"places"}
+
+# Append-only tables with a seq column that increases with every insert, so readers can
+# resume after the last seq they saw instead of relying on row order.
+SEQUENCED = {"feedback"}
+
+# Rollup tables kept in step with their base table on every write:
+# base table -> (rollup table, measure column summed over the rollup keys).
+ROLLUPS = {"tourist_stats": ("tourist_totals", "tourist_count")}
+
+# CSV files the local stand-in is seeded from (wide tourist stats are melted on seed). Each is
+# imported once into an empty table; after that the database is the source of truth.
+LOCAL_SOURCES = {
+    "places": "data/Top_Indian_Places_to_Visit.csv",
+    "logins": "data/login.csv",
+    "tourist_stats": "data/tourist_stats.csv",
+    "feedback": "data/user_feedback.csv",
+}
+
+
+def frame_column(col):
+    """Canonical frame name for a raw CSV header, e.g. 'Weekly Off' -> 'Weekly_Off'."""
+    return str(col).strip().title().replace(" ", "_")
+
+
+def to_sql_frame(table, df, strict=False, partial=False):
+    """
+    Rename frame columns to the table's SQL names and keep only schema columns.
+    With strict=True, columns the schema doesn't know raise instead of being dropped.
+    With partial=True, schema columns df lacks are left out instead of added as NULL.
+    """
+    df = df.rename(columns=lambda c: frame_column(c).lower())
+    cols = [name for name, _ in SCHEMA[table]]
+    if partial:
+        cols = [c for c in cols if c in df.columns]
+    if strict:
+        unknown = [c for c in df.columns if c not in cols]
+        if unknown:
+            raise ValueError(f"Unknown column(s) for {table}: {', '.join(unknown)}")
+    return df.reindex(columns=cols)
+
+
+def key_exprs(table, alias=None):
+    """SQL expressions for a table's key, normalized for NOCASE_KEYS tables."""
+    prefix = f"{alias}." if alias else ""
+    if table in NOCASE_KEYS:
+        return [f"LOWER(TRIM({prefix}{c}))" for c in KEYS[table]]
+    return [prefix + c for c in KEYS[table]]
+
+
+def normalize_key(table, values):
+    """Key values as stored in the index (and in change events)."""
+    if table in NOCASE_KEYS:
+        return [None if pd.isna(v) else str(v).strip().lower() for v in values]
+    return list(values)
+
+
+def key_where(table, n_keys=1):
+    """WHERE clause matching any of n_keys keys given as '?' params (already normalized)."""
+    one = " AND ".join(f"{expr} = ?" for expr in key_exprs(table))
+    return " WHERE " + " OR ".join(f"({one})" for _ in range(n_keys))
+
+
+def insert_sql(table, cols, verb="INSERT", next_seq=None):
+    """INSERT of one row of '?' params; SEQUENCED tables also get seq from the next_seq SQL expression."""
+    values = ["?"] * len(cols)
+    if table in SEQUENCED:
+        cols, values = [*cols, "seq"], [*values, next_seq]
+    return f"{verb} INTO {table} ({', '.join(cols)}) VALUES ({', '.join(values)})"
+
+
+def upsert_sql(table, cols, accumulate=()):
+    """INSERT that, on a key conflict, adds the accumulate columns and overwrites the rest."""
+    # Case-insensitive keys are rewritten too, so the latest spelling wins.
+    fixed = [] if table in NOCASE_KEYS else KEYS[table]
+    updates = ", ".join(f"{c} = {table}.{c} + excluded.{c}" if c in accumulate else f"{c} = excluded.{c}"
+                        for c in cols if c not in fixed)
+    return f"{insert_sql(table, cols)} ON CONFLICT ({', '.join(key_exprs(table))}) DO UPDATE SET {updates}"
+
+
+def merge_sql(table, cols, accumulate=()):
+    """Snowflake MERGE equivalent of upsert_sql for one row of '?' parameters."""
+    fixed = [] if table in NOCASE_KEYS else KEYS[table]
+    source = ", ".join(f"? AS {c}" for c in cols)
+    on = " AND ".join(f"{t} = {s}" for t, s in zip(key_exprs(table, "t"), key_exprs(table, "s")))
+    updates = ", ".join(f"t.{c} = t.{c} + s.{c}" if c in accumulate else f"t.{c} = s.{c}"
+                        for c in cols if c not in fixed)
+    return (f"MERGE INTO {table} t USING (SELECT {source}) s ON {on} "
+            f"WHEN MATCHED THEN UPDATE SET {updates} "
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(cols)}) VALUES ({', '.join('s.' + c for c in cols)})")
+
+
+def rollup_frame(table, df):
+    """Per-key sums of a base-table frame (SQL names) for its rollup table."""
+    rollup, measure = ROLLUPS[table]
+    keys = KEYS[rollup]
+    return df.groupby(keys, as_index=False, sort=False)[measure].sum()[[name for name, _ in SCHEMA[rollup]]]
+
+
+def rebuild_rollup_sql(table, keyed=False):
+    """(DELETE, INSERT ... SELECT) recomputing a table's rollup, for every key or for one key given as '?' params."""
+    rollup, measure = ROLLUPS[table]
+    keys = KEYS[rollup]
+    where = (" WHERE " + " AND ".join(f"{c} = ?" for c in keys)) if keyed else ""
+    cols = ", ".join(keys)
+    return (f"DELETE FROM {rollup}{where}",
+            f"INSERT INTO {rollup} ({cols}, {measure}) SELECT {cols}, SUM({measure}) FROM {table}{where} GROUP BY {cols}")
+
+
+def change_rows(table, df, op="upsert"):
+    """_changes rows (dataset, op, key JSON) for the keys written in df (SQL names)."""
+    keys = df[KEYS[table]].astype(object).where(df[KEYS[table]].notna(), None)
+    return [(table, op, json.dumps(normalize_key(table, key)))
+            for key in dict.fromkeys(keys.itertuples(index=False, name=None))]
+
+
+CHANGES_INSERT = "INSERT INTO _changes (dataset, op, key) VALUES (?, ?, ?)"
+
+# Snowflake tables the app maintains itself. An ORDER identity keeps seq increasing, as
+# AUTOINCREMENT does in SQLite, so readers can resume after the last seq they saw. SEQUENCED
+# tables draw seq from an ORDER sequence; rows stored before the column existed keep NULL.
+SNOWFLAKE_DDL = [
+    "CREATE TABLE IF NOT EXISTS _changes (seq NUMBER IDENTITY(1, 1) ORDER, dataset TEXT, op TEXT, key TEXT)",
+] + [ddl for table in sorted(SEQUENCED) for ddl in (
+    f"CREATE SEQUENCE IF NOT EXISTS {table}_seq ORDER",
+    f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS seq NUMBER",
+)]
+
+
+def duplicates_table(table):
+    """Side table holding rows dropped as older duplicates when table's unique key index was built."""
+    return f"_duplicates_{table}"
+
+
+def sql_rows(df):
+    return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+
+
+# ---------- SQLITE (LOCAL STAND-IN) ----------
+class SQLiteBackend:
+    """Embedded backend for development and tests, seeded from the bundled CSVs."""
+
+    name = "sqlite"
+
+    def __init__(self, path=LOCAL_DB_PATH, sources=LOCAL_SOURCES):
+        self.path = path
+        self.sources = sources
+        self._local = threading.local()
+        self._seed_lock = threading.Lock()
+        with self.connection() as conn:
+            for table, columns in SCHEMA.items():
+                ddl = ", ".join(f"{name} {sql_type}" for name, sql_type in columns)
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({ddl})")
+                # Columns added to SCHEMA after a database was created.
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for name, sql_type in columns:
+                    if name not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}")
+                if table in KEYS and not conn.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (f"{table}_key",)).fetchone():
+                    exprs = ", ".join(key_exprs(table))
+                    # Keep the latest row per key so the index can be built over older data; the
+                    # older duplicates are moved to a side table rather than lost.
+                    older = f"rowid NOT IN (SELECT MAX(rowid) FROM {table} GROUP BY {exprs})"
+                    if conn.execute(f"SELECT 1 FROM {table} WHERE {older} LIMIT 1").fetchone():
+                        cols = ", ".join(name for name, _ in columns)
+                        conn.execute(f"CREATE TABLE IF NOT EXISTS {duplicates_table(table)} "
+                                     f"({ddl}, dropped_at TEXT)")
+                        conn.execute(f"INSERT INTO {duplicates_table(table)} ({cols}, dropped_at) "
+                                     f"SELECT {cols}, datetime('now') FROM {table} WHERE {older}")
+                        conn.execute(f"DELETE FROM {table} WHERE {older}")
+                    conn.execute(f"CREATE UNIQUE INDEX {table}_key ON {table} ({exprs})")
+                if table in SEQUENCED and "seq" not in existing:
+                    # Existing rows are numbered in storage order, which is their insert order.
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN seq INTEGER")
+                    conn.execute(f"UPDATE {table} SET seq = rowid")
+                    conn.execute(f"CREATE UNIQUE INDEX {table}_seq ON {table} (seq)")
+            conn.execute("CREATE TABLE IF NOT EXISTS _sources (dataset TEXT PRIMARY KEY, mtime REAL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS _changes "
+                         "(seq INTEGER PRIMARY KEY AUTOINCREMENT, dataset TEXT, op TEXT, key TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS _changes_dataset ON _changes (dataset, seq)")
+            # Databases seeded before a rollup existed get it built once.
+            for table, (rollup, _) in ROLLUPS.items():
+                if conn.execute(f"SELECT 1 FROM {rollup} LIMIT 1").fetchone() is None:
+                    for sql in rebuild_rollup_sql(table):
+                        conn.execute(sql)
+
+    @contextmanager
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        with conn:
+            yield conn
+
+    def next_seq(self, table):
+        """SQL for a SEQUENCED table's next seq; writes are serialized, so it is unique and increasing."""
+        return f"(SELECT COALESCE(MAX(seq), 0) + 1 FROM {table})"
+
+    def sync_source(self, table):
+        """
+        Import a table from its CSV the first time it is used. Later changes to the CSV are
+        ignored: pages write only to the database, and reloading would discard those writes.
+        """
+        path = self.sources.get(table)
+        if not path or not os.path.exists(path):
+            return
+        with self._seed_lock, self.connection() as conn:
+            if conn.execute("SELECT 1 FROM _sources WHERE dataset = ?", (table,)).fetchone():
+                return
+            mtime = os.path.getmtime(path)
+            if conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone():
+                # Rows stored before imports were tracked are kept as they are.
+                conn.execute("INSERT INTO _sources (dataset, mtime) VALUES (?, ?)", (table, mtime))
+                return
+            df = pd.read_csv(path)
+            if table == "tourist_stats":
+                df = df.drop(columns=["Total"], errors="ignore").melt(
+                    id_vars=["Year", "Type"], var_name="State", value_name="Tourist_Count")
+            self._replace(conn, table, to_sql_frame(table, df))
+            conn.execute("INSERT INTO _sources (dataset, mtime) VALUES (?, ?)", (table, mtime))
+
+    def _replace(self, conn, table, df):
+        conn.execute(f"DELETE FROM {table}")
+        # On a duplicate key the later row wins, as it would with upserts.
+        verb = "INSERT OR REPLACE" if table in KEYS else "INSERT"
+        conn.executemany(insert_sql(table, list(df.columns), verb, self.next_seq(table)), sql_rows(df))
+        if table in CHANGE_LOG:
+            conn.execute(CHANGES_INSERT, (table, "reload", None))
+        if table in ROLLUPS:
+            for sql in rebuild_rollup_sql(table):
+                conn.execute(sql)
+
+    def replace_table(self, table, df):
+        with self.connection() as conn:
+            self._replace(conn, table, to_sql_frame(table, df))
+
+    def insert_rows(self, table, df):
+        df = to_sql_frame(table, df)
+        with self.connection() as conn:
+            conn.executemany(insert_sql(table, list(df.columns), next_seq=self.next_seq(table)), sql_rows(df))
+
+    def upsert_rows(self, table, df, accumulate=(), partial=False):
+        """
+        Insert rows by key, adding accumulate columns onto existing rows; rollups update in the
+        same transaction. With partial=True, columns df lacks keep their stored values.
+        """
+        df = to_sql_frame(table, df, partial=partial)
+        with self.connection() as conn:
+            conn.executemany(upsert_sql(table, list(df.columns), accumulate), sql_rows(df))
+            if table in CHANGE_LOG:
+                conn.executemany(CHANGES_INSERT, change_rows(table, df))
+            if table in ROLLUPS:
+                rollup, measure = ROLLUPS[table]
+                totals = rollup_frame(table, df)
+                if measure in accumulate:
+                    # Added counts roll straight up: one keyed upsert per touched rollup row.
+                    conn.executemany(upsert_sql(rollup, list(totals.columns), [measure]), sql_rows(totals))
+                else:
+                    # Overwritten counts: recompute only the touched rollup rows.
+                    for key in sql_rows(totals[KEYS[rollup]]):
+                        for sql in rebuild_rollup_sql(table, keyed=True):
+                            conn.execute(sql, key)
+
+    def compact(self):
+        """Fold the write-ahead log back into the database file and truncate it."""
+        with self.connection() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def query(self, sql, params=()):
+        with self.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def query_batches(self, sql, params=(), batch_size=BATCH_SIZE):
+        with self.connection() as conn:
+            yield from pd.read_sql_query(sql, conn, params=params, chunksize=batch_size)
+
+    def execute(self, sql, params=()):
+        with self.connection() as conn:
+            return conn.execute(sql, params).rowcount
+
+    def executemany(self, sql, rows):
+        with self.connection() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+
+# ---------- SNOWFLAKE ----------
+class SnowflakeBackend:
+    """Snowflake backend with a small pool of long-lived connections and Arrow result batches."""
+
+    name = "snowflake"
+
+    def __init__(self, config, pool_size=4):
+        import snowflake.connector
+        # Share '?' placeholders with the SQLite backend.
+        snowflake.connector.paramstyle = "qmark"
+        self._connector = snowflake.connector
+        self.config = dict(config)
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(None)
+        with self.connection() as conn:
+            cur = conn.cursor()
+            for ddl in SNOWFLAKE_DDL:
+                cur.execute(ddl)
+
+    def next_seq(self, table):
+        return f"{table}_seq.NEXTVAL"
+
+    def sync_source(self, table):
+        """Snowflake is the source of truth; nothing to seed."""
+
+    @contextmanager
+    def connection(self):
+        conn = self._pool.get()
+        try:
+            if conn is None or conn.is_closed():
+                conn = self._connector.connect(client_session_keep_alive=True, **self.config)
+            yield conn
+        except self._connector.Error:
+            # Connector and database errors can leave the session unusable: reconnect next time.
+            conn = self._discard(conn)
+            raise
+        except Exception:
+            # The caller's own errors leave the connection healthy; just end any open transaction.
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except self._connector.Error:
+                    conn = self._discard(conn)
+            raise
+        finally:
+            self._pool.put(conn)
+
+    def _discard(self, conn):
+        if conn is not None:
+            try:
+                conn.close()
+            except self._connector.Error:
+                pass
+        return None
+
+    def replace_table(self, table, df):
+        df = to_sql_frame(table, df)
+        with self.connection() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            cur.execute(f"DELETE FROM {table}")
+            cur.executemany(insert_sql(table, list(df.columns), next_seq=self.next_seq(table)), list(sql_rows(df)))
+            if table in CHANGE_LOG:
+                cur.execute(CHANGES_INSERT, (table, "reload", None))
+            if table in ROLLUPS:
+                for sql in rebuild_rollup_sql(table):
+                    cur.execute(sql)
+            cur.execute("COMMIT")
+
+    def insert_rows(self, table, df):
+        df = to_sql_frame(table, df)
+        with self.connection() as conn:
+            conn.cursor().executemany(insert_sql(table, list(df.columns), next_seq=self.next_seq(table)),
+                                      list(sql_rows(df)))
+
+    def upsert_rows(self, table, df, accumulate=(), partial=False):
+        df = to_sql_frame(table, df, partial=partial)
+        with self.connection() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            cur.executemany(merge_sql(table, list(df.columns), accumulate), list(sql_rows(df)))
+            if table in CHANGE_LOG:
+                cur.executemany(CHANGES_INSERT, change_rows(table, df))
+            if table in ROLLUPS:
+                rollup, measure = ROLLUPS[table]
+                totals = rollup_frame(table, df)
+                if measure in accumulate:
+                    cur.executemany(merge_sql(rollup, list(totals.columns), [measure]), list(sql_rows(totals)))
+                else:
+                    for key in sql_rows(totals[KEYS[rollup]]):
+                        for sql in rebuild_rollup_sql(table, keyed=True):
+                            cur.execute(sql, key)
+            cur.execute("COMMIT")
+
+    def compact(self):
+        """Snowflake manages its own storage; nothing to compact."""
+
+    def query(self, sql, params=()):
+        batches = list(self.query_batches(sql, params))
+        return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame()
+
+    def query_batches(self, sql, params=(), batch_size=BATCH_SIZE):
+        with self.connection() as conn:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            for table in cur.fetch_arrow_batches():
+                df = table.to_pandas()
+                df.columns = [c.lower() for c in df.columns]
+                yield df
+
+    def execute(self, sql, params=()):
+        with self.connection() as conn:
+            return conn.cursor().execute(sql, params).rowcount
+
+    def executemany(self, sql, rows):
+        with self.connection() as conn:
+            return conn.cursor().executemany(sql, list(rows)).rowcount
+
+
+# ---------- BACKEND SELECTION ----------
+def snowflake_config():
+    """Snowflake credentials from st.secrets['snowflake'] or SNOWFLAKE_* env vars, if any."""
+    try:
+        if "snowflake" in st.secrets:
+            return dict(st.secrets["snowflake"])
+    except Exception:
+        pass
+    keys = ["account", "user", "password", "warehouse", "database", "schema", "role"]
+    config = {k: os.environ[f"SNOWFLAKE_{k.upper()}"] for k in keys if f"SNOWFLAKE_{k.upper()}" in os.environ}
+    return config if "account" in config else None
+
+
+@st.cache_resource(show_spinner=False)
+def get_backend():
+    """One backend per process. DATA_BACKEND=sqlite forces the local stand-in."""
+    config = snowflake_config()
+    if config and os.environ.get("DATA_BACKEND", "").lower() != "sqlite":
+        return SnowflakeBackend(config)
+    return SQLiteBackend()
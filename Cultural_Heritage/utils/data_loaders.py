@@ -0,0 +1,229 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from utils.data_backend import SCHEMA, frame_column, get_backend, key_where, normalize_key, to_sql_frame
+from utils.feedback_log import get_feedback_log
+
+CACHE_TTL = 600
+CACHE_MAX_ENTRIES = 64
+KEY_CHUNK = 250         # keys per lookup query; SQLite rejects expressions deeper than 1000 terms
+
+# (dataset, sql, params) -> (expires_at, version, frame). Cached frames are
+# shared between sessions and must be treated as read-only by callers.
+_cache = OrderedDict()
+_versions = {}
+_cache_lock = threading.Lock()
+
+
+# ---------- CACHE ----------
+def dataset_version(dataset):
+    """Changes on every write through this module."""
+    return _versions.get(dataset, 0)
+
+
+def invalidate(dataset):
+    """Drop cached reads of dataset and bump its version."""
+    with _cache_lock:
+        _versions[dataset] = _versions.get(dataset, 0) + 1
+        for key in [k for k in _cache if k[0] == dataset]:
+            del _cache[key]
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+# ---------- HELPERS ----------
+def _to_frame_names(df):
+    return df.rename(columns=lambda c: frame_column(c.replace("_", " ")))
+
+
+def _sql_column(table, col):
+    name = frame_column(col).lower()
+    if name not in {n for n, _ in SCHEMA[table]}:
+        raise ValueError(f"Unknown column for {table}: {col}")
+    return name
+
+
+def _where(table, filters):
+    """Build a parameterized WHERE clause; list values become IN (...)."""
+    clauses, params = [], []
+    for col, value in filters.items():
+        if value is None:
+            continue
+        name = _sql_column(table, col)
+        if isinstance(value, (list, tuple, set)):
+            value = list(value)
+            clauses.append(f"{name} IN ({', '.join('?' * len(value))})" if value else "1 = 0")
+            params.extend(value)
+        else:
+            clauses.append(f"{name} = ?")
+            params.append(value)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def _read(table, sql=None, params=()):
+    sql = sql or f"SELECT * FROM {table}"
+    key = (table, sql, tuple(params))
+    version = dataset_version(table)
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit and hit[0] > now and hit[1] == version:
+            _cache.move_to_end(key)
+            return hit[2]
+
+    backend = get_backend()
+    backend.sync_source(table)
+    df = _to_frame_names(backend.query(sql, params))
+
+    with _cache_lock:
+        _cache[key] = (now + CACHE_TTL, version, df)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return df
+
+
+def _writer(table):
+    """Backend with table seeded first, so a later seed cannot overwrite this write."""
+    backend = get_backend()
+    backend.sync_source(table)
+    return backend
+
+
+def _replace(table, df):
+    _writer(table).replace_table(table, df)
+    invalidate(table)
+
+
+# ---------- PLACES ----------
+def load_places():
+    return _read("places")
+
+
+def save_places(df):
+    _replace("places", df)
+
+
+def find_place(name, state):
+    """The stored monument matching Name + State (case-insensitive) as a dict, or None. Index lookup, uncached."""
+    backend = _writer("places")
+    df = backend.query(f"SELECT * FROM places{key_where('places')}", normalize_key("places", [name, state]))
+    return _to_frame_names(df).iloc[0].to_dict() if len(df) else None
+
+
+def upsert_places(df, partial=False):
+    """
+    Add or fully replace monuments keyed by Name + State (case-insensitive), in one
+    transaction, recording a change event per key. Unknown columns raise ValueError.
+    With partial=True, columns df lacks keep their stored values on existing monuments.
+    """
+    df = to_sql_frame("places", df, strict=True, partial=partial)
+    _writer("places").upsert_rows("places", df, partial=partial)
+    invalidate("places")
+
+
+def place_changes(since=0):
+    """
+    (last seq, changed rows) for places written after change seq `since`. Changed rows
+    is None when the table was reloaded wholesale and consumers must rebuild.
+    """
+    backend = _writer("places")
+    events = backend.query("SELECT seq, op, key FROM _changes WHERE dataset = ? AND seq > ? ORDER BY seq",
+                           ("places", since))
+    if events.empty:
+        return since, _to_frame_names(backend.query("SELECT * FROM places WHERE 1 = 0"))
+    last = int(events["seq"].iloc[-1])
+    if (events["op"] == "reload").any():
+        return last, None
+    keys = [tuple(json.loads(k)) for k in dict.fromkeys(events["key"])]
+    chunks = [keys[i:i + KEY_CHUNK] for i in range(0, len(keys), KEY_CHUNK)]
+    rows = pd.concat([backend.query(f"SELECT * FROM places{key_where('places', len(chunk))}",
+                                    [v for key in chunk for v in key]) for chunk in chunks], ignore_index=True)
+    return last, _to_frame_names(rows)
+
+
+# ---------- LOGIN ----------
+def load_login_data():
+    return _read("logins")
+
+
+def save_login_data(df):
+    _replace("logins", df)
+
+
+# ---------- TOURIST STATS ----------
+def load_tourist_stats(year=None, visitor_type=None, states=None):
+    """Long-format stats (Year, Type, State, Tourist_Count), filtered in the backend."""
+    where, params = _where("tourist_stats", {"Year": year, "Type": visitor_type, "State": states})
+    return _read("tourist_stats", f"SELECT * FROM tourist_stats{where} ORDER BY year, type, state", params)
+
+
+def load_tourist_totals(group_by=("Type", "State"), visitor_type=None):
+    """
+    Tourist_Count summed per group_by columns, aggregated in the backend. Groupings
+    within Year/Type are read from the incrementally maintained tourist_totals rollup.
+    """
+    keys = [_sql_column("tourist_stats", col) for col in group_by]
+    source = "tourist_totals" if set(keys) <= {"year", "type"} else "tourist_stats"
+    where, params = _where(source, {"Type": visitor_type})
+    sql = (f"SELECT {', '.join(keys)}, SUM(tourist_count) AS tourist_count "
+           f"FROM {source}{where} GROUP BY {', '.join(keys)}")
+    # Cached and versioned with tourist_stats, which the rollup is derived from.
+    return _read("tourist_stats", sql, params)
+
+
+def add_tourist_stats(df):
+    """
+    Add each row's Tourist_Count onto its Year/Type/State, creating missing rows.
+    Only the given rows and their Year/Type totals are written.
+    """
+    _writer("tourist_stats").upsert_rows("tourist_stats", df, accumulate=["tourist_count"])
+    invalidate("tourist_stats")
+
+
+def set_tourist_stats(df):
+    """Upsert rows by Year/Type/State, overwriting their Tourist_Count (re-imports are idempotent)."""
+    _writer("tourist_stats").upsert_rows("tourist_stats", df)
+    invalidate("tourist_stats")
+
+
+def save_tourist_stats(df):
+    """Replace the long-format stats table."""
+    _replace("tourist_stats", df)
+
+
+# ---------- FEEDBACK ----------
+def load_feedback():
+    """Feedback in the order it was appended."""
+    return _read("feedback", "SELECT * FROM feedback ORDER BY seq NULLS FIRST")
+
+
+def feedback_since(since=0):
+    """
+    (last seq, feedback rows appended after seq `since`, in append order). Rows is None when
+    the log no longer reaches `since` (it was replaced) and consumers must rebuild from 0.
+    Reads only the new rows, uncached.
+    """
+    backend = _writer("feedback")
+    last = backend.query("SELECT MAX(seq) AS seq FROM feedback")["seq"].iloc[0]
+    last = 0 if pd.isna(last) else int(last)
+    if last < since:
+        return last, None
+    # Bounded by last, so rows committed after the MAX() are left for the next call.
+    where = "seq > ? AND seq <= ?" if since else "seq IS NULL OR seq <= ?"
+    params = (since, last) if since else (last,)
+    rows = backend.query(f"SELECT * FROM feedback WHERE {where} ORDER BY seq NULLS FIRST", params)
+    return last, _to_frame_names(rows)
+
+
+def append_feedback(df):
+    """Append through the process-wide feedback writer; returns once the rows are committed."""
+    get_feedback_log().append(df)
+    invalidate("feedback")
@@ -0,0 +1,121 @@
+import queue
+import threading
+from datetime import datetime, timezone
+
+import pandas as pd
+import streamlit as st
+
+from utils.data_backend import get_backend
+
+MAX_BATCH = 256
+COMPACT_EVERY = 1000
+
+
+QUEUED, WRITING, CANCELLED = "queued", "writing", "cancelled"
+
+
+class _Submission:
+    """One append() call waiting on the writer."""
+
+    def __init__(self, df):
+        self.df = df
+        self.done = threading.Event()
+        self.error = None
+        self.state = QUEUED
+
+
+class FeedbackLog:
+    """
+    Append-only feedback log with a single writer thread per process. Submissions are
+    queued and group-committed in one INSERT transaction, so the cost of an append does
+    not depend on how much feedback is already stored and concurrent submits never race.
+    """
+
+    def __init__(self, backend, max_batch=MAX_BATCH, compact_every=COMPACT_EVERY):
+        self.backend = backend
+        self.max_batch = max_batch
+        self.compact_every = compact_every
+        self.appended = 0
+        self._queue = queue.Queue()
+        self._state_lock = threading.Lock()
+        self._since_compact = 0
+        threading.Thread(target=self._run, name="feedback-writer", daemon=True).start()
+
+    def append(self, df, timeout=10):
+        """
+        Queue rows and block until they are committed; re-raises the writer's error on failure.
+        Rows still queued after timeout seconds are withdrawn and TimeoutError is raised, so a
+        retry cannot save them twice; rows the writer has already picked up are waited for.
+        """
+        df = df.copy()
+        if "Submitted_At" not in df.columns:
+            df["Submitted_At"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        submission = _Submission(df)
+        self._queue.put(submission)
+        if not submission.done.wait(timeout):
+            with self._state_lock:
+                if submission.state == QUEUED:
+                    submission.state = CANCELLED
+                    raise TimeoutError("Feedback was not saved in time; please try again.")
+            submission.done.wait()
+        if submission.error is not None:
+            raise submission.error
+
+    def pending(self):
+        """Submissions waiting for the writer, including withdrawn ones it has not skipped yet."""
+        return self._queue.qsize()
+
+    def _take_batch(self):
+        """Up to max_batch queued submissions, skipping ones withdrawn by a timed-out append()."""
+        pending = [self._queue.get()]
+        while len(pending) < self.max_batch:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        with self._state_lock:
+            batch = [s for s in pending if s.state == QUEUED]
+            for submission in batch:
+                submission.state = WRITING
+        return batch
+
+    def _write(self, submissions):
+        self.backend.insert_rows("feedback", pd.concat([s.df for s in submissions], ignore_index=True))
+        rows = sum(len(s.df) for s in submissions)
+        self.appended += rows
+        self._since_compact += rows
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                continue
+            try:
+                self._write(batch)
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0].error = e
+                else:
+                    # One bad submission must not fail everyone else's: retry each on its own.
+                    for submission in batch:
+                        try:
+                            self._write([submission])
+                        except Exception as e:
+                            submission.error = e
+            for submission in batch:
+                submission.done.set()
+            if self._since_compact >= self.compact_every:
+                self._since_compact = 0
+                try:
+                    self.backend.compact()
+                except Exception:
+                    # Compaction is housekeeping; the next threshold retries it.
+                    pass
+
+
+@st.cache_resource(show_spinner=False)
+def get_feedback_log():
+    """The process-wide feedback writer."""
+    backend = get_backend()
+    backend.sync_source("feedback")
+    return FeedbackLog(backend)
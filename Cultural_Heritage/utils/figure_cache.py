@@ -0,0 +1,66 @@
+import json
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from utils.perf import payload, stage
+
+MAX_ENTRIES = 128
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+    """
+    Process-wide LRU of pre-serialized Plotly figure JSON, bounded by entry count and
+    total bytes. Keys are (view, selections, data version).
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, build):
+        """Return cached figure JSON for key, calling build() -> go.Figure on a miss."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+
+        payload = pio.to_json(build(), validate=False)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries:
+                self._entries[key] = payload
+                self._bytes += len(payload)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+figure_cache = FigureCache()
+
+
+def cached_figure(view, selections, version, build):
+    """
+    Figure for (view, selections, version) rebuilt from cached JSON with validation
+    skipped; build() only runs on a cache miss. selections must be hashable.
+    """
+    with stage("chart"):
+        figure_json = payload(figure_cache.get_or_build((view, selections, version), build))
+        return go.Figure(json.loads(figure_json), _validate=False)
@@ -0,0 +1,216 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import data_loaders
+from utils.stats_cube import build_stats_cube
+
+HORIZON = 3
+MIN_TRAIN_YEARS = 4
+
+
+# ---------- MODELS ----------
+# Every model takes year offsets x (Year,), counts y (Year x N), a presence/weight
+# mask w (Year x N) and target year offsets fx (N x h), and forecasts all N
+# series at once. Series with fewer than two observations come back as NaN.
+
+def _ols(x, y, w):
+    """Weighted least-squares line per series -> (slope, intercept, valid)."""
+    w = w.astype(float)
+    xc = x[:, None]
+    n = w.sum(axis=0)
+    sx, sy = (w * xc).sum(axis=0), (w * y).sum(axis=0)
+    sxx, sxy = (w * xc * xc).sum(axis=0), (w * xc * y).sum(axis=0)
+    denom = n * sxx - sx ** 2
+    valid = (np.count_nonzero(w, axis=0) >= 2) & (denom > 1e-9)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(valid, (n * sxy - sx * sy) / denom, np.nan)
+        intercept = np.where(valid, (sy - slope * sx) / n, np.nan)
+    return slope, intercept, valid
+
+
+def _line(slope, intercept, fx):
+    return intercept[:, None] + slope[:, None] * fx
+
+
+def linear_forecast(x, y, w, fx):
+    """Straight-line trend, clipped to half the series minimum (the original page behaviour)."""
+    slope, intercept, _ = _ols(x, y, w)
+    floor = np.maximum(0.5 * np.where(w, y, np.inf).min(axis=0), 0)
+    return np.maximum(floor[:, None], np.trunc(_line(slope, intercept, fx)))
+
+
+def loglinear_forecast(x, y, w, fx):
+    """Constant growth rate: a line fitted to log1p(counts)."""
+    slope, intercept, _ = _ols(x, np.log1p(np.maximum(y, 0)), w)
+    return np.trunc(np.expm1(_line(slope, intercept, fx)))
+
+
+def robust_forecast(x, y, w, fx, iterations=5, c=4.685):
+    """Tukey-bisquare IRLS line; outlier years (e.g. 2020-21) end up with ~zero weight."""
+    w = w.astype(bool)
+    weights = w.astype(float)
+    slope, intercept, valid = _ols(x, y, weights)
+    for _ in range(iterations):
+        resid = np.where(w, y - (intercept + slope * x[:, None]), np.nan)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = 1.4826 * np.nanmedian(np.abs(resid), axis=0)
+            u = resid / (c * scale)
+        bisquare = np.where(np.abs(u) < 1, (1 - u ** 2) ** 2, 0.0)
+        # A zero scale means the line already fits exactly; keep the current weights.
+        new_weights = np.where(scale > 0, bisquare, weights) * w
+        slope_new, intercept_new, refit_valid = _ols(x, y, new_weights)
+        # Keep the previous fit for series where bisquare left fewer than two usable years.
+        slope = np.where(refit_valid, slope_new, slope)
+        intercept = np.where(refit_valid, intercept_new, intercept)
+        weights = np.where(refit_valid, new_weights, weights)
+    preds = _line(slope, intercept, fx)
+    return np.where(valid[:, None], np.maximum(np.trunc(preds), 0), np.nan)
+
+
+def holt_forecast(x, y, w, fx, alpha=0.5, beta=0.3, phi=0.9):
+    """Holt's linear trend with a damped trend, run over the year axis for all series."""
+    w = w.astype(bool)
+    n_series = y.shape[1]
+    level = np.full(n_series, np.nan)
+    trend = np.zeros(n_series)
+    last_x = np.full(n_series, np.nan)
+    seen = np.zeros(n_series, dtype=int)
+    for i in range(len(x)):
+        obs = w[i]
+        new = obs & (seen == 0)
+        upd = obs & (seen > 0)
+        level[new], last_x[new] = y[i, new], x[i]
+
+        gap = x[i] - last_x[upd]
+        prev = level[upd]
+        level[upd] = alpha * y[i, upd] + (1 - alpha) * (prev + phi * trend[upd] * gap)
+        trend[upd] = beta * (level[upd] - prev) / gap + (1 - beta) * phi * trend[upd]
+        last_x[upd] = x[i]
+        seen += obs
+    steps = np.maximum(fx - last_x[:, None], 1)
+    damped = phi * (1 - phi ** steps) / (1 - phi)
+    preds = level[:, None] + damped * trend[:, None]
+    return np.where((seen >= 2)[:, None], np.maximum(np.trunc(preds), 0), np.nan)
+
+
+MODELS = {
+    "Linear": linear_forecast,
+    "Damped Holt": holt_forecast,
+    "Log-Linear": loglinear_forecast,
+    "Robust Linear": robust_forecast,
+}
+
+
+# ---------- BACKTEST ----------
+def backtest(x, y, w, models=MODELS, horizon=HORIZON, min_train=MIN_TRAIN_YEARS):
+    """
+    Rolling-origin backtest: for each origin year, fit on earlier years and score the
+    next `horizon` years. Returns model name -> mean sMAPE per series (NaN if never scored).
+    """
+    w = w.astype(bool)
+    n_years, n_series = y.shape
+    totals = {name: np.zeros(n_series) for name in models}
+    counts = {name: np.zeros(n_series) for name in models}
+    for origin in range(min_train, n_years):
+        train = w.copy()
+        train[origin:] = False
+        test = np.arange(origin, min(origin + horizon, n_years))
+        fx = np.broadcast_to(x[test], (n_series, len(test)))
+        actual = y[test].T
+        scored = w[test].T & (train.sum(axis=0) >= 2)[:, None]
+        for name, model in models.items():
+            pred = model(x, y, train, fx)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                err = 2 * np.abs(pred - actual) / (np.abs(pred) + np.abs(actual))
+            err = np.where(pred == actual, 0.0, err)
+            ok = scored & np.isfinite(err)
+            totals[name] += np.where(ok, err, 0).sum(axis=1)
+            counts[name] += ok.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {name: np.where(counts[name] > 0, totals[name] / counts[name], np.nan) for name in models}
+
+
+# ---------- BATCH FORECAST ----------
+class BatchForecast:
+    """
+    Forecasts from every model for every Type x State series of a StatsCube,
+    with a per-series model chosen by rolling-origin backtest error.
+    """
+
+    def __init__(self, cube, horizon=HORIZON, models=MODELS):
+        self.cube = cube
+        self.horizon = horizon
+        self.models = models
+        self.model_names = list(models)
+        self.shape = (len(cube.types), len(cube.states))
+
+        # Years are offset from the first year to keep the normal equations well conditioned.
+        self.x0 = float(cube.years[0]) if cube.years else 0.0
+        self.x = np.asarray(cube.years, dtype=float) - self.x0
+        self.y = cube.values.reshape(len(cube.years), -1).astype(float)
+        self.w = cube.present.reshape(len(cube.years), -1)
+
+        self.valid = (self.w.sum(axis=0) >= 2).reshape(self.shape)
+        last_x = np.where(self.w, self.x[:, None], -np.inf).max(axis=0)
+        fx = last_x[:, None] + np.arange(1, horizon + 1)
+        self.future_years = (fx + self.x0).reshape(*self.shape, horizon)
+        with np.errstate(invalid="ignore"):
+            self.forecasts = {name: model(self.x, self.y, self.w, fx).reshape(*self.shape, horizon)
+                              for name, model in models.items()}
+
+        scores = backtest(self.x, self.y, self.w, models, horizon)
+        self.scores = {name: score.reshape(self.shape) for name, score in scores.items()}
+        stacked = np.stack([np.nan_to_num(self.scores[name], nan=np.inf) for name in self.model_names])
+        # Series that could never be backtested keep the first (linear) model.
+        self.best = np.where(np.isfinite(stacked.min(axis=0)), stacked.argmin(axis=0), 0)
+
+    def forecast(self, state, visitor_type, model=None):
+        """(future years, values, model name) for one series, or None if it has fewer than two years."""
+        t, s = self.cube.type_index[visitor_type], self.cube.state_index[state]
+        if not self.valid[t, s]:
+            return None
+        model = model or self.model_names[self.best[t, s]]
+        years = [str(int(y)) for y in self.future_years[t, s]]
+        return years, [int(v) for v in self.forecasts[model][t, s]], model
+
+    def table(self, visitor_type):
+        """Selected-model forecasts for every state of one Type at the years after the latest data year."""
+        t = self.cube.type_index[visitor_type]
+        n_states = self.shape[1]
+        cols = slice(t * n_states, (t + 1) * n_states)
+        target = max(self.cube.years) + np.arange(1, self.horizon + 1)
+        fx = np.broadcast_to(target - self.x0, (n_states, self.horizon))
+        with np.errstate(invalid="ignore"):
+            preds = np.stack([model(self.x, self.y[:, cols], self.w[:, cols], fx) for model in self.models.values()])
+        rows = np.arange(n_states)
+        chosen = preds[self.best[t], rows]
+        best_score = np.stack([self.scores[name][t] for name in self.model_names])[self.best[t], rows]
+
+        valid = self.valid[t]
+        df = pd.DataFrame({
+            "State": np.asarray(self.cube.states, dtype=object)[valid],
+            "Model": np.asarray(self.model_names, dtype=object)[self.best[t]][valid],
+            "Backtest sMAPE %": np.round(best_score[valid] * 100, 1),
+        })
+        for i, year in enumerate(target):
+            df[str(year)] = chosen[valid, i].astype(np.int64)
+        return df.sort_values(str(target[0]), ascending=False).reset_index(drop=True)
+
+    def score_table(self, visitor_type):
+        """Backtest sMAPE % of every model per state, for comparing models."""
+        t = self.cube.type_index[visitor_type]
+        df = pd.DataFrame({name: np.round(self.scores[name][t] * 100, 1) for name in self.model_names})
+        df.insert(0, "State", self.cube.states)
+        df["Selected"] = np.asarray(self.model_names, dtype=object)[self.best[t]]
+        return df[self.valid[t]].reset_index(drop=True)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_batch_forecast(version):
+    return BatchForecast(build_stats_cube(version))
+
+
+def get_batch_forecast():
+    """Shared forecasts and model selection for the current tourist_stats version."""
+    return build_batch_forecast(data_loaders.dataset_version("tourist_stats"))
@@ -0,0 +1,89 @@
+import base64
+import os
+from io import BytesIO
+
+from PIL import Image
+
+from utils.perf import stage
+
+PLACES_DIR = "data/Places"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+# ---------- LISTING ----------
+def list_valid_dirs(path):
+    return sorted([d for d in os.listdir(path) if os.path.isdir(os.path.join(path, d)) and not d.startswith('.')])
+
+
+def list_valid_images(path):
+    return sorted([f for f in os.listdir(path) if not f.startswith('.') and f.lower().endswith(IMAGE_EXTENSIONS)])
+
+
+def ensure_folder(path):
+    if not os.path.exists(path):
+        os.makedirs(path)
+    return path
+
+
+def list_states(base=PLACES_DIR):
+    if not os.path.exists(base):
+        return []
+    return sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+
+
+def list_places(state, base=PLACES_DIR):
+    state_path = os.path.join(base, state)
+    if not os.path.exists(state_path):
+        return []
+    return sorted([d for d in os.listdir(state_path) if os.path.isdir(os.path.join(state_path, d))])
+
+
+def list_images(state, place=None, base=PLACES_DIR):
+    images = []
+    if place:
+        folder_path = os.path.join(base, state, place)
+        if os.path.exists(folder_path):
+            images = [os.path.join(folder_path, img) for img in os.listdir(folder_path) if img.lower().endswith(IMAGE_EXTENSIONS)]
+    else:
+        state_path = os.path.join(base, state)
+        for place_folder in os.listdir(state_path):
+            place_path = os.path.join(state_path, place_folder)
+            if os.path.isdir(place_path):
+                imgs = [os.path.join(place_path, img) for img in os.listdir(place_path) if img.lower().endswith(IMAGE_EXTENSIONS)]
+                images.extend(imgs)
+    return images
+
+
+def ensure_state_and_place(state, place, base=PLACES_DIR):
+    state_path = ensure_folder(os.path.join(base, state))
+    place_path = ensure_folder(os.path.join(state_path, place))
+    return place_path
+
+
+# ---------- ENCODING ----------
+def encode_image(img_path):
+    with open(img_path, "rb") as img_file:
+        encoded = base64.b64encode(img_file.read()).decode()
+    return f"data:image/jpeg;base64,{encoded}"
+
+
+def load_and_optimize_images(folder, target_size=(320, 200)):
+    """Every image in folder as a base64 JPEG thumbnail, in file name order."""
+    images_base64 = []
+    for file in sorted(os.listdir(folder)):
+        if file.lower().endswith(IMAGE_EXTENSIONS):
+            path = os.path.join(folder, file)
+            img = Image.open(path).convert("RGB")
+            img.thumbnail(target_size, Image.LANCZOS)  # Resize to reduce memory
+            buffered = BytesIO()
+            img.save(buffered, format="JPEG", quality=60)  # Compress
+            encoded = base64.b64encode(buffered.getvalue()).decode()
+            images_base64.append(encoded)
+    return images_base64
+
+
+@stage("marquee html")
+def build_images_html(images):
+    return "".join([
+        f'<img src="data:image/jpeg;base64,{img}" loading="eager" />' for img in images
+    ])
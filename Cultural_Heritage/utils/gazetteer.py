@@ -0,0 +1,452 @@
+import re
+
+# Bundled offline gazetteer: approximate coordinates (WGS84 degrees) for Indian cities and
+# tourist towns, state/UT centroids as a fallback, and the main civil airports.
+# (city, state, latitude, longitude)
+CITIES = [
+    # North
+    ("Delhi", "Delhi", 28.61, 77.21),
+    ("New Delhi", "Delhi", 28.61, 77.21),
+    ("Noida", "Uttar Pradesh", 28.54, 77.39),
+    ("Gurugram", "Haryana", 28.46, 77.03),
+    ("Faridabad", "Haryana", 28.41, 77.32),
+    ("Kurukshetra", "Haryana", 29.97, 76.88),
+    ("Panipat", "Haryana", 29.39, 76.97),
+    ("Pinjore", "Haryana", 30.80, 76.92),
+    ("Chandigarh", "Chandigarh", 30.73, 76.78),
+    ("Amritsar", "Punjab", 31.63, 74.87),
+    ("Anandpur Sahib", "Punjab", 31.24, 76.50),
+    ("Patiala", "Punjab", 30.34, 76.39),
+    ("Ludhiana", "Punjab", 30.90, 75.86),
+    ("Jalandhar", "Punjab", 31.33, 75.58),
+    ("Wagah", "Punjab", 31.60, 74.57),
+    ("Shimla", "Himachal Pradesh", 31.10, 77.17),
+    ("Manali", "Himachal Pradesh", 32.24, 77.19),
+    ("Kullu", "Himachal Pradesh", 31.96, 77.11),
+    ("Dharamshala", "Himachal Pradesh", 32.22, 76.32),
+    ("McLeod Ganj", "Himachal Pradesh", 32.24, 76.32),
+    ("Dalhousie", "Himachal Pradesh", 32.54, 75.97),
+    ("Kasauli", "Himachal Pradesh", 30.90, 76.96),
+    ("Spiti", "Himachal Pradesh", 32.25, 78.03),
+    ("Kaza", "Himachal Pradesh", 32.23, 78.07),
+    ("Srinagar", "Jammu and Kashmir", 34.08, 74.80),
+    ("Gulmarg", "Jammu and Kashmir", 34.05, 74.38),
+    ("Pahalgam", "Jammu and Kashmir", 34.02, 75.32),
+    ("Sonamarg", "Jammu and Kashmir", 34.30, 75.29),
+    ("Jammu", "Jammu and Kashmir", 32.73, 74.86),
+    ("Katra", "Jammu and Kashmir", 32.99, 74.93),
+    ("Leh", "Ladakh", 34.16, 77.58),
+    ("Kargil", "Ladakh", 34.56, 76.13),
+    ("Nubra", "Ladakh", 34.60, 77.55),
+    ("Rishikesh", "Uttarakhand", 30.09, 78.27),
+    ("Haridwar", "Uttarakhand", 29.95, 78.16),
+    ("Dehradun", "Uttarakhand", 30.32, 78.03),
+    ("Mussoorie", "Uttarakhand", 30.46, 78.07),
+    ("Nainital", "Uttarakhand", 29.38, 79.46),
+    ("Jim Corbett", "Uttarakhand", 29.53, 78.77),
+    ("Ramnagar", "Uttarakhand", 29.39, 79.13),
+    ("Kedarnath", "Uttarakhand", 30.73, 79.07),
+    ("Badrinath", "Uttarakhand", 30.74, 79.49),
+    ("Auli", "Uttarakhand", 30.53, 79.57),
+    ("Agra", "Uttar Pradesh", 27.18, 78.01),
+    ("Fatehpur Sikri", "Uttar Pradesh", 27.09, 77.66),
+    ("Mathura", "Uttar Pradesh", 27.49, 77.67),
+    ("Vrindavan", "Uttar Pradesh", 27.58, 77.70),
+    ("Lucknow", "Uttar Pradesh", 26.85, 80.95),
+    ("Varanasi", "Uttar Pradesh", 25.32, 83.01),
+    ("Sarnath", "Uttar Pradesh", 25.38, 83.02),
+    ("Prayagraj", "Uttar Pradesh", 25.44, 81.85),
+    ("Allahabad", "Uttar Pradesh", 25.44, 81.85),
+    ("Ayodhya", "Uttar Pradesh", 26.80, 82.20),
+    ("Jhansi", "Uttar Pradesh", 25.45, 78.57),
+    ("Kanpur", "Uttar Pradesh", 26.45, 80.33),
+    ("Gorakhpur", "Uttar Pradesh", 26.76, 83.37),
+    ("Kushinagar", "Uttar Pradesh", 26.74, 83.89),
+    # West
+    ("Jaipur", "Rajasthan", 26.91, 75.79),
+    ("Udaipur", "Rajasthan", 24.59, 73.71),
+    ("Jodhpur", "Rajasthan", 26.24, 73.02),
+    ("Jaisalmer", "Rajasthan", 26.92, 70.91),
+    ("Bikaner", "Rajasthan", 28.02, 73.31),
+    ("Ajmer", "Rajasthan", 26.45, 74.64),
+    ("Pushkar", "Rajasthan", 26.49, 74.55),
+    ("Mount Abu", "Rajasthan", 24.59, 72.71),
+    ("Chittorgarh", "Rajasthan", 24.89, 74.62),
+    ("Sawai Madhopur", "Rajasthan", 26.02, 76.35),
+    ("Ranthambore", "Rajasthan", 26.02, 76.50),
+    ("Bharatpur", "Rajasthan", 27.22, 77.49),
+    ("Alwar", "Rajasthan", 27.55, 76.63),
+    ("Kumbhalgarh", "Rajasthan", 25.15, 73.59),
+    ("Ranakpur", "Rajasthan", 25.12, 73.47),
+    ("Bundi", "Rajasthan", 25.44, 75.64),
+    ("Kota", "Rajasthan", 25.21, 75.86),
+    ("Ahmedabad", "Gujarat", 23.02, 72.57),
+    ("Gandhinagar", "Gujarat", 23.22, 72.65),
+    ("Vadodara", "Gujarat", 22.31, 73.18),
+    ("Surat", "Gujarat", 21.17, 72.83),
+    ("Rajkot", "Gujarat", 22.30, 70.80),
+    ("Dwarka", "Gujarat", 22.24, 68.97),
+    ("Somnath", "Gujarat", 20.89, 70.40),
+    ("Junagadh", "Gujarat", 21.52, 70.46),
+    ("Sasan Gir", "Gujarat", 21.17, 70.60),
+    ("Bhuj", "Gujarat", 23.24, 69.67),
+    ("Kutch", "Gujarat", 23.73, 69.86),
+    ("Patan", "Gujarat", 23.85, 72.13),
+    ("Modhera", "Gujarat", 23.58, 72.13),
+    ("Kevadia", "Gujarat", 21.88, 73.72),
+    ("Palitana", "Gujarat", 21.52, 71.83),
+    ("Porbandar", "Gujarat", 21.64, 69.61),
+    ("Mumbai", "Maharashtra", 19.08, 72.88),
+    ("Pune", "Maharashtra", 18.52, 73.86),
+    ("Nashik", "Maharashtra", 20.00, 73.79),
+    ("Aurangabad", "Maharashtra", 19.88, 75.34),
+    ("Lonavala", "Maharashtra", 18.75, 73.41),
+    ("Mahabaleshwar", "Maharashtra", 17.92, 73.66),
+    ("Shirdi", "Maharashtra", 19.77, 74.48),
+    ("Nagpur", "Maharashtra", 21.15, 79.09),
+    ("Kolhapur", "Maharashtra", 16.70, 74.24),
+    ("Alibaug", "Maharashtra", 18.64, 72.87),
+    ("Matheran", "Maharashtra", 18.99, 73.27),
+    ("Ratnagiri", "Maharashtra", 16.99, 73.31),
+    ("Panaji", "Goa", 15.49, 73.83),
+    ("Old Goa", "Goa", 15.50, 73.91),
+    ("Calangute", "Goa", 15.54, 73.76),
+    ("Margao", "Goa", 15.27, 73.96),
+    ("Vasco da Gama", "Goa", 15.40, 73.81),
+    ("Goa", "Goa", 15.49, 73.83),
+    ("Daman", "Dadra and Nagar Haveli and Daman and Diu", 20.40, 72.83),
+    ("Diu", "Dadra and Nagar Haveli and Daman and Diu", 20.71, 70.99),
+    ("Silvassa", "Dadra and Nagar Haveli and Daman and Diu", 20.27, 73.02),
+    # Central
+    ("Bhopal", "Madhya Pradesh", 23.26, 77.41),
+    ("Indore", "Madhya Pradesh", 22.72, 75.86),
+    ("Gwalior", "Madhya Pradesh", 26.22, 78.18),
+    ("Khajuraho", "Madhya Pradesh", 24.85, 79.93),
+    ("Ujjain", "Madhya Pradesh", 23.18, 75.78),
+    ("Sanchi", "Madhya Pradesh", 23.48, 77.74),
+    ("Pachmarhi", "Madhya Pradesh", 22.47, 78.43),
+    ("Jabalpur", "Madhya Pradesh", 23.18, 79.99),
+    ("Orchha", "Madhya Pradesh", 25.35, 78.64),
+    ("Mandu", "Madhya Pradesh", 22.34, 75.40),
+    ("Omkareshwar", "Madhya Pradesh", 22.25, 76.15),
+    ("Bhimbetka", "Madhya Pradesh", 22.94, 77.61),
+    ("Kanha", "Madhya Pradesh", 22.33, 80.61),
+    ("Bandhavgarh", "Madhya Pradesh", 23.72, 81.02),
+    ("Raipur", "Chhattisgarh", 21.25, 81.63),
+    ("Jagdalpur", "Chhattisgarh", 19.08, 82.02),
+    ("Bilaspur", "Chhattisgarh", 22.08, 82.15),
+    # East
+    ("Kolkata", "West Bengal", 22.57, 88.36),
+    ("Darjeeling", "West Bengal", 27.04, 88.26),
+    ("Siliguri", "West Bengal", 26.73, 88.40),
+    ("Kalimpong", "West Bengal", 27.06, 88.47),
+    ("Shantiniketan", "West Bengal", 23.68, 87.69),
+    ("Bishnupur", "West Bengal", 23.07, 87.32),
+    ("Murshidabad", "West Bengal", 24.18, 88.27),
+    ("Sundarbans", "West Bengal", 21.95, 88.90),
+    ("Digha", "West Bengal", 21.63, 87.51),
+    ("Bhubaneswar", "Odisha", 20.30, 85.82),
+    ("Puri", "Odisha", 19.81, 85.83),
+    ("Konark", "Odisha", 19.89, 86.09),
+    ("Cuttack", "Odisha", 20.46, 85.88),
+    ("Chilika", "Odisha", 19.72, 85.32),
+    ("Patna", "Bihar", 25.59, 85.14),
+    ("Bodh Gaya", "Bihar", 24.70, 84.99),
+    ("Gaya", "Bihar", 24.79, 85.00),
+    ("Nalanda", "Bihar", 25.14, 85.44),
+    ("Rajgir", "Bihar", 25.03, 85.42),
+    ("Vaishali", "Bihar", 25.99, 85.13),
+    ("Ranchi", "Jharkhand", 23.34, 85.31),
+    ("Jamshedpur", "Jharkhand", 22.80, 86.20),
+    ("Deoghar", "Jharkhand", 24.48, 86.70),
+    # North-east
+    ("Gangtok", "Sikkim", 27.33, 88.61),
+    ("Pelling", "Sikkim", 27.30, 88.24),
+    ("Lachung", "Sikkim", 27.69, 88.74),
+    ("Namchi", "Sikkim", 27.17, 88.36),
+    ("Guwahati", "Assam", 26.14, 91.74),
+    ("Kaziranga", "Assam", 26.58, 93.17),
+    ("Majuli", "Assam", 26.95, 94.17),
+    ("Jorhat", "Assam", 26.76, 94.20),
+    ("Sivasagar", "Assam", 26.98, 94.64),
+    ("Tezpur", "Assam", 26.63, 92.80),
+    ("Shillong", "Meghalaya", 25.58, 91.89),
+    ("Cherrapunji", "Meghalaya", 25.27, 91.73),
+    ("Sohra", "Meghalaya", 25.27, 91.73),
+    ("Mawlynnong", "Meghalaya", 25.20, 91.92),
+    ("Tawang", "Arunachal Pradesh", 27.59, 91.87),
+    ("Itanagar", "Arunachal Pradesh", 27.08, 93.61),
+    ("Ziro", "Arunachal Pradesh", 27.54, 93.83),
+    ("Kohima", "Nagaland", 25.67, 94.11),
+    ("Dimapur", "Nagaland", 25.91, 93.73),
+    ("Imphal", "Manipur", 24.82, 93.94),
+    ("Loktak", "Manipur", 24.55, 93.80),
+    ("Aizawl", "Mizoram", 23.73, 92.72),
+    ("Agartala", "Tripura", 23.83, 91.29),
+    ("Udaipur Tripura", "Tripura", 23.53, 91.48),
+    # South
+    ("Chennai", "Tamil Nadu", 13.08, 80.27),
+    ("Madurai", "Tamil Nadu", 9.93, 78.12),
+    ("Kanyakumari", "Tamil Nadu", 8.08, 77.54),
+    ("Rameswaram", "Tamil Nadu", 9.29, 79.31),
+    ("Ooty", "Tamil Nadu", 11.41, 76.70),
+    ("Kodaikanal", "Tamil Nadu", 10.24, 77.49),
+    ("Thanjavur", "Tamil Nadu", 10.79, 79.14),
+    ("Mahabalipuram", "Tamil Nadu", 12.62, 80.19),
+    ("Kanchipuram", "Tamil Nadu", 12.83, 79.70),
+    ("Tiruchirappalli", "Tamil Nadu", 10.79, 78.70),
+    ("Coimbatore", "Tamil Nadu", 11.02, 76.96),
+    ("Vellore", "Tamil Nadu", 12.92, 79.13),
+    ("Tiruvannamalai", "Tamil Nadu", 12.23, 79.07),
+    ("Chidambaram", "Tamil Nadu", 11.40, 79.69),
+    ("Yercaud", "Tamil Nadu", 11.78, 78.21),
+    ("Puducherry", "Puducherry", 11.94, 79.81),
+    ("Pondicherry", "Puducherry", 11.94, 79.81),
+    ("Bengaluru", "Karnataka", 12.97, 77.59),
+    ("Bangalore", "Karnataka", 12.97, 77.59),
+    ("Mysuru", "Karnataka", 12.30, 76.64),
+    ("Mysore", "Karnataka", 12.30, 76.64),
+    ("Hampi", "Karnataka", 15.34, 76.46),
+    ("Coorg", "Karnataka", 12.42, 75.74),
+    ("Madikeri", "Karnataka", 12.42, 75.74),
+    ("Gokarna", "Karnataka", 14.55, 74.32),
+    ("Udupi", "Karnataka", 13.34, 74.74),
+    ("Mangaluru", "Karnataka", 12.91, 74.86),
+    ("Mangalore", "Karnataka", 12.91, 74.86),
+    ("Chikmagalur", "Karnataka", 13.32, 75.77),
+    ("Badami", "Karnataka", 15.92, 75.68),
+    ("Bijapur", "Karnataka", 16.83, 75.71),
+    ("Vijayapura", "Karnataka", 16.83, 75.71),
+    ("Shravanabelagola", "Karnataka", 12.86, 76.49),
+    ("Halebidu", "Karnataka", 13.21, 75.99),
+    ("Belur", "Karnataka", 13.16, 75.86),
+    ("Srirangapatna", "Karnataka", 12.42, 76.68),
+    ("Jog Falls", "Karnataka", 14.23, 74.81),
+    ("Hyderabad", "Telangana", 17.39, 78.49),
+    ("Secunderabad", "Telangana", 17.44, 78.50),
+    ("Warangal", "Telangana", 17.97, 79.59),
+    ("Visakhapatnam", "Andhra Pradesh", 17.69, 83.22),
+    ("Vijayawada", "Andhra Pradesh", 16.51, 80.65),
+    ("Tirupati", "Andhra Pradesh", 13.63, 79.42),
+    ("Tirumala", "Andhra Pradesh", 13.68, 79.35),
+    ("Amaravati", "Andhra Pradesh", 16.57, 80.36),
+    ("Araku Valley", "Andhra Pradesh", 18.33, 82.87),
+    ("Srisailam", "Andhra Pradesh", 16.07, 78.87),
+    ("Lepakshi", "Andhra Pradesh", 13.80, 77.61),
+    ("Kochi", "Kerala", 9.93, 76.27),
+    ("Cochin", "Kerala", 9.93, 76.27),
+    ("Munnar", "Kerala", 10.09, 77.06),
+    ("Alappuzha", "Kerala", 9.50, 76.34),
+    ("Alleppey", "Kerala", 9.50, 76.34),
+    ("Thiruvananthapuram", "Kerala", 8.52, 76.94),
+    ("Trivandrum", "Kerala", 8.52, 76.94),
+    ("Kovalam", "Kerala", 8.40, 76.98),
+    ("Varkala", "Kerala", 8.73, 76.72),
+    ("Thekkady", "Kerala", 9.60, 77.16),
+    ("Wayanad", "Kerala", 11.69, 76.13),
+    ("Kozhikode", "Kerala", 11.26, 75.78),
+    ("Thrissur", "Kerala", 10.53, 76.21),
+    ("Kumarakom", "Kerala", 9.62, 76.43),
+    ("Guruvayur", "Kerala", 10.59, 76.04),
+    ("Sabarimala", "Kerala", 9.43, 77.08),
+    # Islands
+    ("Port Blair", "Andaman and Nicobar Islands", 11.62, 92.73),
+    ("Havelock Island", "Andaman and Nicobar Islands", 11.97, 92.99),
+    ("Neil Island", "Andaman and Nicobar Islands", 11.83, 93.03),
+    ("Kavaratti", "Lakshadweep", 10.57, 72.64),
+    ("Agatti", "Lakshadweep", 10.86, 72.19),
+]
+
+# Approximate geographic centre of each state / union territory, used when a city is unknown.
+STATE_CENTROIDS = {
+    "Andaman and Nicobar Islands": (11.74, 92.66),
+    "Andhra Pradesh": (15.91, 79.74),
+    "Arunachal Pradesh": (28.22, 94.73),
+    "Assam": (26.20, 92.94),
+    "Bihar": (25.10, 85.31),
+    "Chandigarh": (30.73, 76.78),
+    "Chhattisgarh": (21.28, 81.87),
+    "Dadra and Nagar Haveli and Daman and Diu": (20.40, 72.83),
+    "Delhi": (28.70, 77.10),
+    "Goa": (15.30, 74.12),
+    "Gujarat": (22.26, 71.19),
+    "Haryana": (29.06, 76.09),
+    "Himachal Pradesh": (31.10, 77.17),
+    "Jammu and Kashmir": (33.78, 76.58),
+    "Jharkhand": (23.61, 85.28),
+    "Karnataka": (15.32, 75.71),
+    "Kerala": (10.85, 76.27),
+    "Ladakh": (34.15, 77.58),
+    "Lakshadweep": (10.57, 72.64),
+    "Madhya Pradesh": (22.97, 78.66),
+    "Maharashtra": (19.75, 75.71),
+    "Manipur": (24.66, 93.91),
+    "Meghalaya": (25.47, 91.37),
+    "Mizoram": (23.16, 92.94),
+    "Nagaland": (26.16, 94.56),
+    "Odisha": (20.95, 85.10),
+    "Puducherry": (11.94, 79.81),
+    "Punjab": (31.15, 75.34),
+    "Rajasthan": (27.02, 74.22),
+    "Sikkim": (27.53, 88.51),
+    "Tamil Nadu": (11.13, 78.66),
+    "Telangana": (18.11, 79.02),
+    "Tripura": (23.94, 91.99),
+    "Uttar Pradesh": (26.85, 80.95),
+    "Uttarakhand": (30.07, 79.02),
+    "West Bengal": (22.99, 87.85),
+}
+
+# Older or alternate spellings found in the places data -> STATE_CENTROIDS names.
+STATE_ALIASES = {
+    "andaman & nicobar": "Andaman and Nicobar Islands",
+    "andaman and nicobar": "Andaman and Nicobar Islands",
+    "jammu & kashmir": "Jammu and Kashmir",
+    "nct of delhi": "Delhi",
+    "orissa": "Odisha",
+    "pondicherry": "Puducherry",
+    "uttaranchal": "Uttarakhand",
+    "dadra and nagar haveli": "Dadra and Nagar Haveli and Daman and Diu",
+    "daman and diu": "Dadra and Nagar Haveli and Daman and Diu",
+}
+
+# (IATA code, airport, latitude, longitude)
+AIRPORTS = [
+    ("DEL", "Delhi Indira Gandhi", 28.556, 77.100),
+    ("BOM", "Mumbai Chhatrapati Shivaji", 19.090, 72.866),
+    ("BLR", "Bengaluru Kempegowda", 13.199, 77.707),
+    ("MAA", "Chennai", 12.994, 80.171),
+    ("CCU", "Kolkata Netaji Subhas Chandra Bose", 22.655, 88.447),
+    ("HYD", "Hyderabad Rajiv Gandhi", 17.240, 78.429),
+    ("COK", "Kochi", 10.152, 76.402),
+    ("TRV", "Thiruvananthapuram", 8.482, 76.920),
+    ("CCJ", "Kozhikode", 11.137, 75.955),
+    ("CNN", "Kannur", 11.919, 75.547),
+    ("AMD", "Ahmedabad", 23.073, 72.627),
+    ("PNQ", "Pune", 18.582, 73.920),
+    ("GOI", "Goa Dabolim", 15.381, 73.831),
+    ("GOX", "Goa Mopa", 15.744, 73.861),
+    ("JAI", "Jaipur", 26.824, 75.812),
+    ("UDR", "Udaipur", 24.618, 73.896),
+    ("JDH", "Jodhpur", 26.251, 73.049),
+    ("JSA", "Jaisalmer", 26.889, 70.865),
+    ("BKB", "Bikaner", 28.071, 73.207),
+    ("KQH", "Kishangarh (Ajmer)", 26.601, 74.812),
+    ("LKO", "Lucknow", 26.761, 80.889),
+    ("VNS", "Varanasi", 25.452, 82.859),
+    ("AGR", "Agra", 27.156, 77.961),
+    ("IXD", "Prayagraj", 25.440, 81.734),
+    ("AYJ", "Ayodhya", 26.751, 82.149),
+    ("GOP", "Gorakhpur", 26.740, 83.450),
+    ("KNU", "Kanpur", 26.404, 80.410),
+    ("ATQ", "Amritsar", 31.710, 74.797),
+    ("IXC", "Chandigarh", 30.674, 76.789),
+    ("LUH", "Ludhiana", 30.855, 75.952),
+    ("SXR", "Srinagar", 33.987, 74.774),
+    ("IXJ", "Jammu", 32.689, 74.837),
+    ("IXL", "Leh", 34.136, 77.547),
+    ("SLV", "Shimla", 31.082, 77.068),
+    ("KUU", "Kullu-Manali (Bhuntar)", 31.877, 77.154),
+    ("DHM", "Dharamshala (Gaggal)", 32.165, 76.263),
+    ("DED", "Dehradun", 30.190, 78.180),
+    ("PGH", "Pantnagar", 29.033, 79.474),
+    ("BHO", "Bhopal", 23.288, 77.337),
+    ("IDR", "Indore", 22.722, 75.801),
+    ("GWL", "Gwalior", 26.293, 78.228),
+    ("HJR", "Khajuraho", 24.817, 79.919),
+    ("JLR", "Jabalpur", 23.178, 80.052),
+    ("RPR", "Raipur", 21.180, 81.739),
+    ("JGB", "Jagdalpur", 19.074, 82.037),
+    ("NAG", "Nagpur", 21.092, 79.047),
+    ("IXU", "Aurangabad", 19.863, 75.398),
+    ("ISK", "Nashik", 20.119, 73.913),
+    ("SAG", "Shirdi", 19.689, 74.379),
+    ("KLH", "Kolhapur", 16.665, 74.289),
+    ("STV", "Surat", 21.114, 72.742),
+    ("BDQ", "Vadodara", 22.336, 73.226),
+    ("HSR", "Rajkot Hirasar", 22.380, 71.030),
+    ("BHJ", "Bhuj", 23.288, 69.670),
+    ("JGA", "Jamnagar", 22.466, 70.013),
+    ("PBD", "Porbandar", 21.649, 69.657),
+    ("IXK", "Keshod", 21.317, 70.270),
+    ("DIU", "Diu", 20.713, 70.921),
+    ("BBI", "Bhubaneswar", 20.244, 85.818),
+    ("JRG", "Jharsuguda", 21.914, 84.050),
+    ("PAT", "Patna", 25.591, 85.088),
+    ("GAY", "Gaya", 24.744, 84.951),
+    ("DBR", "Darbhanga", 26.195, 85.917),
+    ("IXR", "Ranchi", 23.314, 85.322),
+    ("IXW", "Jamshedpur", 22.813, 86.169),
+    ("DGH", "Deoghar", 24.447, 86.703),
+    ("IXB", "Bagdogra", 26.681, 88.329),
+    ("PYG", "Pakyong", 27.226, 88.586),
+    ("GAU", "Guwahati", 26.106, 91.586),
+    ("JRH", "Jorhat", 26.732, 94.176),
+    ("DIB", "Dibrugarh", 27.484, 95.017),
+    ("TEZ", "Tezpur", 26.709, 92.785),
+    ("IXS", "Silchar", 24.913, 92.979),
+    ("SHL", "Shillong", 25.704, 91.979),
+    ("HGI", "Itanagar Donyi Polo", 26.970, 93.643),
+    ("DMU", "Dimapur", 25.884, 93.771),
+    ("IMF", "Imphal", 24.760, 93.897),
+    ("AJL", "Aizawl", 23.841, 92.620),
+    ("IXA", "Agartala", 23.887, 91.240),
+    ("IXM", "Madurai", 9.835, 78.093),
+    ("TRZ", "Tiruchirappalli", 10.765, 78.710),
+    ("CJB", "Coimbatore", 11.030, 77.043),
+    ("TCR", "Thoothukudi", 8.724, 78.026),
+    ("SXV", "Salem", 11.783, 78.065),
+    ("PNY", "Puducherry", 11.968, 79.812),
+    ("TIR", "Tirupati", 13.633, 79.543),
+    ("VGA", "Vijayawada", 16.530, 80.797),
+    ("VTZ", "Visakhapatnam", 17.721, 83.225),
+    ("RJA", "Rajahmundry", 17.110, 81.818),
+    ("IXE", "Mangaluru", 12.961, 74.890),
+    ("MYQ", "Mysuru", 12.230, 76.656),
+    ("HBX", "Hubballi", 15.362, 75.085),
+    ("IXG", "Belagavi", 15.859, 74.618),
+    ("VDY", "Vijayanagar (Hampi)", 15.175, 76.634),
+    ("IXZ", "Port Blair", 11.641, 92.730),
+    ("AGX", "Agatti", 10.824, 72.176),
+]
+
+_PUNCT = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(text):
+    """Lowercase, punctuation-free form used to match city and state names."""
+    return _PUNCT.sub(" ", str(text).lower()).strip()
+
+
+_STATES = {normalize_name(s): s for s in STATE_CENTROIDS}
+_STATES.update({normalize_name(alias): s for alias, s in STATE_ALIASES.items()})
+
+# city -> {state: (lat, lon)}; a city name can exist in more than one state.
+_CITIES = {}
+for _city, _state, _lat, _lon in CITIES:
+    _CITIES.setdefault(normalize_name(_city), {})[_state] = (_lat, _lon)
+
+
+def canonical_state(state):
+    return _STATES.get(normalize_name(state))
+
+
+def locate(city, state=None):
+    """
+    (lat, lon, precision) for a city, where precision is "city" or "state" (fell back to the
+    state centroid). Returns (None, None, None) when neither is known.
+    """
+    state = canonical_state(state) if state is not None else None
+    matches = _CITIES.get(normalize_name(city), {})
+    if state in matches:
+        return (*matches[state], "city")
+    if matches and (state is None or len(matches) == 1 and state not in STATE_CENTROIDS):
+        return (*next(iter(matches.values())), "city")
+    if state in STATE_CENTROIDS:
+        return (*STATE_CENTROIDS[state], "state")
+    return None, None, None
+
+
+def city_options():
+    """Sorted "City, State" labels for every bundled city, for pickers."""
+    return sorted({f"{city}, {state}" for city, state, _, _ in CITIES})
@@ -0,0 +1,141 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import gazetteer
+from utils.catalog import get_catalog
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.2
+CELL_DEGREES = 0.5          # grid cell edge, roughly 55 km north-south
+MAX_DISTANCE_KM = math.pi * EARTH_RADIUS_KM
+
+
+def haversine_km(lat, lon, lats, lons):
+    """Great-circle distance in km from one point to arrays of points."""
+    lat, lon = math.radians(lat), math.radians(lon)
+    lats, lons = np.radians(lats), np.radians(lons)
+    a = np.sin((lats - lat) / 2) ** 2 + math.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class GridIndex:
+    """
+    Fixed lat/long grid over points: positions are sorted by cell so each cell is one
+    contiguous slice. A query only measures points in the cells its radius can reach.
+    """
+
+    def __init__(self, lats, lons, cell_degrees=CELL_DEGREES):
+        self.cell = cell_degrees
+        self.n_cols = int(math.ceil(360 / cell_degrees))
+        lats, lons = np.asarray(lats, dtype=np.float64), np.asarray(lons, dtype=np.float64)
+        cells = self._cell(lats, lons)
+        self.order = np.argsort(cells, kind="stable")
+        self.lats, self.lons = lats[self.order], lons[self.order]
+        ids, starts, counts = np.unique(cells[self.order], return_index=True, return_counts=True)
+        self.slices = {int(c): (int(s), int(s + n)) for c, s, n in zip(ids, starts, counts)}
+
+    def __len__(self):
+        return len(self.order)
+
+    def _cell(self, lats, lons):
+        rows = np.floor((np.asarray(lats) + 90) / self.cell).astype(np.int64)
+        cols = np.floor((np.asarray(lons) + 180) / self.cell).astype(np.int64)
+        return rows * self.n_cols + cols
+
+    def _candidates(self, lat, lon, km):
+        """Sorted-array positions of points in cells overlapping the radius' bounding box."""
+        dlat = km / KM_PER_DEGREE
+        widest = math.cos(math.radians(min(abs(lat) + dlat, 89.9)))
+        dlon = km / (KM_PER_DEGREE * widest)
+        rows = range(int((max(lat - dlat, -90) + 90) // self.cell), int((min(lat + dlat, 90) + 90) // self.cell) + 1)
+        cols = range(int((max(lon - dlon, -180) + 180) // self.cell), int((min(lon + dlon, 180) + 180) // self.cell) + 1)
+        if len(rows) * len(cols) >= len(self.slices):
+            return None                         # cheaper to measure everything
+        parts = [np.arange(*self.slices[c]) for c in (r * self.n_cols + k for r in rows for k in cols)
+                 if c in self.slices]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+    def within(self, lat, lon, km):
+        """(point positions, distances in km) within km of (lat, lon), nearest first."""
+        candidates = self._candidates(lat, lon, km)
+        if candidates is None:
+            candidates = np.arange(len(self.order))
+        dist = haversine_km(lat, lon, self.lats[candidates], self.lons[candidates])
+        keep = dist <= km
+        hits, dist = candidates[keep], dist[keep]
+        first = np.argsort(dist, kind="stable")
+        return self.order[hits[first]], dist[first]
+
+    def nearest(self, lat, lon, k=1):
+        """(point positions, distances in km) of the k nearest points, nearest first."""
+        km = self.cell * KM_PER_DEGREE
+        while True:
+            positions, dist = self.within(lat, lon, km)
+            if len(positions) >= k or km >= MAX_DISTANCE_KM:
+                return positions[:k], dist[:k]
+            km *= 2
+
+
+class PlaceGeoIndex:
+    """
+    Places joined to the bundled gazetteer (city coordinates, else the state centroid)
+    with grid indexes over the located places and the airports. Queries return
+    distances indexed by the catalog's place labels, nearest first.
+    """
+
+    def __init__(self, places):
+        located = {}
+        for city, state in set(zip(places["City"], places["State"])):
+            located[(city, state)] = gazetteer.locate(city, state)
+        coords = [located[key] for key in zip(places["City"], places["State"])]
+        frame = pd.DataFrame(coords, index=places.index, columns=["Lat", "Lon", "Precision"])
+        self.coordinates = frame.dropna(subset=["Lat"]).astype({"Lat": "float64", "Lon": "float64"})
+        self.unlocated = len(frame) - len(self.coordinates)
+        self.labels = self.coordinates.index.to_numpy()
+        self.grid = GridIndex(self.coordinates["Lat"], self.coordinates["Lon"])
+
+        self.airports = pd.DataFrame(gazetteer.AIRPORTS, columns=["Code", "Airport", "Lat", "Lon"])
+        self.airport_grid = GridIndex(self.airports["Lat"], self.airports["Lon"])
+        # Nearest airport per place is fixed for a catalog generation, so it is computed up
+        # front, once per distinct location (places in a city share its coordinates).
+        points = self.coordinates[["Lat", "Lon"]].drop_duplicates()
+        nearest = {}
+        for lat, lon in points.itertuples(index=False):
+            code, _, km = self.nearest_airport(lat, lon)
+            nearest[(lat, lon)] = (code, round(km, 1))
+        pairs = [nearest[p] for p in zip(self.coordinates["Lat"], self.coordinates["Lon"])]
+        self.nearest_airports = pd.DataFrame(pairs, index=self.coordinates.index,
+                                             columns=["Nearest_Airport", "Airport_Km"])
+
+    def _hits(self, positions, dist):
+        return pd.Series(dist, index=self.labels[positions], name="Distance_Km")
+
+    def within(self, lat, lon, km, k=None):
+        """Distances of places within km of (lat, lon), optionally only the k nearest."""
+        positions, dist = self.grid.within(lat, lon, km)
+        return self._hits(positions[:k], dist[:k])
+
+    def nearest(self, lat, lon, k=10):
+        """Distances of the k places nearest to (lat, lon)."""
+        return self._hits(*self.grid.nearest(lat, lon, k))
+
+    def nearest_airport(self, lat, lon):
+        """(IATA code, airport name, distance in km) of the airport nearest to (lat, lon)."""
+        positions, dist = self.airport_grid.nearest(lat, lon)
+        row = self.airports.iloc[int(positions[0])]
+        return row["Code"], row["Airport"], float(dist[0])
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_geo_index(generation, _catalog):
+    # Keyed by generation only; _catalog is that generation, so labels match its places.
+    return PlaceGeoIndex(_catalog.places)
+
+
+def get_geo_index(catalog=None):
+    """The shared spatial index for catalog (the current places catalog by default)."""
+    catalog = catalog if catalog is not None else get_catalog()
+    return build_geo_index(catalog.generation, catalog)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import streamlit as st
+
+
+# ---------- HELPERS ----------
+def build_haystack(df, columns):
+    """Lower-cased, separator-joined text of the searchable columns, one entry per row."""
+    # Via the string dtype so categorical and Arrow-backed columns work too.
+    text = df[columns[0]].astype("string").fillna("")
+    for col in columns[1:]:
+        text = text + "\x1f" + df[col].astype("string").fillna("")
+    return text.str.lower()
+
+
+def normalize_query(query):
+    return str(query).strip().lower()
+
+
+# ---------- INCREMENTAL SEARCH ----------
+class IncrementalSearch:
+    """
+    Per-session literal substring search over a shared haystack.
+    Recent results are kept in a small LRU; a query that contains a cached one
+    is only matched against that cached (smaller) result set.
+    """
+
+    def __init__(self, haystack, max_entries=16):
+        self.haystack = haystack
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+
+    def matches(self, query):
+        """Return the slice of the haystack whose rows contain query."""
+        query = normalize_query(query)
+        if not query:
+            return self.haystack
+        if query in self._cache:
+            self._cache.move_to_end(query)
+            return self._cache[query]
+
+        base = self.haystack
+        for prev, result in self._cache.items():
+            if prev in query and len(result) < len(base):
+                base = result
+
+        result = base[base.str.contains(query, regex=False)]
+        self._cache[query] = result
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return result
+
+
+def session_search(key, haystack):
+    """Return this session's IncrementalSearch, starting fresh when the shared haystack is rebuilt."""
+    searcher = st.session_state.get(key)
+    if searcher is None or searcher.haystack is not haystack:
+        searcher = IncrementalSearch(haystack)
+        st.session_state[key] = searcher
+    return searcher
@@ -0,0 +1,174 @@
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import gazetteer
+from utils.catalog import get_catalog
+from utils.geo_index import get_geo_index
+from utils.stats_cube import build_stats_cube
+
+INDIA_BBOX = (6.0, 68.0, 37.5, 97.5)      # south, west, north, east
+MAX_ZOOM = 6
+BASE_CELL_DEGREES = 2.0     # cluster cell edge at zoom 0; halves with every zoom level
+BUCKET_CELLS = 4            # viewports are snapped outward to this many cells so small pans share clusters
+MAX_MARKERS = 300
+MAX_CLUSTER_ENTRIES = 256
+COLOR_CLASSES = 5
+CLASS_COLORS = ["#ffffb2", "#fecc5c", "#fd8d3c", "#f03b20", "#bd0026"]
+
+# Shared Plotly geo styling for the map views (offline Natural Earth outlines, no tile server).
+MAP_GEO = dict(
+    projection_type="mercator", resolution=50, showcountries=True, countrycolor="#888888",
+    showland=True, landcolor="#1c1c1c", showocean=True, oceancolor="#0b1a2a",
+    showlakes=False, coastlinecolor="#888888", bgcolor="rgba(0,0,0,0)",
+)
+
+
+def cell_degrees(zoom):
+    return BASE_CELL_DEGREES / 2 ** zoom
+
+
+def view_bbox(center, zoom):
+    """(south, west, north, east) of a viewport at zoom: all of India at 0, half the span per level."""
+    south, west, north, east = INDIA_BBOX
+    half_lat, half_lon = (north - south) / 2 ** (zoom + 1), (east - west) / 2 ** (zoom + 1)
+    lat, lon = center
+    return lat - half_lat, lon - half_lon, lat + half_lat, lon + half_lon
+
+
+def bbox_bucket(bbox, zoom):
+    """bbox snapped outward to the bucket grid for zoom."""
+    step = cell_degrees(zoom) * BUCKET_CELLS
+    south, west, north, east = bbox
+    return (math.floor(south / step) * step, math.floor(west / step) * step,
+            math.ceil(north / step) * step, math.ceil(east / step) * step)
+
+
+def filter_key(labels):
+    """Digest of the visible place labels (None = all places), so equal filter results share clusters."""
+    if labels is None:
+        return "all"
+    return hashlib.blake2b(np.sort(np.asarray(labels, dtype=np.int64)).tobytes(), digest_size=16).hexdigest()
+
+
+def grid_clusters(points, names, zoom, bbox, max_markers=MAX_MARKERS):
+    """
+    Points (Lat/Lon frame indexed by place label) inside bbox, grouped into grid cells of
+    cell_degrees(zoom). The cell size doubles until at most max_markers clusters remain.
+    Returns Lat/Lon (cluster centroid), Count and Label per cluster.
+    """
+    south, west, north, east = bbox
+    lats, lons = points["Lat"].to_numpy(), points["Lon"].to_numpy()
+    inside = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+    lats, lons, labels = lats[inside], lons[inside], points.index[inside]
+    cell = cell_degrees(zoom)
+    while True:
+        n_cols = int(math.ceil(360 / cell))
+        cells = np.floor((lats + 90) / cell).astype(np.int64) * n_cols + np.floor((lons + 180) / cell).astype(np.int64)
+        ids, first, inverse, counts = np.unique(cells, return_index=True, return_inverse=True, return_counts=True)
+        if len(ids) <= max_markers:
+            break
+        cell *= 2
+    clusters = pd.DataFrame({
+        "Lat": np.bincount(inverse, weights=lats, minlength=len(ids)) / counts,
+        "Lon": np.bincount(inverse, weights=lons, minlength=len(ids)) / counts,
+        "Count": counts,
+    })
+    clusters["Label"] = [f"{n:,} places" for n in counts]
+    clusters.loc[counts == 1, "Label"] = names.loc[labels[first[counts == 1]]].astype(str).to_numpy()
+    return clusters
+
+
+class ClusterCache:
+    """
+    Map clusters for one catalog generation, computed server-side and cached per
+    (zoom, bbox bucket, filters) in an LRU, so panning within a bucket and repeating a
+    filter never re-clusters and the browser gets at most MAX_MARKERS points.
+    """
+
+    def __init__(self, geo, names, max_entries=MAX_CLUSTER_ENTRIES):
+        self.points = geo.coordinates[["Lat", "Lon"]]
+        self.names = names
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clusters(self, zoom, bbox, labels=None):
+        """Clusters covering bbox at zoom for the places in labels (None = all)."""
+        bucket = bbox_bucket(bbox, zoom)
+        key = (zoom, bucket, filter_key(labels))
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return hit
+
+        points = self.points if labels is None else self.points[self.points.index.isin(labels)]
+        result = grid_clusters(points, self.names, zoom, bucket)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+
+class StateMap:
+    """
+    State-level map values for every (Year, Type) of the stats cube, precomputed once per
+    stats version: centroid, count, share of the national total and a colour class.
+    Class breaks are quantiles over all years of a visitor type, so colours compare across years.
+    """
+
+    def __init__(self, cube):
+        self.cube = cube
+        names = [gazetteer.canonical_state(s) for s in cube.states]
+        self.positions = np.array([i for i, name in enumerate(names) if name is not None], dtype=np.int64)
+        self.unlocated = [s for s, name in zip(cube.states, names) if name is None]
+        centroids = np.array([gazetteer.STATE_CENTROIDS[names[i]] for i in self.positions]).reshape(-1, 2)
+        self.lats, self.lons = centroids[:, 0], centroids[:, 1]
+        self.breaks = {}
+        for visitor_type, t in cube.type_index.items():
+            values = cube.values[:, t][:, self.positions]
+            values = values[values > 0]
+            quantiles = np.linspace(0, 1, COLOR_CLASSES + 1)[1:-1]
+            self.breaks[visitor_type] = np.quantile(values, quantiles) if len(values) else np.zeros(len(quantiles))
+
+    def frame(self, year, visitor_type):
+        """State, Lat, Lon, Tourist_Count, Share (%) and Class (0 = lowest) for one year and type."""
+        counts = self.cube.values[self.cube.year_index[year], self.cube.type_index[visitor_type]][self.positions]
+        total = self.cube.year_totals[self.cube.year_index[year], self.cube.type_index[visitor_type]]
+        return pd.DataFrame({
+            "State": [self.cube.states[i] for i in self.positions],
+            "Lat": self.lats,
+            "Lon": self.lons,
+            "Tourist_Count": counts,
+            "Share": np.round(100 * counts / total, 2) if total else 0.0,
+            "Class": np.searchsorted(self.breaks[visitor_type], counts, side="right"),
+        })
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_cluster_cache(generation, _catalog):
+    # Keyed by generation only; the geo index and names both come from _catalog, that generation.
+    return ClusterCache(get_geo_index(_catalog), _catalog.places["Name"])
+
+
+def get_cluster_cache(catalog=None):
+    """The shared map cluster cache for catalog (the current places catalog by default)."""
+    catalog = catalog if catalog is not None else get_catalog()
+    return build_cluster_cache(catalog.generation, catalog)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_state_map(version):
+    return StateMap(build_stats_cube(version))
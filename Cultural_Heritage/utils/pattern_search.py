@@ -0,0 +1,95 @@
+import multiprocessing
+import re
+import threading
+
+import streamlit as st
+
+PATTERN_TIMEOUT = 0.5
+MAX_PATTERN_LENGTH = 200
+START_TIMEOUT = 30
+
+
+class PatternTimeout(Exception):
+    """A pattern did not finish within the time limit."""
+
+
+def _worker(conn):
+    """Child process loop: keeps the latest haystack and answers pattern queries with matching positions."""
+    values = []
+    while True:
+        op, payload = conn.recv()
+        if op == "load":
+            values = payload
+            conn.send(len(values))
+        else:
+            regex = re.compile(payload, re.IGNORECASE)
+            conn.send([i for i, text in enumerate(values) if regex.search(text)])
+
+
+class PatternSearcher:
+    """
+    Opt-in regular-expression search over a haystack, evaluated in a separate worker
+    process. A pattern that runs past the time limit (e.g. catastrophic backtracking on
+    '(a+)+$') gets the worker killed and restarted instead of pinning the server.
+    """
+
+    def __init__(self, timeout=PATTERN_TIMEOUT):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._loaded = None
+
+    def _start(self):
+        # spawn, not fork: the server process is multi-threaded.
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child = ctx.Pipe()
+        self._process = ctx.Process(target=_worker, args=(child,), name="pattern-search", daemon=True)
+        self._process.start()
+        self._loaded = None
+
+    def _kill(self):
+        self._process.kill()
+        self._process.join()
+        self._process = None
+
+    def _call(self, op, payload, timeout):
+        self._conn.send((op, payload))
+        if not self._conn.poll(timeout):
+            self._kill()
+            raise PatternTimeout(f"Pattern took longer than {timeout:g}s and was stopped")
+        return self._conn.recv()
+
+    def matches(self, haystack, pattern, key):
+        """
+        Rows of haystack (a Series) matching pattern, case-insensitively. key identifies the
+        haystack's contents so it is only sent to the worker when it changes.
+        Raises re.error for invalid patterns and PatternTimeout for slow ones.
+        """
+        if len(pattern) > MAX_PATTERN_LENGTH:
+            raise re.error(f"pattern is longer than {MAX_PATTERN_LENGTH} characters")
+        re.compile(pattern, re.IGNORECASE)
+
+        with self._lock:
+            for attempt in range(2):
+                if self._process is None or not self._process.is_alive():
+                    self._start()
+                try:
+                    if self._loaded != key:
+                        # Start-up and haystack transfer are not charged to the pattern.
+                        self._call("load", haystack.tolist(), START_TIMEOUT)
+                        self._loaded = key
+                    positions = self._call("search", pattern, self.timeout)
+                    break
+                except (EOFError, OSError):
+                    # The worker died (e.g. killed by the OS); retry once with a fresh one.
+                    self._kill()
+                    if attempt:
+                        raise
+        return haystack.iloc[positions]
+
+
+@st.cache_resource(show_spinner=False)
+def get_pattern_searcher():
+    """One pattern worker per server process, shared by every session."""
+    return PatternSearcher()
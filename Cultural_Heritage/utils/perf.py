@@ -0,0 +1,202 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import ContextDecorator
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+MAX_SAMPLES = 500           # per (page, stage); older samples roll off
+RERUN = "rerun"             # stage name of a whole page run
+LOG_ENV = "PERF_LOG"        # set to a file path to also append every sample there as a JSON line
+
+
+class PerfStore:
+    """
+    Rolling in-process store of timing samples, keyed by (page, stage). Each sample holds
+    wall time, peak traced memory (when memory tracking is on) and HTML payload bytes.
+    """
+
+    def __init__(self, max_samples=MAX_SAMPLES, log_path=None):
+        self.max_samples = max_samples
+        self.log_path = log_path
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, page, stage, wall_ms, peak_bytes=None, payload_bytes=0):
+        sample = {
+            "at": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "page": page,
+            "stage": stage,
+            "wall_ms": round(wall_ms, 3),
+            "peak_bytes": peak_bytes,
+            "payload_bytes": payload_bytes,
+        }
+        with self._lock:
+            key = (page, stage)
+            if key not in self._samples:
+                self._samples[key] = deque(maxlen=self.max_samples)
+            self._samples[key].append(sample)
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(sample) + "\n")
+
+    def samples(self):
+        """Every retained sample, oldest first per stage."""
+        with self._lock:
+            return [s for samples in self._samples.values() for s in samples]
+
+    def summary(self):
+        """Per (page, stage): sample count, wall time percentiles, p90 peak memory and median payload."""
+        with self._lock:
+            groups = {key: list(samples) for key, samples in self._samples.items()}
+        rows = []
+        for (page, stage), samples in sorted(groups.items()):
+            wall = np.array([s["wall_ms"] for s in samples])
+            peaks = [s["peak_bytes"] for s in samples if s["peak_bytes"] is not None]
+            rows.append({
+                "Page": page,
+                "Stage": stage,
+                "Samples": len(samples),
+                "p50 ms": round(float(np.percentile(wall, 50)), 2),
+                "p90 ms": round(float(np.percentile(wall, 90)), 2),
+                "p99 ms": round(float(np.percentile(wall, 99)), 2),
+                "Max ms": round(float(wall.max()), 2),
+                "p90 peak KB": round(float(np.percentile(peaks, 90)) / 1024, 1) if peaks else None,
+                "p50 payload KB": round(float(np.median([s["payload_bytes"] for s in samples])) / 1024, 1),
+            })
+        return pd.DataFrame(rows, columns=["Page", "Stage", "Samples", "p50 ms", "p90 ms", "p99 ms", "Max ms",
+                                           "p90 peak KB", "p50 payload KB"])
+
+    def to_jsonl(self):
+        return "".join(json.dumps(s) + "\n" for s in self.samples())
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+
+perf_store = PerfStore(log_path=os.environ.get(LOG_ENV))
+
+# Per script thread: the page being run and the stack of open stages.
+_local = threading.local()
+
+
+class _Frame:
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.payload = 0
+        self.base = None
+        self.peak = 0
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _open(name):
+    stack, frame = _stack(), _Frame(name)
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        # The enclosing stage keeps the peak seen so far; this stage measures from here.
+        if stack and stack[-1].base is not None:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+        frame.base = frame.peak = current
+    stack.append(frame)
+    return frame
+
+
+def _close(frame):
+    stack = _stack()
+    while stack and stack.pop() is not frame:
+        pass        # stages left open by an exception unwinding past them
+    wall_ms = (time.perf_counter() - frame.start) * 1000
+    peak_bytes = None
+    if frame.base is not None and tracemalloc.is_tracing():
+        frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+        peak_bytes = frame.peak - frame.base
+    if stack:
+        stack[-1].payload += frame.payload
+        if stack[-1].base is not None:
+            stack[-1].peak = max(stack[-1].peak, frame.peak)
+    return wall_ms, peak_bytes
+
+
+class Stage(ContextDecorator):
+    """A named stage of the current page run, usable as a context manager or decorator."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        _open(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        frame = next((f for f in reversed(_stack()) if f.name == self.name), None)
+        if frame is not None:
+            wall_ms, peak_bytes = _close(frame)
+            perf_store.record(getattr(_local, "page", None) or "-", self.name, wall_ms, peak_bytes, frame.payload)
+        return False
+
+
+def stage(name):
+    """
+    Time a block or function as a named stage of the current page run:
+
+        with stage("search"): ...
+
+        @stage("load images")
+        def load_images(): ...
+
+    Nested stages are recorded separately; a stage's time includes its children.
+    """
+    return Stage(name)
+
+
+def payload(data):
+    """Count data (HTML/markdown sent to the browser) against the open stage and run; returns it unchanged."""
+    stack = _stack()
+    if stack:
+        stack[-1].payload += len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+    return data
+
+
+def begin_run(page):
+    """Start timing a page rerun. A run left open by st.stop() or a rerun is discarded."""
+    _local.page = page
+    _local.stack = []
+    _open(RERUN)
+
+
+def end_run():
+    """Record the current page run as its "rerun" stage."""
+    stack = _stack()
+    if stack and stack[0].name == RERUN:
+        frame = stack[0]
+        wall_ms, peak_bytes = _close(frame)
+        perf_store.record(_local.page, RERUN, wall_ms, peak_bytes, frame.payload)
+    _local.page = None
+
+
+def set_memory_tracking(enabled):
+    """
+    Turn per-stage peak memory on or off. Uses tracemalloc, which slows allocation-heavy
+    code and is process-wide, so peaks overlap when several sessions run at once.
+    """
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def memory_tracking():
+    return tracemalloc.is_tracing()
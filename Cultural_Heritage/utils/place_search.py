@@ -0,0 +1,46 @@
+from utils import gazetteer
+from utils.perf import stage
+
+
+class SearchEngine:
+    """Text, state, facet and distance filters over the shared places catalog."""
+
+    def __init__(self, catalog, geo=None):
+        # Frame, haystack and facets come from the shared read-only catalog.
+        self.df = catalog.places
+        self.haystack = catalog.haystack(["Name", "City", "State"])
+        self.states = catalog.states
+        self.facet_options = catalog.facet_options
+        self.facet_ranges = catalog.facet_ranges
+        self.geo = geo
+
+    def search(self, query, state, searcher=None):
+        filtered_df = self.df
+
+        if not query.strip() and state != "All States":
+            filtered_df = filtered_df[filtered_df['State'] == state]
+
+        if query.strip():
+            if searcher is not None:
+                matches = searcher.matches(query)
+            else:
+                matches = self.haystack[self.haystack.str.contains(query.strip().lower(), regex=False)]
+            filtered_df = filtered_df.loc[matches.index]
+
+        return filtered_df
+
+    def dynamic_filter(self, df, filters):
+        for col, value in filters.items():
+            if isinstance(value, list) and value:
+                df = df[df[col].isin(value)]
+            elif isinstance(value, tuple) and len(value) == 2:
+                df = df[df[col].between(value[0], value[1])]
+        return df
+
+    @stage("near me")
+    def near(self, df, city, km):
+        """Rows of df within km of a gazetteer city ("City, State"), nearest first, with distance and airport."""
+        lat, lon, _ = gazetteer.locate(*city.rsplit(", ", 1))
+        distances = self.geo.within(lat, lon, km)
+        distances = distances[distances.index.isin(df.index)]
+        return df.loc[distances.index].assign(Distance_Km=distances.round(1)).join(self.geo.nearest_airports)
@@ -0,0 +1,165 @@
+import re
+import threading
+from collections import Counter, deque
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import data_loaders
+from utils.catalog import get_catalog
+from utils.data_backend import normalize_key
+
+RECENT_REVIEWS = 3
+RATING_BIN_WIDTH = 20      # feedback ratings are 1-100, binned 1-20, 21-40, ...
+RATING_BINS = 5
+TOP_KEYWORDS = 5
+
+TOKEN = re.compile(r"[a-z']+")
+
+# Small offline lexicon; a negator flips the word that follows it.
+POSITIVE = {
+    "amazing", "awesome", "beautiful", "best", "breathtaking", "calm", "clean", "enjoyed", "excellent",
+    "fantastic", "friendly", "good", "great", "historic", "impressive", "love", "loved", "lovely", "magnificent",
+    "must", "nice", "peaceful", "perfect", "pleasant", "recommend", "serene", "spectacular", "stunning",
+    "wonderful", "worth",
+}
+NEGATIVE = {
+    "awful", "bad", "boring", "crowded", "dirty", "disappointing", "expensive", "filthy", "horrible", "long",
+    "messy", "noisy", "overpriced", "overrated", "poor", "rude", "scam", "smelly", "terrible", "unsafe",
+    "waste", "worst",
+}
+NEGATORS = {"not", "no", "never", "don't", "didn't", "isn't", "wasn't"}
+STOPWORDS = {
+    "a", "about", "all", "an", "and", "are", "as", "at", "be", "but", "by", "can", "for", "from", "had", "has",
+    "have", "here", "i", "in", "is", "it", "it's", "its", "just", "me", "my", "of", "on", "one", "or", "our",
+    "place", "so", "that", "the", "there", "this", "to", "very", "visit", "was", "we", "were", "with", "you",
+} | NEGATORS
+
+
+def tokenize(text):
+    return TOKEN.findall(str(text).lower())
+
+
+def sentiment(tokens):
+    """Lexicon score in [-1, 1]: (positive - negative) / matched words, 0 when nothing matched."""
+    pos = neg = 0
+    negate = False
+    for token in tokens:
+        if token in NEGATORS:
+            negate = True
+            continue
+        if token in POSITIVE or token in NEGATIVE:
+            if (token in POSITIVE) != negate:
+                pos += 1
+            else:
+                neg += 1
+        negate = False
+    return (pos - neg) / (pos + neg) if pos + neg else 0.0
+
+
+def normalize_location(text):
+    return " ".join(tokenize(text))
+
+
+class PlaceReviews:
+    """Running review stats for one place."""
+
+    def __init__(self):
+        self.count = 0
+        self.rating_sum = 0
+        self.histogram = np.zeros(RATING_BINS, dtype=np.int64)
+        self.sentiment_sum = 0.0
+        self.keywords = Counter()
+        self.recent = deque(maxlen=RECENT_REVIEWS)
+
+    def add(self, rating, title, review):
+        tokens = tokenize(f"{title} {review}")
+        if rating is not None:
+            self.rating_sum += rating
+            self.histogram[min(max((rating - 1) // RATING_BIN_WIDTH, 0), RATING_BINS - 1)] += 1
+        self.count += 1
+        self.sentiment_sum += sentiment(tokens)
+        self.keywords.update(t for t in tokens if t not in STOPWORDS and len(t) > 2)
+        self.recent.append({"rating": rating, "title": title, "review": review})
+
+    @property
+    def mean_rating(self):
+        rated = int(self.histogram.sum())
+        return self.rating_sum / rated if rated else None
+
+    @property
+    def mean_sentiment(self):
+        return self.sentiment_sum / self.count if self.count else 0.0
+
+    def top_keywords(self, n=TOP_KEYWORDS):
+        return [word for word, _ in self.keywords.most_common(n)]
+
+
+class ReviewIndex:
+    """
+    Feedback aggregated per place. Locations are normalized and matched to place keys
+    (normalized Name + State); update() fetches only the feedback appended after the
+    last seq it folded in, so it never depends on the order rows are returned in.
+    """
+
+    def __init__(self, places_df):
+        # Location text -> place key, from "name" and "name city"/"name state" spellings.
+        self.aliases = {}
+        for name, city, state in places_df[["Name", "City", "State"]].itertuples(index=False):
+            key = tuple(normalize_key("places", [name, state]))
+            for alias in (name, f"{name} {city}", f"{name} {state}"):
+                self.aliases.setdefault(normalize_location(alias), key)
+        self._reset()
+        self._lock = threading.Lock()
+
+    def _reset(self):
+        self.places = {}
+        self.unmatched = 0
+        self.seen = 0
+        self.seq = 0
+
+    def match(self, location):
+        """Place key for a feedback Location, trying the full text and then the part before a comma."""
+        text = str(location or "")
+        for candidate in (text, text.split(",")[0]):
+            key = self.aliases.get(normalize_location(candidate))
+            if key is not None:
+                return key
+        return None
+
+    def update(self):
+        """Fold in feedback appended since the last call (starting over if the log was replaced)."""
+        with self._lock:
+            seq, new = data_loaders.feedback_since(self.seq)
+            if new is None:
+                self._reset()
+                seq, new = data_loaders.feedback_since(0)
+            ratings = pd.to_numeric(new["Rating"], errors="coerce")
+            for location, rating, title, review in zip(new["Location"], ratings, new["Title"], new["Reviews"]):
+                key = self.match(location)
+                if key is None:
+                    self.unmatched += 1
+                    continue
+                rating = None if pd.isna(rating) else int(rating)
+                title = "" if pd.isna(title) else str(title)
+                review = "" if pd.isna(review) else str(review)
+                self.places.setdefault(key, PlaceReviews()).add(rating, title, review)
+            self.seen += len(new)
+            self.seq = seq
+        return self
+
+    def summary(self, name, state):
+        return self.places.get(tuple(normalize_key("places", [name, state])))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_review_index(generation, _catalog):
+    # Keyed by generation only; _catalog is that generation, so the index matches its places.
+    return ReviewIndex(_catalog.places)
+
+
+def get_review_index():
+    """The shared review index for the current catalog, brought up to date with the feedback log."""
+    catalog = get_catalog()
+    return build_review_index(catalog.generation, catalog).update()
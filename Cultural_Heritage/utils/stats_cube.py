@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils import data_loaders
+
+
+class StatsCube:
+    """
+    Tourist counts as a dense Year x Type x State array with categorical index maps,
+    plus the rollups the trends page needs. Built once per stats version.
+    """
+
+    def __init__(self, df):
+        self.years = sorted(int(y) for y in df["Year"].unique())
+        self.types = sorted(df["Type"].unique())
+        self.states = sorted(df["State"].unique())
+        self.year_index = {y: i for i, y in enumerate(self.years)}
+        self.type_index = {t: i for i, t in enumerate(self.types)}
+        self.state_index = {s: i for i, s in enumerate(self.states)}
+
+        yi = df["Year"].astype(int).map(self.year_index).to_numpy()
+        ti = df["Type"].map(self.type_index).to_numpy()
+        si = df["State"].map(self.state_index).to_numpy()
+        counts = df["Tourist_Count"].fillna(0).to_numpy(dtype=np.int64)
+
+        shape = (len(self.years), len(self.types), len(self.states))
+        self.values = np.zeros(shape, dtype=np.int64)
+        self.present = np.zeros(shape, dtype=bool)
+        np.add.at(self.values, (yi, ti, si), counts)
+        self.present[yi, ti, si] = True
+
+        # Rollups
+        self.state_totals = self.values.sum(axis=0)                     # Type x State
+        self.year_totals = self.values.sum(axis=2)                      # Year x Type
+        # States ordered by count (desc) within each Year/Type; absent states sort last.
+        ranked = np.where(self.present, self.values, -1)
+        self.order = np.argsort(-ranked, axis=2, kind="stable")         # Year x Type x rank -> state
+        self.rank = np.empty_like(self.order)                           # Year x Type x State -> rank (1-based)
+        np.put_along_axis(self.rank, self.order, np.arange(1, len(self.states) + 1)[None, None, :], axis=2)
+
+    # ---------- SLICES ----------
+    def year_frame(self, year, visitor_type, top_n=None):
+        """States for one Year/Type sorted by Tourist_Count, as a small frame for charts."""
+        y, t = self.year_index[int(year)], self.type_index[visitor_type]
+        order = self.order[y, t][self.present[y, t][self.order[y, t]]]
+        if top_n is not None:
+            order = order[:top_n]
+        return pd.DataFrame({
+            "State": np.asarray(self.states, dtype=object)[order],
+            "Tourist_Count": self.values[y, t, order],
+            "Rank": self.rank[y, t, order],
+        })
+
+    def national_total(self, year, visitor_type):
+        return int(self.year_totals[self.year_index[int(year)], self.type_index[visitor_type]])
+
+    def state_series(self, state, visitor_type):
+        """(years, counts) for one State/Type, limited to years with data."""
+        t, s = self.type_index[visitor_type], self.state_index[state]
+        mask = self.present[:, t, s]
+        return np.asarray(self.years)[mask], self.values[mask, t, s]
+
+    def totals_frame(self, visitor_type):
+        """All-years total per state for one Type, sorted descending."""
+        totals = self.state_totals[self.type_index[visitor_type]]
+        order = np.argsort(-totals, kind="stable")
+        return pd.DataFrame({"State": np.asarray(self.states, dtype=object)[order], "Tourist_Count": totals[order]})
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def build_stats_cube(version):
+    return StatsCube(data_loaders.load_tourist_stats())
+
+
+def get_stats_cube():
+    """Shared cube for the current tourist_stats version."""
+    return build_stats_cube(data_loaders.dataset_version("tourist_stats"))
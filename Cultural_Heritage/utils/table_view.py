@@ -0,0 +1,103 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+class TableView:
+    """
+    Paginated, sortable and filterable window over a shared frame. Sorting and filtering
+    work on positional index arrays, so only the visible page is ever copied or styled.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._orders = {}
+        self.ranges = {}
+        self.options = {}
+        for col in df.columns:
+            if pd.api.types.is_numeric_dtype(df[col]):
+                self.ranges[col] = (df[col].min(), df[col].max())
+            if not pd.api.types.is_float_dtype(df[col]):
+                self.options[col] = sorted(df[col].dropna().unique().tolist())
+
+    def order(self, sort_by=None, ascending=True):
+        """Row positions in sort order (missing values last); computed once per column and direction."""
+        if sort_by is None:
+            return np.arange(len(self.df))
+        key = (sort_by, ascending)
+        if key not in self._orders:
+            labels = self.df[sort_by].sort_values(ascending=ascending, kind="stable", na_position="last").index
+            self._orders[key] = self.df.index.get_indexer(labels)
+        return self._orders[key]
+
+    def restrict(self, positions, subset):
+        """positions (e.g. a sort order) limited to the row labels in subset, keeping their order."""
+        return positions[np.isin(positions, self.df.index.get_indexer(subset))]
+
+    def query(self, filters=None, sort_by=None, ascending=True):
+        """Positions of rows matching filters ({column: value or list of values}), sorted."""
+        positions = self.order(sort_by, ascending)
+        mask = None
+        for col, value in (filters or {}).items():
+            if value is None or (isinstance(value, (list, tuple, set)) and not value):
+                continue
+            values = self.df[col].to_numpy()
+            col_mask = np.isin(values, list(value)) if isinstance(value, (list, tuple, set)) else values == value
+            mask = col_mask if mask is None else mask & col_mask
+        return positions if mask is None else positions[mask[positions]]
+
+    def page(self, positions, page, page_size):
+        """The rows of one page (1-based); the index is the 1-based row number in the result."""
+        start = (page - 1) * page_size
+        window = self.df.iloc[positions[start:start + page_size]]
+        return window.set_axis(pd.RangeIndex(start + 1, start + 1 + len(window)))
+
+    def style(self, page_df, gradient=None, cmap="Blues", formats=None):
+        """Style a page, scaling gradients to the full table's precomputed min/max."""
+        styler = page_df.style
+        for col in gradient or []:
+            vmin, vmax = self.ranges[col]
+            styler = styler.background_gradient(cmap=cmap, subset=[col], vmin=vmin, vmax=vmax)
+        if formats:
+            styler = styler.format(formats)
+        return styler
+
+
+def render_table_view(view, key, filter_columns=(), gradient=None, formats=None):
+    """Filter, sort and pagination controls plus the current page of a TableView."""
+    filters = {}
+    if filter_columns:
+        filter_cols = st.columns(len(filter_columns))
+        for col, container in zip(filter_columns, filter_cols):
+            filters[col] = container.multiselect(f"Filter {col}", view.options.get(col, []), key=f"{key}_filter_{col}")
+
+    sort_col, dir_col, size_col = st.columns([2, 1, 1])
+    sort_by = sort_col.selectbox("Sort by", ["(none)"] + list(view.df.columns), key=f"{key}_sort")
+    ascending = dir_col.radio("Order", ["Ascending", "Descending"], horizontal=True, key=f"{key}_dir") == "Ascending"
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, key=f"{key}_size")
+
+    positions = view.query(filters, None if sort_by == "(none)" else sort_by, ascending)
+    page = page_control(len(positions), page_size, key)
+    page_df = view.page(positions, page, page_size)
+
+    if gradient or formats:
+        st.dataframe(view.style(page_df, gradient, formats=formats), use_container_width=True)
+    else:
+        st.dataframe(page_df, use_container_width=True)
+    st.caption(page_caption(len(positions), page, page_size, "rows"))
+
+
+def page_control(total, page_size, key):
+    """Page number input for total rows; returns a page clamped to the valid range."""
+    pages = max(1, math.ceil(total / page_size))
+    # No max_value: a stale page number from a wider filter would otherwise raise; clamp instead.
+    return min(int(st.number_input(f"Page (of {pages})", min_value=1, value=1, step=1, key=f"{key}_page")), pages)
+
+
+def page_caption(total, page, page_size, noun):
+    start = (page - 1) * page_size
+    return f"Showing {start + 1 if total else 0}–{min(start + page_size, total)} of {total:,} {noun}"
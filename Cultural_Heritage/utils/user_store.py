@@ -0,0 +1,109 @@
+import hashlib
+import hmac
+import os
+import sqlite3
+import threading
+
+USER_DB_PATH = "data/users.db"
+HASH_ITERATIONS = 200_000
+
+
+# ---------- PASSWORD HASHING ----------
+def hash_password(pwd, salt=None, iterations=HASH_ITERATIONS):
+    """Return (salt, digest) for a password using salted PBKDF2-SHA256."""
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", str(pwd).encode(), salt, iterations)
+    return salt, digest
+
+
+def normalize_email(email):
+    return str(email).strip()
+
+
+# ---------- USER STORE ----------
+class UserStore:
+    """SQLite-backed credential store with a unique, case-insensitive email index."""
+
+    def __init__(self, path=USER_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY,
+                    email TEXT NOT NULL,
+                    salt BLOB NOT NULL,
+                    pwd_hash BLOB NOT NULL,
+                    iterations INTEGER NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users(email COLLATE NOCASE)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _conn(self):
+        # sqlite3 connections are bound to their thread; Streamlit runs each session on its own thread.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def exists(self, email):
+        row = self._conn().execute(
+            "SELECT 1 FROM users WHERE email = ? COLLATE NOCASE", (normalize_email(email),)
+        ).fetchone()
+        return row is not None
+
+    def add_user(self, email, pwd):
+        """Insert a new user; returns False if the email is already registered."""
+        salt, digest = hash_password(pwd)
+        try:
+            with self._conn() as conn:
+                conn.execute(
+                    "INSERT INTO users (email, salt, pwd_hash, iterations) VALUES (?, ?, ?, ?)",
+                    (normalize_email(email), salt, digest, HASH_ITERATIONS)
+                )
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def verify(self, email, pwd):
+        row = self._conn().execute(
+            "SELECT salt, pwd_hash, iterations FROM users WHERE email = ? COLLATE NOCASE",
+            (normalize_email(email),)
+        ).fetchone()
+        if row is None:
+            return False
+        salt, expected, iterations = row
+        _, digest = hash_password(pwd, salt, iterations)
+        return hmac.compare_digest(digest, expected)
+
+    def import_legacy(self, login_df):
+        """
+        One-time migration of the plaintext login table into hashed rows. Passwords are hashed
+        first; the flag check, inserts and flag are then one write transaction, so concurrent
+        sessions on a fresh database import once and the others return 0.
+        """
+        rows = []
+        if login_df is not None and not login_df.empty:
+            for email, pwd in login_df[["Email", "Password"]].dropna().itertuples(index=False):
+                salt, digest = hash_password(pwd)
+                rows.append((normalize_email(email), salt, digest, HASH_ITERATIONS))
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+                return 0
+            imported = 0
+            for row in rows:
+                cur = conn.execute(
+                    "INSERT OR IGNORE INTO users (email, salt, pwd_hash, iterations) VALUES (?, ?, ?, ?)", row
+                )
+                imported += cur.rowcount
+            conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_imported', ?)", (str(imported),))
+        return imported
+
+    def legacy_imported(self):
+        return self._conn().execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone() is not None